@@ -0,0 +1,82 @@
+"""Benchmark of dumping the editor repeatedly, with few objects changed between dumps.
+
+Simulates a generator that validates the level after each edit step: each step moves
+some objects and dumps the whole level, first serializing all objects every time,
+as the editor used to, then with strings of objects cached.
+
+Usage: python benchmarks/dump.py [objects] [steps] [changed]
+"""
+
+import random
+import sys
+import time
+
+from gd.api import Editor, Object
+from gd.api.parser import _object_to_string
+
+LEVEL_HEIGHT = 3000
+
+
+def generate(amount: int) -> Editor:
+    random.seed(amount)
+
+    objects = (
+        Object(
+            id=1,
+            x=random.randrange(0, amount, 15),
+            y=random.randrange(0, LEVEL_HEIGHT, 15),
+            groups={random.randint(1, 100)},
+        )
+        for _ in range(amount)
+    )
+
+    return Editor.from_string(Editor(*objects).dump())
+
+
+def dump_uncached(editor: Editor) -> str:
+    return ";".join([editor.header.dump(), *map(_object_to_string, editor.map(_get_data)), ""])
+
+
+def dump_cached(editor: Editor) -> str:
+    return editor.dump(cached=True)
+
+
+def _get_data(obj: Object) -> dict:
+    return obj.data
+
+
+def run(editor: Editor, dump, steps: int, changed: int) -> float:
+    random.seed(steps)
+
+    start = time.perf_counter()
+
+    for _ in range(steps):
+        for obj in random.sample(editor.objects, changed):
+            obj.move(x=15)
+
+        dump(editor)
+
+    return (time.perf_counter() - start) / steps
+
+
+def main(amount: int = 200_000, steps: int = 10, changed: int = 100) -> None:
+    uncached = run(generate(amount), dump_uncached, steps, changed)
+
+    editor = generate(amount)
+
+    start = time.perf_counter()
+    editor.dump(cached=True)
+    first = time.perf_counter() - start
+
+    cached = run(editor, dump_cached, steps, changed)
+
+    assert editor.dump() == dump_uncached(editor)
+
+    print(
+        f"dumping {amount} objects with {changed} changed: {uncached:.3f}s serializing all, "
+        f"{cached:.3f}s cached ({uncached / cached:.1f}x faster), first dump {first:.3f}s"
+    )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,85 @@
+"""Benchmark of the columnar editor against the regular one.
+
+Measures memory taken by parsed objects, and time of parsing, common queries and dumping.
+By default a level with lots of generated objects is used; level data can be given instead.
+
+Usage: python benchmarks/editor_columnar.py [objects | path_to_level_data]
+"""
+
+from pathlib import Path
+import random
+import sys
+import time
+import tracemalloc
+
+from gd.api import ColumnarEditor, Editor, Object
+
+MB = 1024 * 1024
+
+
+def generate(amount: int) -> str:
+    random.seed(amount)
+
+    objects = []
+
+    for index in range(amount):
+        obj = Object(
+            id=random.randint(1, 1900),
+            x=round(random.uniform(0, amount), 2),
+            y=random.randrange(0, 3000, 15),
+            rotation=random.choice((0, 0, 90, 180, 45.5)),
+        )
+
+        if index % 3 == 0:
+            obj.groups = set(random.sample(range(1, 1000), random.randint(1, 3)))
+
+        if index % 4 == 0:
+            obj.color_1 = random.randint(1, 999)
+            obj.z_layer = 5
+
+        if index % 10 == 0:
+            obj.data["155"] = "1"
+
+        objects.append(obj)
+
+    return Editor(*objects).dump()
+
+
+def measure_memory(cls, data: str):
+    tracemalloc.start()
+    editor = cls.from_string(data)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return editor, size
+
+
+def measure(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main(source: str = "200000") -> None:
+    if source.isdigit():
+        data = generate(int(source))
+    else:
+        data = Path(source).read_text()
+
+    for cls in (Editor, ColumnarEditor):
+        editor, size = measure_memory(cls, data)
+
+        times = {
+            "parse": measure(cls.from_string, data),
+            "get_groups": measure(editor.get_groups),
+            "get_color_ids": measure(editor.get_color_ids),
+            "get_x_length": measure(editor.get_x_length),
+            "dump": measure(editor.dump),
+        }
+
+        timing = ", ".join(f"{name} {value:.3f}s" for name, value in times.items())
+
+        print(f"{cls.__name__:>14}: {len(editor)} objects, {size / MB:7.1f} MB; {timing}")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
@@ -0,0 +1,57 @@
+"""Benchmark of the HTTPClient connection pool against the local fake GD server.
+
+Compares sending requests through one pooled session (what HTTPClient does now)
+to opening a new session for every single request (what it used to do).
+
+Usage: python benchmarks/http_session.py [requests] [concurrency]
+"""
+
+import asyncio
+import sys
+import time
+
+import gd
+
+from gd.utils.fake_server import FakeServer
+
+PAYLOAD = {"str": "1", "type": "0"}
+
+
+async def fetch_pooled(http: gd.HTTPClient) -> None:
+    await http.request(gd.Route.LEVEL_SEARCH, PAYLOAD)
+
+
+async def fetch_fresh(http: gd.HTTPClient) -> None:
+    # emulate one ClientSession per request
+    async with gd.HTTPClient(url=http.url) as fresh:
+        await fresh.request(gd.Route.LEVEL_SEARCH, PAYLOAD)
+
+
+async def measure(fetch, http: gd.HTTPClient, amount: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited() -> None:
+        async with semaphore:
+            await fetch(http)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(limited() for _ in range(amount)))
+    end = time.perf_counter()
+
+    return amount / (end - start)
+
+
+async def main(amount: int = 2000, concurrency: int = 50) -> None:
+    async with FakeServer() as server:
+        # identical requests would be coalesced, so disable that to measure the pool itself
+        async with gd.HTTPClient(url=server.url, single_flight=False) as http:
+            for name, fetch in (
+                ("session per request", fetch_fresh),
+                ("pooled session", fetch_pooled),
+            ):
+                rate = await measure(fetch, http, amount, concurrency)
+                print(f"{name:>20}: {rate:,.0f} requests/sec")
+
+
+if __name__ == "__main__":
+    asyncio.get_event_loop().run_until_complete(main(*map(int, sys.argv[1:])))
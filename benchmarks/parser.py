@@ -0,0 +1,127 @@
+"""Micro-benchmark of parsing and dumping objects, in objects per second.
+
+Compares table-driven parsing with compiled codecs (what gd.api.parser does now)
+to testing every key against every set of keys in sequence (what it used to do).
+Minimal rates can be given, in which case the benchmark fails if they are not reached,
+so it can be used to catch regressions.
+
+Usage: python benchmarks/parser.py [objects] [min_parse_rate] [min_dump_rate]
+"""
+
+from itertools import chain
+import random
+import sys
+import time
+
+from enums import Enum
+
+from gd.api import parser
+from gd.api.hsv import HSV
+from gd.api.struct import Object
+
+
+def legacy_from_str(key: str, value: str):
+    if key in parser._INT:
+        return int(value)
+    if key in parser._BOOL:
+        return parser._bool(value)
+    if key in parser._FLOAT:
+        return parser._maybefloat(value)
+    if key == parser._GROUPS:
+        return parser._ints_from_str(value)
+    if key in parser._HSV:
+        return HSV.from_string(value)
+    if key in parser._ENUMS:
+        return parser._ENUMS[key](int(value))
+    if key == parser._TEXT:
+        return parser._b64_failsafe(value, encode=False)
+    return value
+
+
+def legacy_convert_type(some_object):
+    some_type = some_object.__class__
+    if some_type in parser._MAPPING:
+        return parser._MAPPING[some_type](some_object)
+    elif Enum in some_type.__mro__:
+        return some_object.value
+    return some_object
+
+
+def legacy_parse(string: str):
+    return parser._convert(string, ",", func=legacy_from_str)
+
+
+def legacy_dump(data) -> str:
+    return ",".join(
+        map(
+            str,
+            chain.from_iterable((key, legacy_convert_type(value)) for key, value in data.items()),
+        )
+    )
+
+
+def generate(amount: int):
+    random.seed(amount)
+
+    strings = []
+
+    for index in range(amount):
+        obj = Object(
+            id=random.randint(1, 1900),
+            x=round(random.uniform(0, amount), 2),
+            y=random.randrange(0, 3000, 15),
+            rotation=random.choice((0, 90, 45.5)),
+        )
+
+        if index % 3 == 0:
+            obj.groups = set(random.sample(range(1, 1000), 2))
+
+        if index % 4 == 0:
+            obj.edit(color_1=random.randint(1, 999), z_layer=5, z_order=2, editor_layer=1)
+
+        if index % 50 == 0:
+            obj.edit(
+                id=901, move_x=30, duration=0.5, easing=2, target_group=7, touch_triggered=True
+            )
+
+        strings.append(obj.dump())
+
+    return strings
+
+
+def rate(func, items, repeat: int = 5) -> float:
+    best = float("inf")
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+
+        for item in items:
+            func(item)
+
+        best = min(best, time.perf_counter() - start)
+
+    return len(items) / best
+
+
+def main(amount: int = 200_000, min_parse: float = 0, min_dump: float = 0) -> int:
+    strings = generate(int(amount))
+    mappings = list(map(parser._object_convert, strings))
+
+    assert mappings == list(map(legacy_parse, strings))
+    assert list(map(parser._object_to_string, mappings)) == list(map(legacy_dump, mappings))
+
+    parse_rate = rate(parser._object_convert, strings)
+    dump_rate = rate(parser._object_to_string, mappings)
+
+    print(f"parse: {parse_rate:12,.0f} objects/sec, before: {rate(legacy_parse, strings):12,.0f}")
+    print(f" dump: {dump_rate:12,.0f} objects/sec, before: {rate(legacy_dump, mappings):12,.0f}")
+
+    if parse_rate < min_parse or dump_rate < min_dump:
+        print("regression: rates are lower than required")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*map(float, sys.argv[1:])))
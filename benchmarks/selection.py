@@ -0,0 +1,111 @@
+"""Benchmark of bulk selection operations of the editor, against per-object loops.
+
+Transforms all objects of a level with lots of generated objects, first object by object
+through their properties, then with selections of the editor and of the columnar editor.
+
+Usage: python benchmarks/selection.py [objects]
+"""
+
+from math import cos, radians, sin
+import random
+import sys
+import time
+
+from gd.api import ColumnarEditor, Editor, Object
+
+LEVEL_HEIGHT = 3000
+PIVOT = (0, 0)
+
+
+def generate(amount: int) -> Editor:
+    random.seed(amount)
+
+    return Editor(
+        *(
+            Object(
+                id=1,
+                x=random.randrange(0, amount, 15),
+                y=random.randrange(0, LEVEL_HEIGHT, 15),
+                groups={random.randint(1, 100)},
+                color_1=random.randint(1, 10),
+            )
+            for _ in range(amount)
+        )
+    )
+
+
+def translate(editor: Editor) -> None:
+    for obj in editor.objects:
+        obj.move(30, 15)
+
+
+def rotate(editor: Editor, angle: float = 90) -> None:
+    angle_cos, angle_sin = round(cos(radians(angle)), 6), round(sin(radians(angle)), 6)
+    pivot_x, pivot_y = PIVOT
+
+    for obj in editor.objects:
+        dx, dy = obj.x - pivot_x, obj.y - pivot_y
+        obj.set_pos(
+            pivot_x + dx * angle_cos + dy * angle_sin, pivot_y - dx * angle_sin + dy * angle_cos
+        )
+        obj.rotation = (obj.rotation or 0) + angle
+
+
+def scale(editor: Editor, factor: float = 2) -> None:
+    pivot_x, pivot_y = PIVOT
+
+    for obj in editor.objects:
+        obj.set_pos(pivot_x + (obj.x - pivot_x) * factor, pivot_y + (obj.y - pivot_y) * factor)
+        obj.scale = (obj.scale or 1) * factor
+
+
+COLORS = {color_id: color_id + 1 for color_id in range(1, 11)}
+GROUPS = {group: group + 1 for group in range(1, 101)}
+
+
+def recolor(editor: Editor) -> None:
+    for obj in editor.objects:
+        obj.color_1 = COLORS.get(obj.color_1, obj.color_1)
+
+
+def regroup(editor: Editor) -> None:
+    for obj in editor.objects:
+        obj.groups = {GROUPS.get(group, group) for group in obj.groups} | {500}
+
+
+CASES = (
+    ("translate", translate, lambda selection: selection.translate(30, 15)),
+    ("rotate", rotate, lambda selection: selection.rotate(90, PIVOT)),
+    ("scale", scale, lambda selection: selection.scale(2, PIVOT)),
+    ("recolor", recolor, lambda selection: selection.recolor(COLORS)),
+    ("regroup", regroup, lambda selection: selection.regroup(GROUPS, add=[500])),
+)
+
+
+def measure(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main(amount: int = 200_000) -> None:
+    editor = generate(amount)
+    data = editor.dump()
+
+    loop_editor = Editor.from_string(data)
+    columnar = ColumnarEditor.from_string(data)
+
+    for name, loop, bulk in CASES:
+        loop_time = measure(loop, loop_editor)
+        bulk_time = measure(bulk, editor.select())
+        columnar_time = measure(bulk, columnar.select())
+
+        print(
+            f"{name:>10}: {loop_time / amount * 1e6:6.3f}us per object in a loop, "
+            f"{bulk_time / amount * 1e6:6.3f}us selected ({loop_time / bulk_time:4.1f}x), "
+            f"{columnar_time / amount * 1e6:6.3f}us columnar ({loop_time / columnar_time:4.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,81 @@
+"""Benchmark of spatial queries of the editor, with and without the spatial index.
+
+Runs rectangle, x range and nearest object queries on a level with lots of generated objects,
+first scanning all objects and then using the index; building and updating it is timed too.
+
+Usage: python benchmarks/spatial.py [objects] [queries]
+"""
+
+import random
+import sys
+import time
+
+from gd.api import Editor, Object
+
+LEVEL_HEIGHT = 3000
+SCREEN_WIDTH = 600
+
+
+def generate(amount: int) -> Editor:
+    random.seed(amount)
+
+    width = amount  # about one object per unit, which is fairly dense
+
+    return Editor(
+        *(
+            Object(id=1, x=random.uniform(0, width), y=random.randrange(0, LEVEL_HEIGHT, 15))
+            for _ in range(amount)
+        )
+    )
+
+
+def make_queries(editor: Editor, amount: int):
+    width = editor.get_x_length()
+
+    for _ in range(amount):
+        x, y = random.uniform(0, width), random.uniform(0, LEVEL_HEIGHT)
+        yield x, y, x + SCREEN_WIDTH, y + SCREEN_WIDTH / 2
+
+
+def measure(func, queries) -> float:
+    start = time.perf_counter()
+
+    for query in queries:
+        func(*query)
+
+    return (time.perf_counter() - start) / len(queries)
+
+
+def main(amount: int = 200_000, queries: int = 50) -> None:
+    editor = generate(amount)
+    rects = list(make_queries(editor, queries))
+
+    cases = (
+        ("objects_in_rect", lambda *rect: editor.objects_in_rect(*rect)),
+        ("objects_in_x_range", lambda x1, y1, x2, y2: editor.objects_in_x_range(x1, x2)),
+        ("get_nearest_objects", lambda x1, y1, x2, y2: editor.get_nearest_objects(x1, y1, 10)),
+    )
+
+    linear = {name: measure(func, rects) for name, func in cases}
+
+    start = time.perf_counter()
+    editor.enable_spatial_index()
+    print(f"index of {amount} objects built in {time.perf_counter() - start:.3f}s")
+
+    for name, func in cases:
+        indexed = measure(func, rects)
+        print(
+            f"{name:>20}: {linear[name] * 1000:9.3f}ms scanning, {indexed * 1000:7.3f}ms indexed, "
+            f"{linear[name] / indexed:7.1f}x faster"
+        )
+
+    start = time.perf_counter()
+
+    for obj in editor.objects:
+        obj.move(x=random.uniform(-100, 100))
+
+    print(f"moving all objects while indexed: {time.perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
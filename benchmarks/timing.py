@@ -0,0 +1,84 @@
+"""Benchmark of time-at-x queries, walking speed portals against the speed table.
+
+Computes times of lots of triggers in a level with generated speed portals,
+first walking portals for each trigger, as ``get_length_from_x`` used to,
+then with one :class:`gd.api.SpeedTable` of the level.
+
+Usage: python benchmarks/timing.py [portals] [triggers]
+"""
+
+import random
+import sys
+import time
+
+from gd.api import Editor, Object, PortalType
+from gd.api.timing import speed_map
+
+SPEED_PORTALS = [portal.value for portal in PortalType if "speed" in portal.name.lower()]
+
+
+def generate(portals: int, triggers: int) -> Editor:
+    random.seed(portals)
+
+    width = portals * 300
+
+    return Editor(
+        *(
+            Object(id=random.choice(SPEED_PORTALS), x=random.uniform(0, width), portal_checked=True)
+            for _ in range(portals)
+        ),
+        *(Object(id=901, x=random.uniform(0, width)) for _ in range(triggers)),
+    )
+
+
+def walk(dx: float, start_speed: float, portals) -> float:
+    speed = start_speed
+
+    last_x = 0
+    total = 0
+
+    for portal in portals:
+        x = portal.x
+
+        if dx <= x:
+            break
+
+        total += (x - last_x) / speed
+
+        speed = speed_map.get(portal.id, speed)
+
+        last_x = x
+
+    return (dx - last_x) / speed + total
+
+
+def main(portals: int = 2000, triggers: int = 10_000) -> None:
+    editor = generate(portals, triggers)
+    xs = [obj.x for obj in editor.objects if obj.id == 901]
+
+    start = time.perf_counter()
+    speed_portals = editor.get_speed_portals()
+    start_speed = speed_map[editor.get_speed().value]
+    walked = [walk(x, start_speed, speed_portals) for x in xs]
+    walk_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    table = editor.get_speed_table()
+    times = table.get_times(xs)
+    table_time = time.perf_counter() - start
+
+    assert times == walked
+
+    start = time.perf_counter()
+    table.get_xs(times)
+    inverse_time = time.perf_counter() - start
+
+    print(
+        f"times of {triggers} triggers with {portals} speed portals: "
+        f"{walk_time:.3f}s walking portals, {table_time:.3f}s with the table "
+        f"({walk_time / table_time:.1f}x faster), inverse in {inverse_time:.3f}s"
+    )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,69 @@
+"""Benchmark of XOR ciphering against the previous pure Python implementations.
+
+Compares Coder.byte_xor (single-byte key, as used for save files)
+and XORCipher.cipher_bytes (repeating multi-byte key) on inputs from 1 KB to 50 MB.
+Old implementations are slow, so they are only measured up to a limit.
+
+Usage: python benchmarks/xor.py [legacy_limit_in_bytes]
+"""
+
+from base64 import urlsafe_b64encode
+from itertools import cycle
+import os
+import sys
+import time
+
+from gd.utils.crypto.coders import Coder
+from gd.utils.crypto.xor_cipher import XORCipher
+
+KB = 1024
+MB = KB * KB
+
+SIZES = (KB, 64 * KB, MB, 10 * MB, 50 * MB)
+KEY = "26364"
+
+
+def legacy_byte_xor(stream: bytes, key: int) -> str:
+    return bytes(byte ^ key for byte in stream).decode(errors="ignore")
+
+
+def legacy_cipher_bytes(key: str, stream: bytes) -> str:
+    return ("").join(chr(x ^ ord(y)) for x, y in zip(stream, cycle(key)))
+
+
+def measure(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def format_size(size: int) -> str:
+    return f"{size // MB} MB" if size >= MB else f"{size // KB} KB"
+
+
+def main(legacy_limit: int = 10 * MB) -> None:
+    cases = (
+        ("byte_xor", lambda data: (data, 11), legacy_byte_xor, Coder.byte_xor),
+        ("cipher_bytes", lambda data: (KEY, data), legacy_cipher_bytes, XORCipher.cipher_bytes),
+    )
+
+    for size in SIZES:
+        # saves are base64, so use it as the input, which also keeps decoding cheap
+        data = urlsafe_b64encode(os.urandom(size // 4 * 3))
+
+        for name, make_args, legacy, fast in cases:
+            args = make_args(data)
+
+            fast_time = measure(fast, *args)
+
+            if size <= legacy_limit:
+                legacy_time = measure(legacy, *args)
+                compared = f"{legacy_time:8.4f}s before, {legacy_time / fast_time:7.1f}x faster"
+            else:
+                compared = "(old version skipped)"
+
+            print(f"{format_size(size):>6} {name:>12}: {fast_time:8.4f}s {compared}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -28,13 +28,18 @@ from gd.session import Session
 from gd.song import ArtistInfo, Author, Song
 from gd.user import UserStats, User
 from gd.version import *
+from gd.utils.cache import CacheBackend, MemoryCacheBackend, ResponseCache, SQLiteCacheBackend
+from gd.utils.cassette import Cassette, CassetteRecord, RecordTransport, ReplayTransport, Transport
 from gd.utils.converter import Converter
 from gd.utils.decorators import breakpoint
 from gd.utils.enums import *
 from gd.utils.filters import Filters
 from gd.utils.http_request import HTTPClient
+from gd.utils.metrics import HTTPMetrics
 from gd.utils.params import *
 from gd.utils.parser import Parser
+from gd.utils.rate_limiter import RateLimiter, TokenBucket, VirtualClock
+from gd.utils.retry import RetryPolicy
 from gd.utils.routes import Route
 from gd.utils.xml_parser import AioXMLParser, XMLParser
 
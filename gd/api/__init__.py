@@ -1,9 +1,15 @@
+from gd.api.columnar import *
 from gd.api.editor import *
 from gd.api.enums import *
 from gd.api.guidelines import *
 from gd.api.hsv import *
+from gd.api.id_index import *
 from gd.api.loader import *
 from gd.api.save import *
+from gd.api.selection import *
+from gd.api.spatial import *
+from gd.api.stream import *
 from gd.api.struct import *
+from gd.api.timing import *
 from gd.api.utils import *
 from gd.api.verification_str import *
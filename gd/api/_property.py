@@ -34,7 +34,15 @@ from gd.api.parser import (  # type: ignore
 )
 from gd.api.hsv import HSV
 
-__all__ = ("_template", "_create", "_object_code", "_color_code", "_header_code", "_level_code")
+__all__ = (
+    "_template",
+    "_object_template",
+    "_create",
+    "_object_code",
+    "_color_code",
+    "_header_code",
+    "_level_code",
+)
 
 _template = """
 @property
@@ -52,6 +60,25 @@ def {name}(self):
         pass
 """.strip()
 
+# same as above, but changing the property also discards the cached string of the object
+_object_template = """
+@property
+def {name}(self):
+    \"\"\":class:`{cls}`: Property ({desc}).\"\"\"
+    return self.data.get({enum!r})
+@{name}.setter
+def {name}(self, value):
+    self.data[{enum!r}] = value
+    self._dumped = None
+@{name}.deleter
+def {name}(self):
+    try:
+        del self.data[{enum!r}]
+    except KeyError:
+        pass
+    self._dumped = None
+""".strip()
+
 _container = "_container = {}"
 
 
@@ -92,14 +119,14 @@ def _get_type(key: Union[int, str], type_str: str = "object") -> str:
         return result
 
 
-def _create(enum: Enum, type_str: str) -> str:
+def _create(enum: Enum, type_str: str, template: str = _template) -> str:
     final = []
 
     for name, value in enum.as_dict().items():
         desc = enum(value).title
         value = str(value)
         cls = _get_type(value, type_str)
-        final.append(_template.format(name=name, enum=value, desc=desc, cls=cls))
+        final.append(template.format(name=name, enum=value, desc=desc, cls=cls))
 
     property_container = {}
 
@@ -115,7 +142,7 @@ def _create(enum: Enum, type_str: str) -> str:
     return ("\n\n").join(final)
 
 
-_object_code = _create(ObjectDataEnum, "object")
+_object_code = _create(ObjectDataEnum, "object", _object_template)
 _color_code = _create(ColorChannelProperties, "color")
 _header_code = _create(LevelHeaderEnum, "header")
 _level_code = _create(LevelDataEnum, "level")
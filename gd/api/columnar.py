@@ -0,0 +1,640 @@
+from array import array
+from collections.abc import MutableMapping
+from itertools import chain, compress
+import sys
+
+from gd.typing import (
+    Any,
+    ColumnarEditor,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from gd.api.editor import Editor
+from gd.api.enums import ObjectDataEnum
+from gd.api.parser import _GROUPS, _object_convert, _object_to_string
+from gd.api.selection import ColumnarSelection
+from gd.api.struct import Header, Object
+from gd.errors import EditorError
+from gd.utils.text_tools import make_repr
+
+__all__ = ("ColumnarEditor", "Column", "RowData")
+
+Number = Union[float, int]
+
+MISSING, INT, FLOAT = 0, 1, 2
+
+# floats represent integers exactly only up to this
+FLOAT_INT_LIMIT = 1 << 53
+INT_MIN, INT_MAX = -(1 << 63), (1 << 63) - 1
+
+_ID = str(ObjectDataEnum.ID.value)
+_X = str(ObjectDataEnum.X.value)
+_Y = str(ObjectDataEnum.Y.value)
+_ROTATION = str(ObjectDataEnum.ROTATION.value)
+_SCALE = str(ObjectDataEnum.SCALE.value)
+_COLOR_1 = str(ObjectDataEnum.COLOR_1.value)
+_COLOR_2 = str(ObjectDataEnum.COLOR_2.value)
+_Z_LAYER = str(ObjectDataEnum.Z_LAYER.value)
+_Z_ORDER = str(ObjectDataEnum.Z_ORDER.value)
+_TARGET_GROUP = str(ObjectDataEnum.TARGET_GROUP_ID.value)
+
+# properties that most objects have, or that are queried often, mapped to array type codes
+HOT_KEYS = {
+    _ID: "q",
+    _X: "d",
+    _Y: "d",
+    _ROTATION: "d",
+    _SCALE: "d",
+    _COLOR_1: "q",
+    _COLOR_2: "q",
+    _Z_LAYER: "q",
+    _Z_ORDER: "q",
+    _TARGET_GROUP: "q",
+}
+
+
+def _as_rows(rows: Iterable[int]) -> Sequence[int]:
+    if isinstance(rows, (list, range, tuple)):
+        return rows
+
+    return list(rows)
+
+
+class Column:
+    """Typed column of one object property.
+
+    Values are kept in an :class:`array.array`, along with a :class:`bytearray` of kinds,
+    telling whether a value is missing, or was an :class:`int` or a :class:`float`.
+    Values that do not fit into the column (e.g. strings) are not stored in it.
+
+    Parameters
+    ----------
+    typecode: :class:`str`
+        Type code of the array, ``'d'`` for floats and ``'q'`` for integers.
+    """
+
+    def __init__(self, typecode: str) -> None:
+        self.values = array(typecode)
+        self.kinds = bytearray()
+        self.is_float = typecode == "d"
+
+    def __repr__(self) -> str:
+        info = {"typecode": repr(self.values.typecode), "length": len(self.kinds)}
+        return make_repr(self, info)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def get_kind(self, value: Any) -> int:
+        value_type = type(value)
+
+        if value_type is int:
+            if self.is_float:
+                if -FLOAT_INT_LIMIT <= value <= FLOAT_INT_LIMIT:
+                    return INT
+
+            elif INT_MIN <= value <= INT_MAX:
+                return INT
+
+        elif value_type is float and self.is_float:
+            return FLOAT
+
+        return MISSING
+
+    def append(self, value: Any) -> bool:
+        """Append ``value``, or a missing value if it does not fit. Returns whether it fits."""
+        kind = self.get_kind(value)
+
+        self.values.append(value if kind else 0)
+        self.kinds.append(kind)
+
+        return kind != MISSING
+
+    def append_missing(self) -> None:
+        self.values.append(0)
+        self.kinds.append(MISSING)
+
+    def get(self, row: int) -> Optional[Number]:
+        kind = self.kinds[row]
+
+        if kind == MISSING:
+            return None
+
+        value = self.values[row]
+
+        if kind == INT and self.is_float:
+            return int(value)
+
+        return value
+
+    def set(self, row: int, value: Any) -> bool:
+        """Set value of ``row``. Returns whether ``value`` fits; if not, ``row`` is cleared."""
+        kind = self.get_kind(value)
+
+        self.values[row] = value if kind else 0
+        self.kinds[row] = kind
+
+        return kind != MISSING
+
+    def clear(self, row: int) -> None:
+        self.values[row] = 0
+        self.kinds[row] = MISSING
+
+    def get_many(self, rows: Iterable[int]) -> List[Optional[Number]]:
+        """Get values of ``rows``, ``None`` for missing ones."""
+        if isinstance(rows, range) and rows == range(len(self)):
+            kinds = self.kinds
+
+            # common cases, handled without going over values in Python
+            if kinds.count(INT) == len(kinds):
+                return (
+                    list(map(int, self.values.tolist())) if self.is_float else self.values.tolist()
+                )
+
+            if kinds.count(FLOAT) == len(kinds):
+                return self.values.tolist()
+
+            pairs = zip(self.values.tolist(), kinds)
+        else:
+            values, kinds = self.values, self.kinds
+            pairs = ((values[row], kinds[row]) for row in rows)
+
+        if self.is_float:
+            return [
+                (int(value) if kind == INT else value) if kind else None for value, kind in pairs
+            ]
+
+        return [value if kind else None for value, kind in pairs]
+
+    def set_many(self, rows: Iterable[int], values: Iterable[Any]) -> List[Tuple[int, Any]]:
+        """Set values of ``rows`` that are present and fit into the column.
+        Returns ``(row, value)`` pairs of the rest, which are left unchanged.
+        """
+        if isinstance(rows, range) and rows == range(len(self)) and all(self.kinds):
+            values = list(values)
+            new_kinds = self._get_kinds(values)
+
+            if all(new_kinds):  # replace the whole column at once
+                self.values = array(self.values.typecode, values)
+                self.kinds = new_kinds
+
+                return []
+
+        array_values, kinds, is_float = self.values, self.kinds, self.is_float
+
+        low, high = (-FLOAT_INT_LIMIT, FLOAT_INT_LIMIT) if is_float else (INT_MIN, INT_MAX)
+
+        rest = []
+
+        for row, value in zip(rows, values):
+            if kinds[row]:
+                value_type = type(value)
+
+                if value_type is int and low <= value <= high:
+                    array_values[row] = value
+                    kinds[row] = INT
+                    continue
+
+                if value_type is float and is_float:
+                    array_values[row] = value
+                    kinds[row] = FLOAT
+                    continue
+
+            rest.append((row, value))
+
+        return rest
+
+    def _get_kinds(self, values: List[Any]) -> bytearray:
+        types = set(map(type, values))
+
+        # common cases, handled without going over values in Python
+        if types == {int} and values:
+            low, high = (-FLOAT_INT_LIMIT, FLOAT_INT_LIMIT) if self.is_float else (INT_MIN, INT_MAX)
+
+            if low <= min(values) and max(values) <= high:
+                return bytearray([INT]) * len(values)
+
+        if types == {float} and self.is_float:
+            return bytearray([FLOAT]) * len(values)
+
+        return bytearray(map(self.get_kind, values))
+
+    def present(self) -> Iterator[Number]:
+        """Iterate over values that are present, as stored (integers of floats are floats)."""
+        return compress(self.values, self.kinds)
+
+
+class RowData(MutableMapping):
+    """Mapping of properties of one row of :class:`.api.ColumnarEditor`.
+
+    It is used as :attr:`.api.Object.data` of objects returned by the editor,
+    so reading and writing their properties goes straight to the columns.
+    """
+
+    def __init__(self, editor: ColumnarEditor, row: int) -> None:
+        self.editor = editor
+        self.row = row
+
+    def __repr__(self) -> str:
+        info = {"row": self.row, "data": self.copy()}
+        return make_repr(self, info)
+
+    def __getitem__(self, key: str) -> Any:
+        return self.editor._get(self.row, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.editor._set(self.row, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self.editor._delete(self.row, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.editor._get_layout(self.row))
+
+    def __len__(self) -> int:
+        return len(self.editor._get_layout(self.row))
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.editor._get_layout(self.row)
+
+    def copy(self) -> Dict[str, Any]:
+        return self.editor._get_data(self.row)
+
+
+class ColumnarEditor:
+    """Columnar alternative to :class:`.api.Editor`, suited for levels with lots of objects.
+
+    Instead of keeping one :class:`dict` per object, hot properties (ID, position, rotation,
+    scale, colors, z layer and order, target group) are stored in typed arrays, groups
+    are stored in CSR form (one array of all groups and one of offsets into it),
+    and other properties are stored in sparse per-property tables.
+    Objects are views over rows, so they can be read and modified as usual.
+
+    Conversion to and from :class:`.api.Editor` is lossless, including order of properties.
+
+    Example:
+
+    .. code-block:: python3
+
+        editor = gd.api.ColumnarEditor.from_string(level.data)
+
+        print(editor.get_x_length(), editor.get_groups())
+
+        for obj in editor:
+            obj.move(x=30)
+
+        level.data = editor.dump()
+    """
+
+    def __init__(self, header: Optional[Header] = None) -> None:
+        self.header = Header() if header is None else header
+
+        self.columns = {key: Column(typecode) for key, typecode in HOT_KEYS.items()}
+
+        self.group_offsets = array("q", [0])
+        self.group_values = array("q")
+        self.has_groups = bytearray()
+        self._moved_groups = 0  # rows which groups moved out of CSR arrays
+
+        self.layouts: List[Tuple[str, ...]] = []
+        self.layout_ids: Dict[Tuple[str, ...], int] = {}
+        self.row_layouts = array("l")
+
+        self.extras: Dict[str, Dict[int, Any]] = {}
+
+    def __repr__(self) -> str:
+        info = {"objects": len(self), "layouts": len(self.layouts), "header": "<...>"}
+        return make_repr(self, info)
+
+    def __len__(self) -> int:
+        return len(self.row_layouts)
+
+    def __iter__(self) -> Iterator[Object]:
+        return map(self.get_object, range(len(self)))
+
+    def __getitem__(self, row: int) -> Object:
+        return self.get_object(row)
+
+    @classmethod
+    def from_editor(cls, editor: Editor) -> ColumnarEditor:
+        """Create columnar editor from :class:`.api.Editor`. Objects are copied."""
+        self = cls(editor.header.copy())
+        self.add_objects(*editor.objects)
+        return self
+
+    def to_editor(self) -> Editor:
+        """Convert to :class:`.api.Editor`. Objects are copied."""
+        objects = (Object.from_mapping(self._get_data(row)) for row in range(len(self)))
+        return Editor(*objects).set_header(self.header.copy())
+
+    @classmethod
+    def from_string(cls, data: Union[bytes, str]) -> ColumnarEditor:
+        """Parse level data directly into columns, without creating objects."""
+        if isinstance(data, bytes):
+            try:
+                data = data.decode()
+
+            except UnicodeDecodeError:
+                raise EditorError("Invalid level data received.") from None
+
+        if not data:
+            return cls()
+
+        info, *objects = data.split(";")
+
+        self = cls(Header.from_string(info))
+
+        try:
+            for string in objects:
+                if string:
+                    self._append(_object_convert(string))
+
+        except Exception as exc:
+            raise EditorError("Failed to process string.") from exc
+
+        return self
+
+    def dump(self, append_sc: bool = True) -> str:
+        """Dump all objects and header into a level data string."""
+        seq = [self.header.dump()]
+        seq.extend(_object_to_string(self._get_data(row)) for row in range(len(self)))
+
+        if append_sc:
+            seq.append("")
+
+        return ";".join(seq)
+
+    def get_object(self, row: int) -> Object:
+        """Get object at ``row``, which is a view over the row."""
+        if row < 0:
+            row += len(self)
+
+        if not 0 <= row < len(self):
+            raise IndexError("Object index out of range.")
+
+        return Object.from_mapping(RowData(self, row))
+
+    def add_objects(self, *objects: Iterable[Object]) -> ColumnarEditor:
+        """Add ``objects``, copying their properties into columns."""
+        for obj in objects:
+            self._append(obj.data)
+
+        return self
+
+    def select(self, rows: Optional[Iterable[int]] = None) -> ColumnarSelection:
+        """Select ``rows`` (all by default) for bulk operations, see :class:`.api.Selection`."""
+        return ColumnarSelection(self, range(len(self)) if rows is None else rows)
+
+    def get_values(self, rows: Iterable[int], key: Union[int, str]) -> List[Any]:
+        """Get values of property ``key`` of ``rows``, ``None`` for missing ones."""
+        key, rows = str(key), _as_rows(rows)
+
+        column = self.columns.get(key)
+        extras = self.extras.get(key)
+
+        if column is not None:
+            values = column.get_many(rows)
+
+            if extras:  # values that did not fit into the column
+                values = [
+                    extras.get(row) if value is None else value for row, value in zip(rows, values)
+                ]
+
+            return values
+
+        if extras is None:
+            extras = {}
+
+        if key == _GROUPS:
+            offsets, groups = self.group_offsets, self.group_values
+            return [
+                (
+                    set(groups[offsets[row] : offsets[row + 1]])
+                    if self.has_groups[row]
+                    else extras.get(row)
+                )
+                for row in rows
+            ]
+
+        return [extras.get(row) for row in rows]
+
+    def set_values(self, rows: Iterable[int], key: Union[int, str], values: Iterable[Any]) -> None:
+        """Set values of property ``key`` of ``rows``. ``None`` values remove the property."""
+        key = str(key)
+
+        column = self.columns.get(key)
+
+        if column is not None:
+            # fast path: values present in the column are replaced if new ones fit
+            pairs = column.set_many(rows, values)
+        else:
+            pairs = zip(rows, values)
+
+        layouts, row_layouts = self.layouts, self.row_layouts
+
+        added: Dict[int, int] = {}  # layout -> the same layout with the key, interned once
+
+        for row, value in pairs:
+            layout_id = row_layouts[row]
+
+            if key in layouts[layout_id]:
+                if value is None:
+                    self._delete(row, key)
+                else:
+                    self._set(row, key, value)
+
+            elif value is not None:
+                new_layout_id = added.get(layout_id)
+
+                if new_layout_id is None:
+                    new_layout_id = added[layout_id] = self._intern_layout(
+                        layouts[layout_id] + (key,)
+                    )
+
+                row_layouts[row] = new_layout_id
+
+                if column is None or not column.set(row, value):
+                    self._set_extra(key, row, value)
+
+    def get_column(self, key: Union[int, str]) -> Optional[Column]:
+        """Get column of property by ``key`` (e.g. ``2`` for ``x``), if it is stored in one."""
+        return self.columns.get(str(key))
+
+    def get_x_length(self) -> Number:
+        """Get the X position of a last object. Default is 0."""
+        values = chain(self.columns[_X].present(), self._iter_extras(_X))
+
+        result = max(values, default=0)
+
+        if isinstance(result, float) and result.is_integer():
+            return int(result)
+
+        return result
+
+    def get_groups(self) -> Set[int]:
+        """Fetch all used groups, including target groups of triggers, and return them as a set."""
+        if self._moved_groups:
+            offsets = self.group_offsets
+            groups = set(
+                chain.from_iterable(
+                    self.group_values[offsets[row] : offsets[row + 1]]
+                    for row in compress(range(len(self)), self.has_groups)
+                )
+            )
+        else:
+            groups = set(self.group_values)
+
+        for extra in self._iter_extras(_GROUPS):
+            if extra is not None:
+                groups.update(extra)
+
+        groups.update(self.columns[_TARGET_GROUP].present())
+        groups.update(value for value in self._iter_extras(_TARGET_GROUP) if isinstance(value, int))
+
+        return groups
+
+    def get_color_ids(self) -> Set[int]:
+        """Fetch all used color IDs and return them as a set."""
+        color_ids = set()
+
+        for key in (_COLOR_1, _COLOR_2):
+            color_ids.update(self.columns[key].present())
+            color_ids.update(value for value in self._iter_extras(key) if value is not None)
+
+        color_ids.update(color.id for color in self.header.colors)
+
+        return color_ids
+
+    def _iter_extras(self, key: str) -> Iterable[Any]:
+        return self.extras.get(key, {}).values()
+
+    def _intern_layout(self, layout: Tuple[str, ...]) -> int:
+        layout_id = self.layout_ids.get(layout)
+
+        if layout_id is None:
+            layout_id = self.layout_ids[layout] = len(self.layouts)
+            self.layouts.append(layout)
+
+        return layout_id
+
+    def _get_layout(self, row: int) -> Tuple[str, ...]:
+        return self.layouts[self.row_layouts[row]]
+
+    def _set_extra(self, key: str, row: int, value: Any) -> None:
+        if type(value) is str:
+            value = sys.intern(value)  # lots of objects share values of rare properties
+
+        self.extras.setdefault(key, {})[row] = value
+
+    def _append(self, data: Dict[str, Any]) -> None:
+        row = len(self)
+
+        for key, column in self.columns.items():
+            if key in data:
+                if not column.append(data[key]):
+                    self._set_extra(key, row, data[key])
+            else:
+                column.append_missing()
+
+        groups = data.get(_GROUPS)
+
+        if isinstance(groups, set) and all(type(group) is int for group in groups):
+            self.group_values.extend(groups)
+            self.has_groups.append(True)
+
+        else:
+            self.has_groups.append(False)
+
+            if _GROUPS in data:
+                self._set_extra(_GROUPS, row, groups)
+
+        self.group_offsets.append(len(self.group_values))
+
+        for key, value in data.items():
+            if key not in self.columns and key != _GROUPS:
+                self._set_extra(key, row, value)
+
+        self.row_layouts.append(self._intern_layout(tuple(data)))
+
+    def _get(self, row: int, key: str) -> Any:
+        if key not in self._get_layout(row):
+            raise KeyError(key)
+
+        column = self.columns.get(key)
+
+        if column is not None and column.kinds[row]:
+            return column.get(row)
+
+        if key == _GROUPS and self.has_groups[row]:
+            # groups are mutable, so move them out of CSR arrays, keeping changes
+            groups = set(self.group_values[self.group_offsets[row] : self.group_offsets[row + 1]])
+
+            self.has_groups[row] = False
+            self._moved_groups += 1
+            self._set_extra(_GROUPS, row, groups)
+
+            return groups
+
+        return self.extras[key][row]
+
+    def _get_data(self, row: int) -> Dict[str, Any]:
+        data = {}
+
+        for key in self._get_layout(row):
+            column = self.columns.get(key)
+
+            if column is not None and column.kinds[row]:
+                data[key] = column.get(row)
+
+            elif key == _GROUPS and self.has_groups[row]:
+                offsets = self.group_offsets
+                data[key] = set(self.group_values[offsets[row] : offsets[row + 1]])
+
+            else:
+                data[key] = self.extras[key][row]
+
+        return data
+
+    def _set(self, row: int, key: str, value: Any) -> None:
+        layout = self._get_layout(row)
+
+        if key not in layout:
+            self.row_layouts[row] = self._intern_layout(layout + (key,))
+
+        else:
+            self._clear(row, key)
+
+        column = self.columns.get(key)
+
+        if column is None or not column.set(row, value):
+            self._set_extra(key, row, value)
+
+    def _delete(self, row: int, key: str) -> None:
+        layout = self._get_layout(row)
+
+        if key not in layout:
+            raise KeyError(key)
+
+        self._clear(row, key)
+
+        self.row_layouts[row] = self._intern_layout(tuple(item for item in layout if item != key))
+
+    def _clear(self, row: int, key: str) -> None:
+        column = self.columns.get(key)
+
+        if column is not None:
+            column.clear(row)
+
+        if key == _GROUPS and self.has_groups[row]:
+            self.has_groups[row] = False
+            self._moved_groups += 1
+
+        self.extras.get(key, {}).pop(row, None)
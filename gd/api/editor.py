@@ -1,3 +1,6 @@
+import heapq
+import math
+
 from gd.typing import (
     Any,
     Callable,
@@ -9,33 +12,27 @@ from gd.typing import (
     List,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Union,
 )
 
 from gd.api.enums import (
-    SpeedMagic,
     Speed,
     PortalType,
 )
-from gd.api.struct import Object, ColorChannel, Header, ColorCollection, LevelAPI
+from gd.api.id_index import IDIndex
+from gd.api.selection import Selection
+from gd.api.spatial import DEFAULT_CELL_SIZE, SpatialIndex, get_position
+from gd.api.struct import Object, LazyObject, ColorChannel, Header, ColorCollection, LevelAPI
+from gd.api.timing import SpeedTable
 
 from gd.errors import EditorError
 from gd.utils.text_tools import make_repr
 
 __all__ = ("Editor", "get_length_from_x")
 
-speed_map = {}
-
-for string in ("slow", "normal", "fast", "faster", "fastest"):
-    magic, speed, portal = (
-        SpeedMagic.from_name(string),
-        Speed.from_name(string),
-        PortalType.from_name(string + "speed"),
-    )
-    speed_map.update({speed.value: magic.value, portal.value: magic.value})
-
-del string, magic, speed, portal
+Number = Union[float, int]
 
 _portals = {enum.value for enum in PortalType}
 _speed_protals = {enum.value for enum in PortalType if ("speed" in enum.name.lower())}
@@ -63,29 +60,7 @@ def get_length_from_x(dx: float, start_speed: Speed, portals: Sequence[Object])
     :class:`float`
         Calculated time.
     """
-    speed = speed_map.get(start_speed.value)
-
-    if not portals:
-        return dx / speed
-
-    last_x = 0
-    total = 0
-
-    for portal in portals:
-        x = portal.x
-
-        if dx <= x:
-            break
-
-        current = x - last_x
-
-        total += current / speed
-
-        speed = speed_map.get(portal.id, speed)
-
-        last_x = x
-
-    return (dx - last_x) / speed + total
+    return SpeedTable(start_speed, portals).get_time(dx)
 
 
 def _is_portal(maybe_portal: Object) -> bool:
@@ -100,6 +75,14 @@ def _get_x(some_object: Object) -> Union[float, int]:
     return some_object.x
 
 
+def _iter_positioned(objects: Iterable[Object]) -> Iterator[Tuple[Object, Tuple[Number, Number]]]:
+    for obj in objects:
+        position = get_position(obj)
+
+        if position is not None:
+            yield obj, position
+
+
 def _inf_range(start: int = 0, step: int = 1) -> Iterator[int]:
     value = start
 
@@ -128,6 +111,10 @@ class Editor:
     def __init__(self, *objects: Sequence[Object], **header_args) -> None:
         self.header = Header(**header_args)
         self.objects = list(objects)
+        self.spatial_index: Optional[SpatialIndex] = None
+        self.id_index: Optional[IDIndex] = None
+        # (table, key, portals with their positions) from the last get_speed_table() call
+        self._speed_table: Optional[Tuple[SpeedTable, Tuple[Any, ...], List[Any]]] = None
         self._set_callback()
 
     def __json__(self) -> Dict[str, Union[Header, Sequence[Object]]]:
@@ -138,14 +125,32 @@ class Editor:
         self._attr = attribute
 
     @classmethod
-    def launch(cls, caller: Any, attribute: str) -> Editor:
-        return launch_editor(caller, attribute)
+    def launch(cls, caller: Any, attribute: str, lazy: bool = False) -> Editor:
+        return launch_editor(caller, attribute, lazy=lazy)
 
     def dump_back(self) -> None:
         dump_editor(self)
 
     @classmethod
-    def from_string(cls, data: Union[bytes, str]) -> Editor:
+    def from_string(cls, data: Union[bytes, str], lazy: bool = False) -> Editor:
+        """Create an Editor from level data.
+
+        Parameters
+        ----------
+        data: Union[:class:`bytes`, :class:`str`]
+            Level data to parse.
+
+        lazy: :class:`bool`
+            Whether to parse objects only when they are accessed.
+            Objects are then :class:`.api.LazyObject` instances, which are dumped back as-is
+            if they were not accessed, so opening a big level to change a few objects
+            takes time proportional to what is accessed.
+
+        Returns
+        -------
+        :class:`.api.Editor`
+            Parsed editor.
+        """
         if isinstance(data, bytes):
             try:
                 data = data.decode()
@@ -167,7 +172,7 @@ class Editor:
             pass
 
         header = Header.from_string(info)
-        objects = list(map(Object.from_string, objects))
+        objects = list(map(LazyObject if lazy else Object.from_string, objects))
 
         return cls(*objects).set_header(header)
 
@@ -197,6 +202,9 @@ class Editor:
 
     def get_groups(self) -> Iterable[int]:
         """Fetch all used groups in Editor instance and return them as a set."""
+        if self.id_index is not None:
+            return self.id_index.get_groups()
+
         groups = set()
 
         for obj in self.objects:
@@ -212,6 +220,9 @@ class Editor:
 
     def get_color_ids(self) -> Iterable[int]:
         """Fetch all used color IDs in Editor instance and return them as a set."""
+        if self.id_index is not None:
+            return self.id_index.get_color_ids() | self._get_header_color_ids()
+
         color_ids = set()
 
         for obj in self.objects:
@@ -222,18 +233,48 @@ class Editor:
             if color_2 is not None:
                 color_ids.add(color_2)
 
-        color_ids.update(color.id for color in self.get_colors())
+        color_ids.update(self._get_header_color_ids())
 
         return color_ids
 
+    def _get_header_color_ids(self) -> Set[int]:
+        return {color.id for color in self.get_colors()}
+
     def get_free_group(self) -> Optional[int]:
         """Get next free group of Editor instance. ``None`` if not found."""
+        if self.id_index is not None:
+            return self.id_index.get_free_group()
+
         return _find_next(self.get_groups())
 
     def get_free_color_id(self) -> Optional[int]:
         """Get next free color ID of Editor instance. ``None`` if not found."""
+        if self.id_index is not None:
+            return self.id_index.get_free_color_id(exclude=self._get_header_color_ids())
+
         return _find_next(self.get_color_ids())
 
+    def get_objects_with_group(self, group: int) -> List[Object]:
+        """Find objects that have ``group`` in their groups."""
+        if self.id_index is not None:
+            return list(self.id_index.get_objects_with_group(group))
+
+        return [obj for obj in self.objects if obj.groups and group in obj.groups]
+
+    def get_objects_with_color_id(self, color_id: int) -> List[Object]:
+        """Find objects that have ``color_id`` as ``color_1`` or ``color_2``."""
+        if self.id_index is not None:
+            return list(self.id_index.get_objects_with_color_id(color_id))
+
+        return [obj for obj in self.objects if color_id in (obj.color_1, obj.color_2)]
+
+    def get_triggers_targeting(self, group: int) -> List[Object]:
+        """Find triggers that have ``group`` as their ``target_group``."""
+        if self.id_index is not None:
+            return list(self.id_index.get_triggers_targeting(group))
+
+        return [obj for obj in self.objects if obj.target_group == group]
+
     def get_portals(self) -> List[Object]:
         """Fetch all portals / speed triggers used in this level, sorted by position in level."""
         return sorted(filter(_is_portal, self.objects), key=(_get_x))
@@ -250,15 +291,51 @@ class Editor:
         """Get speed from a header, or return normal speed."""
         return self.header.speed or Speed(0)
 
+    def get_speed_table(self) -> SpeedTable:
+        """Get a table of speed segments of the level, see :class:`.api.SpeedTable`.
+
+        Building the table goes over all objects, so it is cached until objects are added
+        or removed, the speed in the header changes, or speed portals are moved or changed.
+        Objects that are turned into speed portals in place are not noticed,
+        so :meth:`.invalidate_speed_table` should be called after that.
+        """
+        speed, objects = self.get_speed(), self.objects
+        key = (speed, id(objects), len(objects))
+
+        cached = self._speed_table
+
+        if cached is not None:
+            table, cached_key, portals = cached
+
+            if cached_key == key and all(
+                portal.x == x and portal.id == portal_id and portal.is_checked()
+                for portal, x, portal_id in portals
+            ):
+                return table
+
+        speed_portals = self.get_speed_portals()
+        table = SpeedTable(speed, speed_portals)
+
+        portals = [(portal, portal.x, portal.id) for portal in speed_portals]
+        self._speed_table = (table, key, portals)
+
+        return table
+
+    def invalidate_speed_table(self) -> Editor:
+        """Discard the cached table of speed segments, see :meth:`.get_speed_table`."""
+        self._speed_table = None
+        return self
+
     def get_length(self, x: Optional[Union[float, int]] = None) -> float:
         """Calculate length of the level in seconds."""
         if x is None:
             x = self.get_x_length()
 
-        portals = self.get_speed_portals()
-        speed = self.get_speed()
+        return self.get_speed_table().get_time(x)
 
-        return get_length_from_x(x, speed, portals)
+    def get_lengths(self, xs: Iterable[Union[float, int]]) -> List[float]:
+        """Calculate time in seconds it takes to reach each of ``xs``."""
+        return self.get_speed_table().get_times(xs)
 
     def get_color(self, directive_or_id: Union[int, str]) -> Optional[ColorChannel]:
         """Get color by ID or special directive. ``None`` if not found."""
@@ -286,8 +363,146 @@ class Editor:
     def add_objects(self, *objects: Sequence[Object]) -> Editor:
         """Add objects to ``self.objects``."""
         self.objects.extend(list(objects))
+        self._speed_table = None
+
+        if self.spatial_index is not None:
+            self.spatial_index.add_objects(objects)
+
+        if self.id_index is not None:
+            self.id_index.add_objects(objects)
+
+        return self
+
+    def remove_objects(self, *objects: Sequence[Object]) -> Editor:
+        """Remove objects from ``self.objects``. Objects that are not there are ignored."""
+        removed = set(map(id, objects))
+
+        self.objects = [obj for obj in self.objects if id(obj) not in removed]
+        self._speed_table = None
+
+        for index in (self.spatial_index, self.id_index):
+            if index is not None:
+                for obj in objects:
+                    index.remove(obj)
+
         return self
 
+    def enable_id_index(self) -> IDIndex:
+        """Create indexes of objects by groups, color IDs and target groups.
+
+        While enabled, :meth:`.get_groups`, :meth:`.get_color_ids`, :meth:`.get_free_group`,
+        :meth:`.get_free_color_id` and queries like :meth:`.get_objects_with_group`
+        use the index instead of scanning all objects.
+
+        The index is kept up to date like the spatial one, see :meth:`.enable_spatial_index`.
+        Groups changed in place, other than by :meth:`.api.Object.add_groups`,
+        should be reindexed with :meth:`.api.IDIndex.update`.
+
+        Returns
+        -------
+        :class:`.api.IDIndex`
+            Created index.
+        """
+        self.disable_id_index()
+
+        self.id_index = IDIndex()
+        self.id_index.add_objects(self.objects)
+
+        return self.id_index
+
+    def disable_id_index(self) -> None:
+        """Remove the ID index, if it was enabled."""
+        if self.id_index is not None:
+            self.id_index.clear()
+            self.id_index = None
+
+    def select(self, objects: Optional[Iterable[Object]] = None) -> Selection:
+        """Select ``objects`` (all by default) for bulk operations, see :class:`.api.Selection`."""
+        return Selection(self, self.objects if objects is None else objects)
+
+    def select_in_rect(self, x1: Number, y1: Number, x2: Number, y2: Number) -> Selection:
+        """Select objects positioned in the rectangle, see :meth:`.objects_in_rect`."""
+        return Selection(self, self.objects_in_rect(x1, y1, x2, y2))
+
+    def enable_spatial_index(self, cell_size: Number = DEFAULT_CELL_SIZE) -> SpatialIndex:
+        """Create a spatial index of objects, used by queries like :meth:`.objects_in_rect`.
+
+        The index is updated when objects are added or removed through the editor,
+        or when their position changes. Objects added to ``self.objects`` directly
+        are not indexed, in which case the index should be enabled again.
+
+        Parameters
+        ----------
+        cell_size: Union[:class:`float`, :class:`int`]
+            Size of cells of the index grid.
+
+        Returns
+        -------
+        :class:`.api.SpatialIndex`
+            Created index.
+        """
+        self.disable_spatial_index()
+
+        self.spatial_index = SpatialIndex(cell_size)
+        self.spatial_index.add_objects(self.objects)
+
+        return self.spatial_index
+
+    def disable_spatial_index(self) -> None:
+        """Remove the spatial index, if it was enabled."""
+        if self.spatial_index is not None:
+            self.spatial_index.clear()
+            self.spatial_index = None
+
+    def objects_in_rect(self, x1: Number, y1: Number, x2: Number, y2: Number) -> List[Object]:
+        """Find objects positioned in the rectangle, bounds included.
+
+        Uses the spatial index if it is enabled, in which case order of objects is arbitrary.
+        """
+        if self.spatial_index is not None:
+            return self.spatial_index.in_rect(x1, y1, x2, y2)
+
+        x1, x2 = sorted((x1, x2))
+        y1, y2 = sorted((y1, y2))
+
+        return [
+            obj for obj, (x, y) in _iter_positioned(self.objects) if x1 <= x <= x2 and y1 <= y <= y2
+        ]
+
+    def objects_in_x_range(self, start: Number, end: Number) -> List[Object]:
+        """Find objects with ``x`` from ``start`` to ``end``, inclusive.
+
+        Uses the spatial index if it is enabled, in which case order of objects is arbitrary.
+        """
+        if self.spatial_index is not None:
+            return self.spatial_index.in_x_range(start, end)
+
+        start, end = sorted((start, end))
+
+        return [obj for obj, (x, _) in _iter_positioned(self.objects) if start <= x <= end]
+
+    def get_nearest_objects(self, x: Number, y: Number, count: int = 1) -> List[Object]:
+        """Find up to ``count`` objects nearest to ``(x, y)``, sorted by distance."""
+        if self.spatial_index is not None:
+            return self.spatial_index.nearest(x, y, count)
+
+        nearest = heapq.nsmallest(
+            count,
+            _iter_positioned(self.objects),
+            key=lambda item: math.hypot(item[1][0] - x, item[1][1] - y),
+        )
+
+        return [obj for obj, _ in nearest]
+
+    def get_nearest_object(self, x: Number, y: Number) -> Optional[Object]:
+        """Find an object nearest to ``(x, y)``. ``None`` if there are no objects."""
+        nearest = self.get_nearest_objects(x, y)
+
+        if nearest:
+            return nearest[0]
+
+        return None
+
     def copy_objects(self) -> List[Object]:
         """Copy objects of the Editor instance."""
         return list(obj.copy() for obj in self.objects)
@@ -307,24 +522,28 @@ class Editor:
     def dump_to_api(self, api: LevelAPI, append_sc: bool = True) -> None:
         api.edit(level_string=self.dump(append_sc=append_sc))
 
-    def dump(self, append_sc: bool = True) -> str:
-        """Dump all objects and header into a level data string."""
-        seq = [self.header.dump(), *(obj.dump() for obj in self.objects)]
+    def dump(self, append_sc: bool = True, cached: bool = False) -> str:
+        """Dump all objects and header into a level data string.
+
+        With ``cached=True``, strings of objects are cached, so only objects changed
+        since they were last dumped are serialized again, see :meth:`.api.Object.dump`.
+        """
+        seq = [self.header.dump()]
+        seq.extend([obj.dump(cached=cached) for obj in self.objects])
 
         if append_sc:
             seq.append("")
 
-        data = ";".join(map(str, seq))
-        return data
+        return ";".join(seq)
 
     def copy(self) -> Editor:
         """Return a copy of the Editor instance."""
         return Editor(self.copy_header(), *self.copy_objects())
 
 
-def launch_editor(caller: Any, attribute: str) -> Editor:
+def launch_editor(caller: Any, attribute: str, lazy: bool = False) -> Editor:
     string = getattr(caller, attribute)
-    editor = Editor.from_string(string)
+    editor = Editor.from_string(string, lazy=lazy)
     editor._set_callback(caller, attribute)
     return editor
 
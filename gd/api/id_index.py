@@ -0,0 +1,252 @@
+import heapq
+
+from gd.typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from gd.api.struct import Object
+from gd.utils.text_tools import make_repr
+
+__all__ = ("IDIndex", "IDAllocator")
+
+# groups, color IDs and target group of an object, as they were indexed
+Entry = Tuple[FrozenSet[int], FrozenSet[int], Optional[int]]
+
+
+def _as_id(value: object) -> Optional[int]:
+    if type(value) is int:
+        return value
+
+    return None
+
+
+def get_entry(obj: Object) -> Entry:
+    groups = obj.groups
+
+    if groups:
+        groups = frozenset(group for group in groups if type(group) is int)
+    else:
+        groups = frozenset()
+
+    color_ids = frozenset(
+        color_id for color_id in (_as_id(obj.color_1), _as_id(obj.color_2)) if color_id is not None
+    )
+
+    return (groups, color_ids, _as_id(obj.target_group))
+
+
+class IDAllocator:
+    """Counts uses of IDs and finds the lowest free one.
+
+    IDs that become free are put into a min-heap, and IDs that were never used
+    are found by advancing a frontier, all IDs below which were seen already,
+    so finding a free ID takes amortized logarithmic time instead of a scan.
+    """
+
+    def __init__(self, start: int = 1) -> None:
+        self.counts: Dict[int, int] = {}
+        self.frontier = start  # IDs below this are either used or queued
+        self.free: List[int] = []
+        self.queued: Set[int] = set()
+
+    def __repr__(self) -> str:
+        info = {"used": len(self.counts), "frontier": self.frontier}
+        return make_repr(self, info)
+
+    def __contains__(self, some_id: int) -> bool:
+        return some_id in self.counts
+
+    def get_used(self) -> Set[int]:
+        return set(self.counts)
+
+    def use(self, some_id: int) -> None:
+        self.counts[some_id] = self.counts.get(some_id, 0) + 1
+
+    def release(self, some_id: int) -> None:
+        count = self.counts.get(some_id, 0) - 1
+
+        if count > 0:
+            self.counts[some_id] = count
+            return
+
+        self.counts.pop(some_id, None)
+
+        if some_id < self.frontier and some_id not in self.queued:
+            heapq.heappush(self.free, some_id)
+            self.queued.add(some_id)
+
+    def get_free(self, exclude: Iterable[int] = ()) -> int:
+        """Get the lowest free ID, which is also not in ``exclude``."""
+        excluded = [some_id for some_id in set(exclude) if some_id not in self.counts]
+
+        for some_id in excluded:
+            self.use(some_id)
+
+        try:
+            return self._peek()
+
+        finally:
+            for some_id in excluded:
+                self.release(some_id)
+
+    def _peek(self) -> int:
+        free, counts = self.free, self.counts
+
+        while free:
+            some_id = free[0]
+
+            if some_id not in counts:
+                return some_id
+
+            self.queued.discard(heapq.heappop(free))  # used again since it was freed
+
+        while self.frontier in counts:
+            self.frontier += 1
+
+        return self.frontier
+
+
+class IDIndex:
+    """Inverted indexes of groups, color IDs and target groups of objects,
+    used by :class:`.api.Editor`.
+
+    Objects added to the index update it when their ``groups``, ``color_1``, ``color_2``
+    or ``target_group`` are set, and when :meth:`.api.Object.add_groups` is called.
+    Other in-place changes of ``groups`` should be followed by :meth:`.update`.
+    """
+
+    def __init__(self) -> None:
+        self.groups: Dict[int, Set[Object]] = {}
+        self.color_ids: Dict[int, Set[Object]] = {}
+        self.target_groups: Dict[int, Set[Object]] = {}
+
+        self.entries: Dict[Object, Entry] = {}
+
+        # target groups are counted as used groups, as Editor.get_groups() does
+        self.group_allocator = IDAllocator()
+        self.color_id_allocator = IDAllocator()
+
+    def __repr__(self) -> str:
+        info = {
+            "objects": len(self),
+            "groups": len(self.groups),
+            "color_ids": len(self.color_ids),
+        }
+        return make_repr(self, info)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, obj: Object) -> bool:
+        return obj in self.entries
+
+    def add(self, obj: Object) -> None:
+        """Add ``obj`` to the index, which also makes it update the index when changed."""
+        if obj in self.entries:
+            return
+
+        obj._id_index = self
+
+        self._insert(obj, get_entry(obj))
+
+    def add_objects(self, objects: Iterable[Object]) -> None:
+        for obj in objects:
+            self.add(obj)
+
+    def remove(self, obj: Object) -> None:
+        """Remove ``obj`` from the index. Does nothing if it is not in the index."""
+        entry = self.entries.pop(obj, None)
+
+        if entry is None:
+            return
+
+        self._discard(obj, entry)
+
+        if obj._id_index is self:
+            obj._id_index = None
+
+    def update(self, obj: Object) -> None:
+        """Reindex ``obj`` after its groups, color IDs or target group changed."""
+        old_entry = self.entries.get(obj)
+
+        if old_entry is None:
+            return self.add(obj)
+
+        new_entry = get_entry(obj)
+
+        if old_entry != new_entry:
+            self._discard(obj, old_entry)
+            self._insert(obj, new_entry)
+
+    def clear(self) -> None:
+        """Remove all objects from the index."""
+        for obj in self.entries:
+            if obj._id_index is self:
+                obj._id_index = None
+
+        self.groups.clear()
+        self.color_ids.clear()
+        self.target_groups.clear()
+        self.entries.clear()
+
+        self.group_allocator = IDAllocator()
+        self.color_id_allocator = IDAllocator()
+
+    def get_groups(self) -> Set[int]:
+        return self.group_allocator.get_used()
+
+    def get_color_ids(self) -> Set[int]:
+        return self.color_id_allocator.get_used()
+
+    def get_free_group(self, exclude: Iterable[int] = ()) -> int:
+        return self.group_allocator.get_free(exclude)
+
+    def get_free_color_id(self, exclude: Iterable[int] = ()) -> int:
+        return self.color_id_allocator.get_free(exclude)
+
+    def get_objects_with_group(self, group: int) -> Set[Object]:
+        return set(self.groups.get(group, ()))
+
+    def get_objects_with_color_id(self, color_id: int) -> Set[Object]:
+        return set(self.color_ids.get(color_id, ()))
+
+    def get_triggers_targeting(self, group: int) -> Set[Object]:
+        return set(self.target_groups.get(group, ()))
+
+    def _insert(self, obj: Object, entry: Entry) -> None:
+        groups, color_ids, target_group = entry
+
+        for group in groups:
+            self.groups.setdefault(group, set()).add(obj)
+            self.group_allocator.use(group)
+
+        for color_id in color_ids:
+            self.color_ids.setdefault(color_id, set()).add(obj)
+            self.color_id_allocator.use(color_id)
+
+        if target_group is not None:
+            self.target_groups.setdefault(target_group, set()).add(obj)
+            self.group_allocator.use(target_group)
+
+        self.entries[obj] = entry
+
+    def _discard(self, obj: Object, entry: Entry) -> None:
+        groups, color_ids, target_group = entry
+
+        for group in groups:
+            _discard_from(self.groups, group, obj)
+            self.group_allocator.release(group)
+
+        for color_id in color_ids:
+            _discard_from(self.color_ids, color_id, obj)
+            self.color_id_allocator.release(color_id)
+
+        if target_group is not None:
+            _discard_from(self.target_groups, target_group, obj)
+            self.group_allocator.release(target_group)
+
+
+def _discard_from(mapping: Dict[int, Set[Object]], key: int, obj: Object) -> None:
+    objects = mapping[key]
+    objects.discard(obj)
+
+    if not objects:
+        del mapping[key]
@@ -2,8 +2,9 @@ from pathlib import Path
 import functools
 import os
 import sys
+import zlib
 
-from gd.typing import Optional, Tuple, Union
+from gd.typing import IO, Optional, Tuple, Union
 
 from gd.utils.async_utils import run_blocking_io
 from gd.utils.crypto.coders import Coder
@@ -45,8 +46,11 @@ def get_path() -> Path:
 
 if MACOS:
     decode_save, encode_save = Coder.decode_mac_save, Coder.encode_mac_save
+    decode_save_stream = Coder.decode_mac_save_stream
+    encode_save_stream = Coder.encode_mac_save_stream
 else:
     decode_save, encode_save = Coder.decode_save, Coder.encode_save
+    decode_save_stream, encode_save_stream = Coder.decode_save_stream, Coder.encode_save_stream
 
 
 class SaveUtil:
@@ -156,6 +160,12 @@ class SaveUtil:
         levels_file: Union[:class:`str`, :class:`pathlib.Path`]
             Path to a file containing levels part of the save.
             Applied when ``levels`` is a directory.
+        level: :class:`int`
+            Compression level, from ``0`` to ``9``.
+        strategy: :class:`int`
+            Compression strategy, e.g. :data:`zlib.Z_FILTERED`.
+        workers: :class:`int`
+            Amount of threads to compress with, see :func:`gd.utils.crypto.coders.deflate`.
         """
         await run_blocking_io(self._local_dump, *args, **kwargs)
 
@@ -188,6 +198,12 @@ class SaveUtil:
         levels_file: Union[:class:`str`, :class:`pathlib.Path`]
             Path to a file containing levels part of the save.
             Applied when ``levels`` is a directory.
+        level: :class:`int`
+            Compression level, from ``0`` to ``9``.
+        strategy: :class:`int`
+            Compression strategy, e.g. :data:`zlib.Z_FILTERED`.
+        workers: :class:`int`
+            Amount of threads to compress with, see :func:`gd.utils.crypto.coders.deflate`.
         """
         return self._local_dump(*args, **kwargs)
 
@@ -208,6 +224,12 @@ class SaveUtil:
         xor: :class:`bool`
             Whether to apply *XOR* after zipping the save. (GD does that for local files)
             Defaults to ``False``.
+        level: :class:`int`
+            Compression level, from ``0`` to ``9``.
+        strategy: :class:`int`
+            Compression strategy, e.g. :data:`zlib.Z_FILTERED`.
+        workers: :class:`int`
+            Amount of threads to compress with, see :func:`gd.utils.crypto.coders.deflate`.
 
         Returns
         -------
@@ -231,6 +253,12 @@ class SaveUtil:
         xor: :class:`bool`
             Whether to apply *XOR* after zipping the save. (GD does that for local files)
             Defaults to ``False``.
+        level: :class:`int`
+            Compression level, from ``0`` to ``9``.
+        strategy: :class:`int`
+            Compression strategy, e.g. :data:`zlib.Z_FILTERED`.
+        workers: :class:`int`
+            Amount of threads to compress with, see :func:`gd.utils.crypto.coders.deflate`.
 
         Returns
         -------
@@ -331,7 +359,15 @@ class SaveUtil:
         return Database(main, levels)
 
     def _dump(
-        self, db: Database, connect: bool = True, xor: bool = False, follow_os: bool = True
+        self,
+        db: Database,
+        connect: bool = True,
+        xor: bool = False,
+        follow_os: bool = True,
+        *,
+        level: int = zlib.Z_DEFAULT_COMPRESSION,
+        strategy: int = zlib.Z_DEFAULT_STRATEGY,
+        workers: int = 1,
     ) -> Union[str, Tuple[str, str]]:
         if follow_os:
             global encode_save  # pull from global
@@ -341,7 +377,11 @@ class SaveUtil:
         parts = []
 
         for part in db.as_tuple():
-            parts.append(encode_save(part.dump(), needs_xor=xor))
+            parts.append(
+                encode_save(
+                    part.dump(), needs_xor=xor, level=level, strategy=strategy, workers=workers
+                )
+            )
 
         main, levels, *_ = parts
 
@@ -366,13 +406,21 @@ class SaveUtil:
             for path in (main_path, levels_path):
 
                 with open(path, "rb") as file:
-                    parts.append(file.read())
+                    parts.append(self._decode_file(file))
 
-            return self._load(*parts, xor=True)
+            return Database(*parts)
 
         except OSError:
             return self.make_db()
 
+    def _decode_file(self, file: IO[bytes]) -> str:
+        try:
+            return b"".join(decode_save_stream(file, needs_xor=True)).decode(errors="ignore")
+        except OSError:
+            raise
+        except Exception:
+            return ""
+
     def _local_dump(
         self,
         db: Database,
@@ -380,6 +428,10 @@ class SaveUtil:
         levels: Optional[PathLike] = None,
         main_file: PathLike = MAIN,
         levels_file: PathLike = LEVELS,
+        *,
+        level: int = zlib.Z_DEFAULT_COMPRESSION,
+        strategy: int = zlib.Z_DEFAULT_STRATEGY,
+        workers: int = 1,
     ) -> None:
         main_path = _config_path(main, main_file)
         levels_path = _config_path(levels, levels_file)
@@ -388,8 +440,11 @@ class SaveUtil:
 
         for file, part in zip(files, db.as_tuple()):
 
-            with open(file, "w") as data_file:
-                data_file.write(encode_save(part.dump(), needs_xor=True))
+            with open(file, "wb") as data_file:
+                for chunk in encode_save_stream(
+                    part.dump(), needs_xor=True, level=level, strategy=strategy, workers=workers
+                ):
+                    data_file.write(chunk)
 
 
 def _config_path(some_path: PathLike, default: PathLike) -> Path:
@@ -247,38 +247,124 @@ _ENUMS = {
     _TARGET_COORDS: TargetPosCoordinates,
 }
 
-_OBJECT_ADDITIONAL = {_TEXT: lambda text: _b64_failsafe(text, encode=True)}
+
+# objects with at most that many different key layouts get compiled codecs
+_MAX_OBJECT_CODECS = 1024
 
 
 def _object_convert(string: str) -> Dict[str, Any]:
-    return _convert(string, delim=",", func=_from_str)
+    parts = string.split(",")
+
+    if len(parts) % 2:
+        parts.pop()  # key without value
+
+    keys = tuple(parts[::2])
+
+    codec = _OBJECT_CODECS.get(keys)
+
+    if codec is None:
+        if len(_OBJECT_CODECS) >= _MAX_OBJECT_CODECS:
+            decoders = _OBJECT_DECODERS
+            values = iter(parts)
+
+            return {key: decoders.get(key, _identity)(value) for key, value in zip(values, values)}
+
+        codec = _OBJECT_CODECS[keys] = _compile_object_codec(keys)
+
+    return codec(parts)
 
 
 def _object_dump(some_dict: Dict[str, T]) -> Dict[str, Union[T, U]]:
-    return _dump(some_dict, _OBJECT_ADDITIONAL)
+    encoders = _OBJECT_ENCODERS
+    return {key: encoders.get(key, _convert_type)(value) for key, value in some_dict.items()}
 
 
 def _object_collect(some_dict: Dict[T, U]) -> str:
     return _collect(some_dict, ",")
 
 
+def _object_to_string(some_dict: Dict[str, T]) -> str:
+    encoders, type_encoders = _OBJECT_ENCODERS, _TYPE_ENCODERS
+
+    parts = []
+
+    for key, value in some_dict.items():
+        some_type = value.__class__
+
+        if some_type in _PLAIN_TYPES and key not in encoders:
+            parts.append(key)
+            parts.append(str(value))
+            continue
+
+        encoder = encoders.get(key) or type_encoders.get(some_type) or _get_type_encoder(some_type)
+
+        parts.append(key)
+        parts.append(str(encoder(value)))
+
+    return ",".join(parts)
+
+
 def _from_str(key: str, value: str) -> Any:
-    if key in _INT:
-        return int(value)
-    if key in _BOOL:
-        return _bool(value)
-    if key in _FLOAT:
-        return _maybefloat(value)
-    if key == _GROUPS:
-        return _ints_from_str(value)
-    if key in _HSV:
-        return HSV.from_string(value)
-    if key in _ENUMS:
-        return _ENUMS[key](int(value))
-    if key == _TEXT:
-        return _b64_failsafe(value, encode=False)
-    return value
+    return _OBJECT_DECODERS.get(key, _identity)(value)
+
+
+def _enum_decoder(enum: Type[Enum]) -> Callable[[str], Enum]:
+    def decode(value: str) -> Enum:
+        return enum(int(value))
+
+    return decode
+
+
+def _decode_text(value: str) -> str:
+    return _b64_failsafe(value, encode=False)
+
+
+def _encode_text(value: Any) -> str:
+    return _b64_failsafe(_convert_type(value), encode=True)
+
+
+def _build_object_decoders() -> Dict[str, Callable[[str], Any]]:
+    # later updates take priority, as earlier checks did
+    decoders = {_TEXT: _decode_text}
+    decoders.update({key: _enum_decoder(enum) for key, enum in _ENUMS.items()})
+    decoders.update(dict.fromkeys(_HSV, HSV.from_string))
+    decoders[_GROUPS] = _ints_from_str
+    decoders.update(dict.fromkeys(_FLOAT, _maybefloat))
+    decoders.update(dict.fromkeys(_BOOL, _bool))
+    decoders.update(dict.fromkeys(_INT, int))
+    return decoders
+
+
+def _compile_object_codec(keys: Tuple[str, ...]) -> Callable[[List[str]], Dict[str, Any]]:
+    # generates function like: def codec(parts): return {"1": decode_0(parts[1]), "2": ...}
+    namespace = {}
+    items = []
+
+    for index, key in enumerate(keys):
+        value = f"parts[{index * 2 + 1}]"
+        decoder = _OBJECT_DECODERS.get(key)
+
+        if decoder in _INLINE_DECODERS:
+            value = _INLINE_DECODERS[decoder].format(value)
 
+        elif decoder is not None:
+            name = f"decode_{index}"
+            namespace[name] = decoder
+            value = f"{name}({value})"
+
+        items.append(f"{key!r}: {value}")
+
+    exec(f"def codec(parts):\n    return {{{', '.join(items)}}}", namespace)
+
+    return namespace["codec"]
+
+
+# expressions that compiled codecs use instead of calling these decoders
+_INLINE_DECODERS = {
+    int: "int({0})",
+    _bool: "{0} == '1'",
+    _maybefloat: "(float({0}) if '.' in {0} else int({0}))",
+}
 
 _MAPPING = {
     bool: int,
@@ -290,14 +376,30 @@ _MAPPING = {
     HSV: HSV.dump,
 }
 
+_TYPE_ENCODERS: Dict[type, Callable[[Any], Any]] = {}
+_PLAIN_TYPES = {int, float, str}  # types that are dumped as they are
+
+
+def _get_type_encoder(some_type: type) -> Callable[[T], Union[T, U]]:
+    encoder = _TYPE_ENCODERS.get(some_type)
+
+    if encoder is None:
+        encoder = _MAPPING.get(some_type)
+
+        if encoder is None:
+            encoder = _enum_value if issubclass(some_type, Enum) else _identity
+
+        _TYPE_ENCODERS[some_type] = encoder
+
+    return encoder
+
+
+def _enum_value(some_enum: Enum) -> Any:
+    return some_enum.value
+
 
 def _convert_type(some_object: T) -> Union[T, U]:
-    some_type = some_object.__class__
-    if some_type in _MAPPING:
-        return _MAPPING[some_type](some_object)
-    elif Enum in some_type.__mro__:
-        return some_object.value
-    return some_object
+    return _get_type_encoder(some_object.__class__)(some_object)
 
 
 # COLOR PARSING
@@ -310,17 +412,15 @@ _COLOR_HSV = "10"
 
 
 def _parse_color(key: str, value: str) -> Any:
-    if key in _COLOR_INT:
-        return int(value)
-    if key in _COLOR_BOOL:
-        return _bool(value)
-    if key == _COLOR_FLOAT:
-        return _maybefloat(value)
-    if key == _COLOR_HSV:
-        return HSV.from_string(value)
-    if key == _COLOR_PLAYER:
-        return PlayerColor(int(value))
-    return value
+    return _COLOR_DECODERS.get(key, _identity)(value)
+
+
+def _build_color_decoders() -> Dict[str, Callable[[str], Any]]:
+    decoders = {_COLOR_PLAYER: _enum_decoder(PlayerColor), _COLOR_HSV: HSV.from_string}
+    decoders[_COLOR_FLOAT] = _maybefloat
+    decoders.update(dict.fromkeys(_COLOR_BOOL, _bool))
+    decoders.update(dict.fromkeys(_COLOR_INT, int))
+    return decoders
 
 
 def _color_convert(string: str) -> Dict[str, Any]:
@@ -381,23 +481,24 @@ _HEADER_ENUMS = {
 
 
 def _parse_header(key: str, value: str) -> Any:
-    if key in _HEADER_INT:
-        return int(value)
-    if key in _HEADER_BOOL:
-        return _bool(value)
-    if key in _HEADER_ENUMS:
-        return _HEADER_ENUMS[key](int(value))
-    if key == _COLORS:
-        return _parse_colors(value)
-    if key == _HEADER_FLOAT:
-        return _maybefloat(value)
-    if key in _HEADER_COLORS:
-        from gd.api.struct import ColorChannel  # HACK: circular imports
+    return _HEADER_DECODERS.get(key, _identity)(value)
+
+
+def _parse_header_color(value: str) -> Any:
+    from gd.api.struct import ColorChannel  # HACK: circular imports
+
+    return ColorChannel.from_mapping(_color_convert(value))
 
-        return ColorChannel.from_mapping(_color_convert(value))
-    if key == _GUIDELINES:
-        return _parse_guidelines(value)
-    return value
+
+def _build_header_decoders() -> Dict[str, Callable[[str], Any]]:
+    decoders = {_GUIDELINES: _parse_guidelines}
+    decoders.update(dict.fromkeys(_HEADER_COLORS, _parse_header_color))
+    decoders[_HEADER_FLOAT] = _maybefloat
+    decoders[_COLORS] = _parse_colors
+    decoders.update({key: _enum_decoder(enum) for key, enum in _HEADER_ENUMS.items()})
+    decoders.update(dict.fromkeys(_HEADER_BOOL, _bool))
+    decoders.update(dict.fromkeys(_HEADER_INT, int))
+    return decoders
 
 
 def _dump_header_part(key: str, value: Any) -> Any:
@@ -506,12 +607,29 @@ def _process_level(some_dict: Dict[str, T]) -> Dict[str, U]:
 
 # LOAD ACCELERATOR
 
+_accelerator: Dict[str, Any] = {}
+
 try:
     import _gdc
 
-    locals().update(_gdc.__dict__)  # hacky insertion yay
+    _accelerator = _gdc.__dict__
+
+    locals().update(_accelerator)  # hacky insertion yay
 except ImportError:
     pass  # can not import? kden
 
+# DISPATCH TABLES
+
+# built after loading the accelerator, so that functions it replaces are dispatched to;
+# it can also provide decoders for specific keys in tables of the same names
+_OBJECT_DECODERS = {**_build_object_decoders(), **_accelerator.get("_OBJECT_DECODERS", {})}
+_COLOR_DECODERS = {**_build_color_decoders(), **_accelerator.get("_COLOR_DECODERS", {})}
+_HEADER_DECODERS = {**_build_header_decoders(), **_accelerator.get("_HEADER_DECODERS", {})}
+
+_OBJECT_ENCODERS = {_TEXT: _encode_text, **_accelerator.get("_OBJECT_ENCODERS", {})}
+
+# key layout -> compiled codec, using decoders above
+_OBJECT_CODECS: Dict[Tuple[str, ...], Callable[[List[str]], Dict[str, Any]]] = {}
+
 # add all _private_stuff
 __all__ = tuple(key for key in locals().keys() if key.startswith("_") and "__" not in key)
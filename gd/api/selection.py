@@ -0,0 +1,366 @@
+from math import cos, radians, sin
+
+from gd.typing import (
+    Any,
+    ColumnarEditor,
+    ColumnarSelection,
+    Editor,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Selection,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from gd.api.enums import ObjectDataEnum
+from gd.api.struct import Object
+from gd.utils.text_tools import make_repr
+
+__all__ = ("Selection", "ColumnarSelection")
+
+Number = Union[float, int]
+Point = Tuple[Number, Number]
+
+CHUNK_SIZE = 500  # objects processed at once by operations that make lots of objects
+PRECISION = 6  # digits after the point that computed values are rounded to
+
+_X = str(ObjectDataEnum.X.value)
+_Y = str(ObjectDataEnum.Y.value)
+_H_FLIPPED = str(ObjectDataEnum.H_FLIPPED.value)
+_V_FLIPPED = str(ObjectDataEnum.V_FLIPPED.value)
+_ROTATION = str(ObjectDataEnum.ROTATION.value)
+_SCALE = str(ObjectDataEnum.SCALE.value)
+_COLOR_1 = str(ObjectDataEnum.COLOR_1.value)
+_COLOR_2 = str(ObjectDataEnum.COLOR_2.value)
+_TARGET_GROUP = str(ObjectDataEnum.TARGET_GROUP_ID.value)
+_GROUPS = str(ObjectDataEnum.GROUPS.value)
+
+
+def _normalize(value: Number) -> Number:
+    # avoid things like 29.999999999999996 or 1.8e-16, which come from float math
+    value = round(value, PRECISION)
+
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+
+    return value
+
+
+def _normalize_all(values: Iterable[Number]) -> List[Number]:
+    # integers are exact already, which is the common case
+    return [value if type(value) is int else _normalize(value) for value in values]
+
+
+def _or_default(values: List[Any], default: Number) -> List[Number]:
+    return [default if value is None else value for value in values]
+
+
+def _or_missing(old_values: List[Any], values: Iterable[Any], default: Number) -> List[Any]:
+    # values that were missing are left missing if they are still the default
+    return [
+        None if old is None and value == default else value
+        for old, value in zip(old_values, values)
+    ]
+
+
+class Selection:
+    """Objects of :class:`.api.Editor` that bulk operations are applied to.
+
+    Each operation reads the properties it needs for all objects at once, computes
+    new values in one pass and writes them back, bypassing per-object property access.
+    Indexes of the editor are updated once, after the operation.
+
+    Example:
+
+    .. code-block:: python3
+
+        selection = editor.select_in_rect(0, 0, 300, 300)
+
+        selection.translate(x=600).rotate(90).regroup(add=[10])
+
+    Parameters
+    ----------
+    editor: :class:`.api.Editor`
+        Editor objects are from.
+
+    objects: Iterable[:class:`.api.Object`]
+        Objects to select.
+    """
+
+    def __init__(self, editor: Editor, objects: Iterable[Object]) -> None:
+        self.editor = editor
+        self.objects = list(objects)
+
+    def __repr__(self) -> str:
+        info = {"objects": len(self)}
+        return make_repr(self, info)
+
+    def __len__(self) -> int:
+        return len(self.objects)
+
+    def __iter__(self) -> Iterator[Object]:
+        return iter(self.objects)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Object, Selection]:
+        if isinstance(index, slice):
+            return self.__class__(self.editor, self.objects[index])
+
+        return self.objects[index]
+
+    def get_values(self, key: str) -> List[Any]:
+        """Get values of property ``key`` of all objects, ``None`` for missing ones."""
+        return [obj.data.get(key) for obj in self.objects]
+
+    def set_values(self, key: str, values: Iterable[Any]) -> None:
+        """Set values of property ``key`` of all objects. ``None`` values remove the property."""
+        for obj, value in zip(self.objects, values):
+            if value is None:
+                obj.data.pop(key, None)
+            else:
+                obj.data[key] = value
+
+            obj._dumped = None
+
+    def get_positions(self) -> Tuple[List[Number], List[Number]]:
+        return _or_default(self.get_values(_X), 0), _or_default(self.get_values(_Y), 0)
+
+    def set_positions(self, xs: Iterable[Number], ys: Iterable[Number]) -> None:
+        self.set_values(_X, _or_missing(self.get_values(_X), xs, 0))
+        self.set_values(_Y, _or_missing(self.get_values(_Y), ys, 0))
+        self._update_index("spatial_index")
+
+    def get_bounds(self) -> Tuple[Number, Number, Number, Number]:
+        """Get ``(min_x, min_y, max_x, max_y)`` of positions of objects."""
+        if not self.objects:
+            raise ValueError("Can not get bounds of an empty selection.")
+
+        xs, ys = self.get_positions()
+
+        return (min(xs), min(ys), max(xs), max(ys))
+
+    def get_center(self) -> Point:
+        """Get center of bounds of positions of objects."""
+        min_x, min_y, max_x, max_y = self.get_bounds()
+
+        return (_normalize((min_x + max_x) / 2), _normalize((min_y + max_y) / 2))
+
+    def translate(self, x: Number = 0, y: Number = 0) -> Selection:
+        """Add ``x`` and ``y`` to coordinates of objects."""
+        xs, ys = self.get_positions()
+
+        self.set_positions(
+            _normalize_all([value + x for value in xs]), _normalize_all([value + y for value in ys])
+        )
+
+        return self
+
+    def rotate(self, angle: Number, pivot: Optional[Point] = None) -> Selection:
+        """Rotate objects clockwise by ``angle`` degrees around ``pivot``,
+        which is the center of the selection by default. Rotation of objects changes too.
+        """
+        if not self.objects:
+            return self
+
+        pivot_x, pivot_y = self.get_center() if pivot is None else pivot
+
+        # snapping makes right angles exact
+        angle_cos, angle_sin = _normalize(cos(radians(angle))), _normalize(sin(radians(angle)))
+
+        xs, ys = self.get_positions()
+
+        dxs, dys = [x - pivot_x for x in xs], [y - pivot_y for y in ys]
+
+        self.set_positions(
+            _normalize_all([pivot_x + dx * angle_cos + dy * angle_sin for dx, dy in zip(dxs, dys)]),
+            _normalize_all([pivot_y - dx * angle_sin + dy * angle_cos for dx, dy in zip(dxs, dys)]),
+        )
+
+        rotations = self.get_values(_ROTATION)
+        new_rotations = [rotation + angle for rotation in _or_default(rotations, 0)]
+
+        self.set_values(_ROTATION, _or_missing(rotations, _normalize_all(new_rotations), 0))
+
+        return self
+
+    def scale(self, factor: Number, pivot: Optional[Point] = None) -> Selection:
+        """Scale distances between objects and ``pivot`` (the center by default),
+        and scale of objects, by ``factor``.
+        """
+        if not self.objects:
+            return self
+
+        pivot_x, pivot_y = self.get_center() if pivot is None else pivot
+
+        xs, ys = self.get_positions()
+
+        self.set_positions(
+            _normalize_all([pivot_x + (x - pivot_x) * factor for x in xs]),
+            _normalize_all([pivot_y + (y - pivot_y) * factor for y in ys]),
+        )
+
+        scales = self.get_values(_SCALE)
+        new_scales = [scale * factor for scale in _or_default(scales, 1)]
+
+        self.set_values(_SCALE, _or_missing(scales, _normalize_all(new_scales), 1))
+
+        return self
+
+    def mirror(self, axis: str = "x", pivot: Optional[Number] = None) -> Selection:
+        """Mirror objects along ``axis`` (``'x'`` or ``'y'``) around ``pivot`` coordinate,
+        which is the center of the selection by default. Objects are flipped as well.
+        """
+        if axis not in {"x", "y"}:
+            raise ValueError(f"Expected axis to be 'x' or 'y', got {axis!r}.")
+
+        if not self.objects:
+            return self
+
+        if pivot is None:
+            center_x, center_y = self.get_center()
+            pivot = center_x if axis == "x" else center_y
+
+        xs, ys = self.get_positions()
+
+        if axis == "x":
+            xs = _normalize_all([2 * pivot - x for x in xs])
+            flipped_key = _H_FLIPPED
+        else:
+            ys = _normalize_all([2 * pivot - y for y in ys])
+            flipped_key = _V_FLIPPED
+
+        self.set_positions(xs, ys)
+
+        self.set_values(
+            flipped_key, [(not value) or None for value in self.get_values(flipped_key)]
+        )
+
+        rotations = self.get_values(_ROTATION)
+
+        self.set_values(_ROTATION, [None if value is None else -value for value in rotations])
+
+        return self
+
+    def recolor(
+        self,
+        mapping: Optional[Mapping[int, int]] = None,
+        *,
+        color_1: Optional[int] = None,
+        color_2: Optional[int] = None,
+    ) -> Selection:
+        """Change color IDs of objects, either by ``mapping`` old IDs to new ones,
+        or by setting ``color_1`` and ``color_2`` of all objects.
+        """
+        for key, color_id in ((_COLOR_1, color_1), (_COLOR_2, color_2)):
+            if color_id is not None:
+                values = [color_id] * len(self)
+
+            elif mapping is not None:
+                values = [mapping.get(value, value) for value in self.get_values(key)]
+
+            else:
+                continue
+
+            self.set_values(key, values)
+
+        self._update_index("id_index")
+
+        return self
+
+    def regroup(
+        self,
+        mapping: Optional[Mapping[int, int]] = None,
+        *,
+        add: Iterable[int] = (),
+        remove: Iterable[int] = (),
+    ) -> Selection:
+        """Change groups of objects: ``mapping`` replaces old groups (and target groups)
+        with new ones, then groups in ``add`` are added and ones in ``remove`` are removed.
+        """
+        add, remove = set(add), set(remove)
+
+        # groups are replaced a chunk at a time, so old sets are freed as new ones are made;
+        # otherwise all new sets count as allocations and trigger lots of collections
+        for start in range(0, len(self), CHUNK_SIZE):
+            self[start : start + CHUNK_SIZE]._regroup(mapping, add, remove)
+
+        self._update_index("id_index")
+
+        return self
+
+    def _regroup(
+        self, mapping: Optional[Mapping[int, int]], add: Set[int], remove: Set[int]
+    ) -> None:
+        new_groups = []
+
+        for groups in self.get_values(_GROUPS):
+            if groups is None:
+                groups = set()
+
+            elif mapping is not None:
+                groups = {mapping.get(group, group) for group in groups}
+
+            else:
+                groups = set(groups)
+
+            if add:
+                groups |= add
+
+            if remove:
+                groups -= remove
+
+            new_groups.append(groups or None)
+
+        self.set_values(_GROUPS, new_groups)
+
+        if mapping is not None:
+            targets = self.get_values(_TARGET_GROUP)
+            self.set_values(_TARGET_GROUP, [mapping.get(target, target) for target in targets])
+
+    def _update_index(self, name: str) -> None:
+        index = getattr(self.editor, name)
+
+        if index is not None:
+            for obj in self.objects:
+                if obj in index:
+                    index.update(obj)
+
+
+class ColumnarSelection(Selection):
+    """Rows of :class:`.api.ColumnarEditor` that bulk operations are applied to.
+
+    Values are read from and written to columns of the editor directly.
+    """
+
+    def __init__(self, editor: ColumnarEditor, rows: Iterable[int]) -> None:
+        self.editor = editor
+        self.rows = rows if isinstance(rows, range) else list(rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[Object]:
+        return map(self.editor.get_object, self.rows)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Object, ColumnarSelection]:
+        if isinstance(index, slice):
+            return self.__class__(self.editor, self.rows[index])
+
+        return self.editor.get_object(self.rows[index])
+
+    @property
+    def objects(self) -> Sequence[int]:
+        return self.rows
+
+    def get_values(self, key: str) -> List[Any]:
+        return self.editor.get_values(self.rows, key)
+
+    def set_values(self, key: str, values: Iterable[Any]) -> None:
+        self.editor.set_values(self.rows, key, values)
+
+    def _update_index(self, name: str) -> None:
+        pass  # columnar editor has no indexes
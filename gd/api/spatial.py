@@ -0,0 +1,256 @@
+from math import floor, hypot
+import heapq
+
+from gd.typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from gd.api.struct import Object
+from gd.utils.text_tools import make_repr
+
+__all__ = ("SpatialIndex", "DEFAULT_CELL_SIZE")
+
+Number = Union[float, int]
+Cell = Tuple[int, int]
+
+DEFAULT_CELL_SIZE = 150  # 5 blocks
+
+
+def get_position(obj: Object) -> Optional[Tuple[Number, Number]]:
+    x, y = obj.x, obj.y
+
+    if isinstance(x, (int, float)) and isinstance(y, (int, float)):
+        return (x, y)
+
+    return None
+
+
+class SpatialIndex:
+    """Uniform grid of objects by their position, used by :class:`.api.Editor`.
+
+    Objects are put into square cells of ``cell_size``, so finding objects in an area
+    only checks objects in cells it intersects, instead of all objects.
+    Objects added to the index update it when their ``x`` or ``y`` are set,
+    which includes :meth:`.api.Object.move` and :meth:`.api.Object.set_pos`.
+
+    Parameters
+    ----------
+    cell_size: Union[:class:`float`, :class:`int`]
+        Size of cells of the grid.
+    """
+
+    def __init__(self, cell_size: Number = DEFAULT_CELL_SIZE) -> None:
+        if cell_size <= 0:
+            raise ValueError(f"Expected positive cell size, got {cell_size}.")
+
+        self.cell_size = cell_size
+
+        self.cells: Dict[Cell, Set[Object]] = {}
+        self.columns: Dict[int, Set[int]] = {}  # x of cell -> y of non-empty cells
+        self.positions: Dict[Object, Optional[Cell]] = {}  # object -> cell, if positioned
+
+    def __repr__(self) -> str:
+        info = {"objects": len(self), "cells": len(self.cells), "cell_size": self.cell_size}
+        return make_repr(self, info)
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __contains__(self, obj: Object) -> bool:
+        return obj in self.positions
+
+    def get_cell(self, x: Number, y: Number) -> Cell:
+        return (floor(x / self.cell_size), floor(y / self.cell_size))
+
+    def add(self, obj: Object) -> None:
+        """Add ``obj`` to the index, which also makes it update the index when moved."""
+        if obj in self.positions:
+            return
+
+        obj._spatial_index = self
+
+        self.positions[obj] = cell = self._get_object_cell(obj)
+
+        if cell is not None:
+            self._insert(obj, cell)
+
+    def add_objects(self, objects: Iterable[Object]) -> None:
+        for obj in objects:
+            self.add(obj)
+
+    def remove(self, obj: Object) -> None:
+        """Remove ``obj`` from the index. Does nothing if it is not in the index."""
+        if obj not in self.positions:
+            return
+
+        cell = self.positions.pop(obj)
+
+        if cell is not None:
+            self._discard(obj, cell)
+
+        if obj._spatial_index is self:
+            obj._spatial_index = None
+
+    def update(self, obj: Object) -> None:
+        """Move ``obj`` to the cell of its current position. Called when ``obj`` moves."""
+        old_cell = self.positions.get(obj)
+        new_cell = self._get_object_cell(obj)
+
+        if old_cell == new_cell:
+            return
+
+        if old_cell is not None:
+            self._discard(obj, old_cell)
+
+        if new_cell is not None:
+            self._insert(obj, new_cell)
+
+        self.positions[obj] = new_cell
+
+    def clear(self) -> None:
+        """Remove all objects from the index."""
+        for obj in self.positions:
+            if obj._spatial_index is self:
+                obj._spatial_index = None
+
+        self.cells.clear()
+        self.columns.clear()
+        self.positions.clear()
+
+    def in_rect(self, x1: Number, y1: Number, x2: Number, y2: Number) -> List[Object]:
+        """Find objects positioned in the rectangle, bounds included, in no particular order."""
+        x1, x2 = sorted((x1, x2))
+        y1, y2 = sorted((y1, y2))
+
+        (start_x, start_y), (end_x, end_y) = self.get_cell(x1, y1), self.get_cell(x2, y2)
+
+        result = []
+
+        for cell_x in self._iter_columns(start_x, end_x):
+            cell_ys = self.columns[cell_x]
+
+            if end_y - start_y < len(cell_ys):
+                cell_ys = cell_ys.intersection(range(start_y, end_y + 1))
+
+            for cell_y in cell_ys:
+                if not start_y <= cell_y <= end_y:
+                    continue
+
+                inner = start_x < cell_x < end_x and start_y < cell_y < end_y
+
+                for obj in self.cells[cell_x, cell_y]:
+                    if inner or (x1 <= obj.x <= x2 and y1 <= obj.y <= y2):
+                        result.append(obj)
+
+        return result
+
+    def in_x_range(self, start: Number, end: Number) -> List[Object]:
+        """Find objects with ``x`` from ``start`` to ``end``, inclusive, in no particular order."""
+        start, end = sorted((start, end))
+
+        start_x, end_x = self.get_cell(start, 0)[0], self.get_cell(end, 0)[0]
+
+        result = []
+
+        for cell_x in self._iter_columns(start_x, end_x):
+            inner = start_x < cell_x < end_x
+
+            for cell_y in self.columns[cell_x]:
+                for obj in self.cells[cell_x, cell_y]:
+                    if inner or start <= obj.x <= end:
+                        result.append(obj)
+
+        return result
+
+    def nearest(self, x: Number, y: Number, count: int = 1) -> List[Object]:
+        """Find up to ``count`` objects nearest to ``(x, y)``, sorted by distance."""
+        if count <= 0 or not self.cells:
+            return []
+
+        center_x, center_y = self.get_cell(x, y)
+
+        # nearest found so far, as (-distance, -order, object), so the farthest one is first
+        found: List[Tuple[float, int, Object]] = []
+        order = 0
+
+        for radius, cells in self._iter_rings(center_x, center_y):
+            for cell in cells:
+                for obj in self.cells.get(cell, ()):
+                    item = (-hypot(obj.x - x, obj.y - y), order, obj)
+                    order -= 1
+
+                    if len(found) < count:
+                        heapq.heappush(found, item)
+                    elif item > found[0]:
+                        heapq.heapreplace(found, item)
+
+            # objects in farther rings are at least this far away
+            if len(found) == count and -found[0][0] <= radius * self.cell_size:
+                break
+
+        return [obj for _, _, obj in sorted(found, reverse=True)]
+
+    def _get_object_cell(self, obj: Object) -> Optional[Cell]:
+        position = get_position(obj)
+
+        if position is None:
+            return None
+
+        return self.get_cell(*position)
+
+    def _insert(self, obj: Object, cell: Cell) -> None:
+        objects = self.cells.get(cell)
+
+        if objects is None:
+            objects = self.cells[cell] = set()
+            self.columns.setdefault(cell[0], set()).add(cell[1])
+
+        objects.add(obj)
+
+    def _discard(self, obj: Object, cell: Cell) -> None:
+        objects = self.cells[cell]
+        objects.discard(obj)
+
+        if not objects:
+            del self.cells[cell]
+
+            cell_x, cell_y = cell
+            column = self.columns[cell_x]
+            column.discard(cell_y)
+
+            if not column:
+                del self.columns[cell_x]
+
+    def _iter_columns(self, start: int, end: int) -> Iterable[int]:
+        if end - start < len(self.columns):
+            return filter(self.columns.__contains__, range(start, end + 1))
+
+        return [cell_x for cell_x in self.columns if start <= cell_x <= end]
+
+    def _iter_rings(self, center_x: int, center_y: int) -> Iterator[Tuple[int, Iterable[Cell]]]:
+        # squares of cells around the center, growing by one cell each time
+        radius = 0
+
+        while (2 * radius + 1) ** 2 <= len(self.cells):
+            if not radius:
+                yield radius, [(center_x, center_y)]
+
+            else:
+                low_x, high_x = center_x - radius, center_x + radius
+                low_y, high_y = center_y - radius, center_y + radius
+
+                cells = [(cell_x, low_y) for cell_x in range(low_x, high_x + 1)]
+                cells.extend((cell_x, high_y) for cell_x in range(low_x, high_x + 1))
+                cells.extend((low_x, cell_y) for cell_y in range(low_y + 1, high_y))
+                cells.extend((high_x, cell_y) for cell_y in range(low_y + 1, high_y))
+
+                yield radius, cells
+
+            radius += 1
+
+        # rings became larger than the grid itself, so go over the rest of the cells at once
+        remaining = [
+            cell
+            for cell in self.cells
+            if max(abs(cell[0] - center_x), abs(cell[1] - center_y)) >= radius
+        ]
+
+        yield len(self.cells) + radius, remaining
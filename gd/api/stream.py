@@ -0,0 +1,195 @@
+from itertools import chain
+import zlib
+
+from gd.typing import IO, Iterable, Iterator, Optional, Tuple, Union
+
+from gd.api.parser import _prepare
+from gd.api.struct import Header, LazyObject, Object
+from gd.errors import EditorError
+from gd.utils.crypto.coders import CHUNK_SIZE, Coder, iter_base64, iter_chunks, iter_deflate
+
+__all__ = ("iter_level_strings", "iter_level", "read_header", "iter_zip_level")
+
+Source = Union[bytes, str, memoryview, IO[bytes]]
+RawObject = Tuple[Tuple[str, str], ...]
+
+
+def _decode(data: bytes) -> str:
+    try:
+        return data.decode()
+
+    except UnicodeDecodeError:
+        raise EditorError("Invalid level data received.") from None
+
+
+def iter_level_strings(
+    source: Source, compressed: bool = True, chunk_size: int = CHUNK_SIZE
+) -> Iterator[str]:
+    """Split level data into strings of the header and objects, as it is being decompressed.
+
+    Only one chunk of data is kept in memory at a time, so huge levels
+    can be scanned without decompressing them entirely.
+
+    Parameters
+    ----------
+    source: Union[:class:`bytes`, :class:`str`, :class:`memoryview`, IO[:class:`bytes`]]
+        Level data, or a binary file to read it from.
+
+    compressed: :class:`bool`
+        Whether level data is compressed and encoded in Base64, as levels are stored.
+
+    chunk_size: :class:`int`
+        Amount of bytes to process at once.
+
+    Returns
+    -------
+    Iterator[:class:`str`]
+        Iterator over the header string, followed by object strings.
+    """
+    if compressed:
+        chunks = Coder.decode_save_stream(source, needs_xor=False, chunk_size=chunk_size)
+    else:
+        chunks = iter_chunks(source, chunk_size)
+
+    remain = b""
+
+    for chunk in chunks:
+        *parts, remain = (remain + bytes(chunk)).split(b";")
+
+        yield from map(_decode, parts)
+
+    if remain:
+        yield _decode(remain)
+
+
+def iter_level(
+    source: Source,
+    raw: bool = False,
+    lazy: bool = False,
+    compressed: bool = True,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[Union[Object, RawObject]]:
+    """Iterate over objects of level data, parsing them as it is being decompressed.
+
+    Example:
+
+    .. code-block:: python3
+
+        from collections import Counter
+
+        ids = Counter(obj.id for obj in gd.api.iter_level(level_data))
+
+    Parameters
+    ----------
+    source: Union[:class:`bytes`, :class:`str`, :class:`memoryview`, IO[:class:`bytes`]]
+        Level data, or a binary file to read it from.
+
+    raw: :class:`bool`
+        Whether to yield tuples of ``(key, value)`` string pairs instead of objects.
+
+    lazy: :class:`bool`
+        Whether to yield :class:`.api.LazyObject` instances, parsed when accessed.
+
+    compressed: :class:`bool`
+        Whether level data is compressed and encoded in Base64, as levels are stored.
+
+    chunk_size: :class:`int`
+        Amount of bytes to process at once.
+
+    Returns
+    -------
+    Iterator[Union[:class:`.api.Object`, Tuple[Tuple[:class:`str`, :class:`str`], ...]]]
+        Iterator over objects of the level.
+    """
+    strings = iter_level_strings(source, compressed, chunk_size)
+
+    next(strings, None)  # skip the header
+
+    if lazy:
+        convert = LazyObject
+    else:
+        convert = Object.from_string
+
+    for string in strings:
+        if not string:
+            continue
+
+        if raw:
+            yield tuple(_prepare(string, ","))
+        else:
+            yield convert(string)
+
+
+def read_header(source: Source, compressed: bool = True, chunk_size: int = CHUNK_SIZE) -> Header:
+    """Read the header of level data, only decompressing data up to its end."""
+    strings = iter_level_strings(source, compressed, chunk_size)
+
+    try:
+        return Header.from_string(next(strings, ""))
+
+    finally:
+        strings.close()
+
+
+def iter_zip_level(
+    objects: Iterable[Union[Object, str]],
+    header: Optional[Union[Header, str]] = None,
+    chunk_size: int = CHUNK_SIZE,
+    *,
+    level: int = zlib.Z_DEFAULT_COMPRESSION,
+    strategy: int = zlib.Z_DEFAULT_STRATEGY,
+    workers: int = 1,
+) -> Iterator[bytes]:
+    """Compress level data as objects are produced, yielding chunks of it.
+
+    Joined together, chunks are the same as :meth:`.Coder.zip` of the level string, encoded.
+    See :func:`.deflate` for ``level``, ``strategy`` and ``workers``.
+
+    Example:
+
+    .. code-block:: python3
+
+        objects = (gd.api.Object(id=1, x=x * 30) for x in range(1_000_000))
+
+        with open("level.txt", "wb") as file:
+            file.writelines(gd.api.iter_zip_level(objects))
+
+    Parameters
+    ----------
+    objects: Iterable[Union[:class:`.api.Object`, :class:`str`]]
+        Objects to write, or their strings.
+
+    header: Optional[Union[:class:`.api.Header`, :class:`str`]]
+        Header of the level. If not given, default one is used.
+
+    chunk_size: :class:`int`
+        Amount of bytes to compress at once.
+
+    Returns
+    -------
+    Iterator[:class:`bytes`]
+        Iterator over chunks of compressed level data, encoded in Base64.
+    """
+    if header is None:
+        header = Header()
+
+    def iter_blocks() -> Iterator[bytes]:
+        parts, size = [], 0
+
+        for item in chain((header,), objects):
+            if not isinstance(item, str):
+                item = item.dump()
+
+            part = item.encode() + b";"
+
+            parts.append(part)
+            size += len(part)
+
+            if size >= chunk_size:
+                yield b"".join(parts)
+                parts, size = [], 0
+
+        if parts:
+            yield b"".join(parts)
+
+    return iter_base64(iter_deflate(iter_blocks(), level, strategy, workers))
@@ -12,6 +12,7 @@ from gd.api.parser import (
     _object_dump,
     _object_convert,
     _object_collect,
+    _object_to_string,
     _color_dump,
     _color_convert,
     _color_collect,
@@ -45,7 +46,15 @@ from gd.typing import (
     Union,
 )
 
-__all__ = ("Object", "ColorChannel", "Header", "LevelAPI", "ColorCollection", "DEFAULT_COLORS")
+__all__ = (
+    "Object",
+    "LazyObject",
+    "ColorChannel",
+    "Header",
+    "LevelAPI",
+    "ColorCollection",
+    "DEFAULT_COLORS",
+)
 
 Number = Union[float, int]
 
@@ -116,11 +125,65 @@ class Struct:
             raise EditorError("Failed to process string.") from exc
 
 
+def _indexed_property(some_property: property, index_name: str) -> property:
+    # make setting the property of an object update the index of an editor it is in
+    def update(self) -> None:
+        index = getattr(self, index_name)
+
+        if index is not None:
+            index.update(self)
+
+    def setter(self, value: Any) -> None:
+        some_property.fset(self, value)
+        update(self)
+
+    def deleter(self) -> None:
+        some_property.fdel(self)
+        update(self)
+
+    return property(some_property.fget, setter, deleter, some_property.__doc__)
+
+
 class Object(Struct):
     _base_data = get_default("object")
     _dump = _object_dump
     _convert = _object_convert
     _collect = _object_collect
+    # set when the object is added to indexes of an editor
+    _spatial_index = None
+    _id_index = None
+    # (data, string) from the last cached dump, discarded when properties are changed
+    _dumped = None
+
+    def dump(self, cached: bool = False) -> str:
+        """Dump ``self`` into a string.
+
+        With ``cached=True``, the string from the last cached dump is reused if properties
+        of ``self`` were not set since. Changes made to :attr:`.data` directly, or to values
+        in place (like ``obj.groups.add(1)``), are not noticed there, so they should be
+        followed by :meth:`.invalidate` before dumping with ``cached=True``.
+        """
+        data = self.data
+
+        if not cached:
+            return _object_to_string(data)
+
+        dumped = self._dumped
+
+        if dumped is not None and dumped[0] is data:
+            return dumped[1]
+
+        string = _object_to_string(data)
+
+        if type(data) is dict:  # other mappings, like views of columnar editors, can change
+            self._dumped = (data, string)
+
+        return string
+
+    def invalidate(self) -> Object:
+        """Discard the cached string of ``self``, after its :attr:`.data` was changed directly."""
+        self._dumped = None
+        return self
 
     def set_id(self, directive: str) -> Object:
         """Set ``id`` of ``self`` according to the directive, e.g. ``trigger:move``."""
@@ -153,6 +216,10 @@ class Object(Struct):
 
         else:
             self.groups.update(groups)
+            self._dumped = None
+
+            if self._id_index is not None:
+                self._id_index.update(self)
 
         return self
 
@@ -188,6 +255,65 @@ class Object(Struct):
 
     exec(_object_code)
 
+    # properties are created by exec() above, so they are taken from the class namespace
+    x = _indexed_property(locals()["x"], "_spatial_index")
+    y = _indexed_property(locals()["y"], "_spatial_index")
+
+    groups = _indexed_property(locals()["groups"], "_id_index")
+    color_1 = _indexed_property(locals()["color_1"], "_id_index")
+    color_2 = _indexed_property(locals()["color_2"], "_id_index")
+    target_group = _indexed_property(locals()["target_group"], "_id_index")
+
+
+class LazyObject(Object):
+    """Object that keeps its string and parses it only when :attr:`.data` is first accessed.
+
+    Objects that were never accessed are dumped back as the very same string.
+    """
+
+    def __init__(self, string: Optional[str] = None, **properties) -> None:
+        self._string = string
+        self._data = None
+
+        if string is None:
+            super().__init__(**properties)
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        if self._data is None:
+            try:
+                self._data = self.__class__._convert(self._string)
+
+            except Exception as exc:
+                raise EditorError("Failed to process string.") from exc
+
+            # until properties are changed, the object is dumped as the same string
+            self._dumped = (self._data, self._string)
+            self._string = None
+
+        return self._data
+
+    @data.setter
+    def data(self, data: Dict[str, Any]) -> None:
+        self._data = data
+        self._string = None
+
+    def is_parsed(self) -> bool:
+        """:class:`bool`: Whether the object was parsed already."""
+        return self._string is None
+
+    def dump(self, cached: bool = False) -> str:
+        if self._string is not None:
+            return self._string
+
+        return super().dump(cached=cached)
+
+    def copy(self) -> Object:
+        if self._string is not None:
+            return self.__class__(self._string)
+
+        return super().copy()
+
 
 class ColorChannel(Struct):
     _base_data = get_default("color_channel")
@@ -350,10 +476,10 @@ class LevelAPI(Struct):
     def dump(self) -> None:
         raise EditorError("Level API can not be dumped.")
 
-    def open_editor(self) -> Editor:
+    def open_editor(self, lazy: bool = False) -> Editor:
         from gd.api.editor import Editor  # *circular imports*
 
-        return Editor.launch(self, "level_string")
+        return Editor.launch(self, "level_string", lazy=lazy)
 
     def is_verified(self) -> bool:
         return bool(self.verified)
@@ -0,0 +1,115 @@
+from bisect import bisect_left, bisect_right
+
+from gd.typing import Iterable, List, Union
+
+from gd.api.enums import PortalType, Speed, SpeedMagic
+from gd.api.struct import Object
+from gd.utils.text_tools import make_repr
+
+__all__ = ("SpeedTable",)
+
+Number = Union[float, int]
+
+speed_map = {}
+
+for string in ("slow", "normal", "fast", "faster", "fastest"):
+    magic, speed, portal = (
+        SpeedMagic.from_name(string),
+        Speed.from_name(string),
+        PortalType.from_name(string + "speed"),
+    )
+    speed_map.update({speed.value: magic.value, portal.value: magic.value})
+
+del string, magic, speed, portal
+
+
+class SpeedTable:
+    """Table of speed segments of a level, used to convert between x positions and time.
+
+    Segments start at ``0`` and at each speed portal, and the time it takes to reach
+    the start of each segment is computed once, so converting a position to time
+    (or time to a position) is a binary search instead of a walk over all portals.
+
+    Example:
+
+    .. code-block:: python3
+
+        table = editor.get_speed_table()
+
+        times = table.get_times(trigger.x for trigger in editor.get_triggers())
+
+    Parameters
+    ----------
+    start_speed: :class:`.api.Speed`
+        Speed at the start (in level header).
+
+    portals: Iterable[:class:`.api.Object`]
+        Speed portals in the level, ordered by x position.
+    """
+
+    def __init__(self, start_speed: Speed, portals: Iterable[Object]) -> None:
+        speed = speed_map.get(start_speed.value)
+
+        # x of portals, then x, speed and time at the start of each segment
+        self.portal_xs: List[Number] = []
+        self.xs: List[Number] = [0]
+        self.speeds: List[float] = [speed]
+        self.times: List[float] = [0]
+
+        last_x, total = 0, 0
+
+        for portal in portals:
+            x = portal.x
+
+            total += (x - last_x) / speed
+            speed = speed_map.get(portal.id, speed)
+            last_x = x
+
+            self.portal_xs.append(x)
+            self.xs.append(x)
+            self.speeds.append(speed)
+            self.times.append(total)
+
+    def __repr__(self) -> str:
+        info = {"segments": len(self)}
+        return make_repr(self, info)
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def get_time(self, x: Number) -> float:
+        """Compute time (in seconds) to travel from ``0`` to ``x``, respecting speed portals."""
+        # portals take effect only after they are passed
+        index = bisect_left(self.portal_xs, x)
+
+        return (x - self.xs[index]) / self.speeds[index] + self.times[index]
+
+    def get_x(self, time: Number) -> float:
+        """Compute x position reached after ``time`` seconds. Inverse of :meth:`.get_time`."""
+        index = max(bisect_right(self.times, time) - 1, 0)
+
+        return self.xs[index] + (time - self.times[index]) * self.speeds[index]
+
+    def get_times(self, xs: Iterable[Number]) -> List[float]:
+        """Same as :meth:`.get_time`, but for many positions at once."""
+        portal_xs, starts, speeds, times = self.portal_xs, self.xs, self.speeds, self.times
+
+        result = []
+
+        for x in xs:
+            index = bisect_left(portal_xs, x)
+            result.append((x - starts[index]) / speeds[index] + times[index])
+
+        return result
+
+    def get_xs(self, times: Iterable[Number]) -> List[float]:
+        """Same as :meth:`.get_x`, but for many times at once."""
+        starts, speeds, segment_times = self.xs, self.speeds, self.times
+
+        result = []
+
+        for time in times:
+            index = max(bisect_right(segment_times, time) - 1, 0)
+            result.append(starts[index] + (time - segment_times[index]) * speeds[index])
+
+        return result
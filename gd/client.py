@@ -1,8 +1,10 @@
 import asyncio
+import functools
+import itertools
 
 from gd.abstractuser import AbstractUser, LevelRecord
 from gd.comment import Comment
-from gd.errors import ClientException, NothingFound
+from gd.errors import ClientException, MissingAccess, NothingFound
 from gd.friend_request import FriendRequest
 from gd.level import Level
 from gd.level_packs import Gauntlet, MapPack
@@ -13,6 +15,7 @@ from gd.session import Session
 from gd.song import ArtistInfo, Author, Song
 from gd.typing import (
     Any,
+    AsyncIterator,
     Client,
     Coroutine,
     Dict,
@@ -66,6 +69,7 @@ def excluding(*args: Tuple[Type[BaseException]]) -> Tuple[Type[BaseException]]:
 
 DEFAULT_EXCLUDE: Tuple[Type[BaseException]] = excluding(NothingFound)
 DAILY, WEEKLY = -1, -2
+SEARCH_MANY_LIMIT = 100  # maximum amount of IDs servers accept in one query
 
 
 def figure_type_and_special(item: Union[Comment, Level]) -> Optional[Tuple[int, int]]:
@@ -110,6 +114,29 @@ def construct_levels(
     return levels
 
 
+def chunk_unique(iterable: Iterable[Any], size: int) -> Iterable[List[Any]]:
+    # split iterable into lists of at most 'size' items, skipping duplicates
+    seen = set()
+    iterator = iter(iterable)
+
+    def not_seen(item: Any) -> bool:
+        if item in seen:
+            return False
+
+        seen.add(item)
+        return True
+
+    iterator = filter(not_seen, iterator)
+
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+
+        if not chunk:
+            return
+
+        yield chunk
+
+
 async def is_alive_mock(level: Level) -> bool:
     # mock Level's is_alive method if the level was deleted.
     return False
@@ -173,6 +200,7 @@ class Client:
         self.load_after_post = load_after_post
         self.listeners = list()
         self.loop = loop
+        self._close_task: Optional[asyncio.Task] = None
         self._set_to_defaults()
 
     def __repr__(self) -> str:
@@ -365,6 +393,37 @@ class Client:
         data = await self.session.search_songs(query=query, pages=pages)
         return utils.unique(Song(**part, client=self) for part in data)
 
+    def iter_songs(
+        self, query: str, pages: Optional[Iterable[int]] = None, *, prefetch: int = 2
+    ) -> AsyncIterator[Song]:
+        """Search for songs on Newgrounds, yielding them page by page.
+
+        Example:
+
+        .. code-block:: python3
+
+            async for song in client.iter_songs("Xtrullor"):
+                print(song.name)
+
+        Parameters
+        ----------
+        query: :class:`str`
+            Query to search for.
+
+        pages: Optional[Iterable[:class:`int`]]
+            Pages to look at. By default, pages are iterated over until an empty one.
+
+        prefetch: :class:`int`
+            Maximum amount of pages fetched concurrently.
+
+        Returns
+        -------
+        AsyncIterator[:class:`.Song`]
+            Songs found, containing attributes ``id``, ``name`` and ``author``.
+        """
+        fetch_page = functools.partial(self.search_page_songs, query)
+        return utils.paginate(fetch_page, pages, prefetch=prefetch)
+
     async def search_page_users(self, query: str, page: int = 0) -> List[Author]:
         """|coro|
 
@@ -407,6 +466,30 @@ class Client:
         data = await self.session.search_users(query=query, pages=pages)
         return utils.unique(Author(**part, client=self) for part in data)
 
+    def iter_users(
+        self, query: str, pages: Optional[Iterable[int]] = None, *, prefetch: int = 2
+    ) -> AsyncIterator[Author]:
+        """Search for users on Newgrounds, yielding them page by page.
+
+        Parameters
+        ----------
+        query: :class:`str`
+            Query to search for.
+
+        pages: Optional[Iterable[:class:`int`]]
+            Pages to look at. By default, pages are iterated over until an empty one.
+
+        prefetch: :class:`int`
+            Maximum amount of pages fetched concurrently.
+
+        Returns
+        -------
+        AsyncIterator[:class:`.Author`]
+            Authors found, containing attributes ``name`` and ``link``.
+        """
+        fetch_page = functools.partial(self.search_page_users, query)
+        return utils.paginate(fetch_page, pages, prefetch=prefetch)
+
     async def get_page_user_songs(self, user: Union[str, Author], page: int = 0) -> List[Song]:
         """|coro|
 
@@ -454,6 +537,34 @@ class Client:
 
         return list(Song(**part, client=self) for part in data)
 
+    def iter_user_songs(
+        self,
+        user: Union[str, Author],
+        pages: Optional[Iterable[int]] = None,
+        *,
+        prefetch: int = 2,
+    ) -> AsyncIterator[Song]:
+        """Search for songs by a user on Newgrounds, yielding them page by page.
+
+        Parameters
+        ----------
+        user: Union[:class:`str`, :class:`.Author`]
+            User to search songs of.
+
+        pages: Optional[Iterable[:class:`int`]]
+            Pages to look at. By default, pages are iterated over until an empty one.
+
+        prefetch: :class:`int`
+            Maximum amount of pages fetched concurrently.
+
+        Returns
+        -------
+        AsyncIterator[:class:`.Song`]
+            Songs found, containing attributes ``id``, ``name`` and ``author``.
+        """
+        fetch_page = functools.partial(self.get_page_user_songs, user)
+        return utils.paginate(fetch_page, pages, prefetch=prefetch)
+
     async def get_user(self, account_id: int = 0) -> User:
         """|coro|
 
@@ -654,10 +765,123 @@ class Client:
         List[:class:`.Level`]
             A list of all levels found.
         """
+        levels = [level async for _, level in self.iter_many_levels(level_ids) if level]
+
+        if not levels:
+            raise MissingAccess("No levels were found.")
+
+        return levels
+
+    async def iter_many_levels(
+        self,
+        level_ids: Iterable[int],
+        *,
+        get_data: bool = False,
+        chunk_size: int = SEARCH_MANY_LIMIT,
+        concurrency: int = 4,
+        workers: int = 8,
+    ) -> AsyncIterator[Tuple[int, Optional[Level]]]:
+        """Fetch many levels, yielding them as soon as they are found.
+
+        IDs are deduplicated and split into chunks of ``chunk_size``, each chunk is
+        searched for with one ``SEARCH_MANY`` query (and more pages, if needed).
+        Requests go through the HTTP client, so its rate limiter applies to them.
+
+        Example:
+
+        .. code-block:: python3
+
+            async for level_id, level in client.iter_many_levels(range(128, 100_128)):
+                if level is None:
+                    print(f"Level {level_id} is missing.")
+
+        Parameters
+        ----------
+        level_ids: Iterable[:class:`int`]
+            IDs of levels to fetch. Can be lazy.
+
+        get_data: :class:`bool`
+            Whether to download data of levels found, like :meth:`.Client.get_level` does.
+
+        chunk_size: :class:`int`
+            Amount of IDs to search for in one query.
+
+        concurrency: :class:`int`
+            Maximum amount of chunks searched for at once.
+
+        workers: :class:`int`
+            Maximum amount of levels downloaded at once, if ``get_data`` is true.
+
+        Returns
+        -------
+        AsyncIterator[Tuple[:class:`int`, Optional[:class:`.Level`]]]
+            Pairs of ``(level_id, level)``. ``level`` is ``None`` if it was not found.
+            Levels are yielded in order of arrival, not in order of ``level_ids``.
+        """
+        chunks = chunk_unique(level_ids, chunk_size)
+        results = utils.map_bounded(self._search_many_levels, chunks, concurrency)
+
+        if not get_data:
+            async for found, missing in results:
+                for level in found:
+                    yield level.id, level
+
+                for level_id in missing:
+                    yield level_id, None
+
+            return
+
+        missing_ids = []
+
+        async def found_levels() -> AsyncIterator[Level]:
+            async for found, missing in results:
+                missing_ids.extend(missing)
+
+                for level in found:
+                    yield level
+
+        async for level_id, level in utils.map_bounded(
+            self._download_level, found_levels(), workers
+        ):
+            yield level_id, level
+
+            while missing_ids:
+                yield missing_ids.pop(), None
+
+        for level_id in missing_ids:
+            yield level_id, None
+
+    async def _search_many_levels(self, level_ids: Sequence[int]) -> Tuple[List[Level], List[int]]:
+        # search for levels with given IDs, and return found levels and missing IDs
         filters = Filters.setup_search_many()
         query = ",".join(map(str, level_ids))
+        exclude = excluding(NothingFound, MissingAccess)
+
+        remaining = set(level_ids)
+        found = []
+
+        for page in itertools.count():
+            levels = await self.search_levels_on_page(page, query, filters, exclude=exclude)
+            levels = [level for level in levels if level.id in remaining]
+
+            if not levels:
+                break
+
+            remaining.difference_update(level.id for level in levels)
+            found.extend(levels)
 
-        return await self.search_levels_on_page(query=query, filters=filters)
+            if not remaining:
+                break
+
+        return found, [level_id for level_id in level_ids if level_id in remaining]
+
+    async def _download_level(self, level: Level) -> Tuple[int, Optional[Level]]:
+        # fetch level with its data, returning None if it is not accessible anymore
+        try:
+            return level.id, await self.get_level(level.id)
+
+        except MissingAccess:
+            return level.id, None
 
     async def get_gauntlets(self) -> List[Gauntlet]:
         """|coro|
@@ -718,6 +942,26 @@ class Client:
         data = await self.session.get_map_packs(pages=pages)
         return list(MapPack.from_data(part, client=self) for part in data)
 
+    def iter_map_packs(
+        self, pages: Optional[Iterable[int]] = None, *, prefetch: int = 2
+    ) -> AsyncIterator[MapPack]:
+        """Fetch map packs, yielding them page by page.
+
+        Parameters
+        ----------
+        pages: Optional[Iterable[:class:`int`]]
+            Pages to look at. By default, pages are iterated over until an empty one.
+
+        prefetch: :class:`int`
+            Maximum amount of pages fetched concurrently.
+
+        Returns
+        -------
+        AsyncIterator[:class:`.MapPack`]
+            Map packs found.
+        """
+        return utils.paginate(self.get_page_map_packs, pages, prefetch=prefetch)
+
     async def unsafe_login(self, user: str, password: str) -> None:
         """|coro|
 
@@ -989,6 +1233,35 @@ class Client:
         Basically sets its password and username to ``None``, which
         actually implies that client logs out.
 
+        Pooled HTTP connections are released as well, via :meth:`.HTTPClient.close`.
+        If an event loop is running, releasing is scheduled in it; use :meth:`.Client.aclose`
+        to wait until it is done. Otherwise, connections are released in the loop of the client.
+
+        Parameters
+        ----------
+        message: :class:`str`
+            A message to print after closing.
+        """
+        self._set_to_defaults()
+
+        try:
+            loop = asyncio.get_running_loop()
+
+        except RuntimeError:  # no running loop
+            if not self.loop.is_closed():
+                self.loop.run_until_complete(self.http.close())
+
+        else:
+            # keep a reference, so the task is not garbage collected before it is done
+            self._close_task = loop.create_task(self.http.close())
+
+        log.info("Has logged out with message: %r", message)
+
+    async def aclose(self, message: Optional[str] = None) -> None:
+        """|coro|
+
+        Same as :meth:`.Client.close`, but waits until pooled HTTP connections are released.
+
         Parameters
         ----------
         message: :class:`str`
@@ -996,6 +1269,8 @@ class Client:
         """
         self._set_to_defaults()
 
+        await self.http.close()
+
         log.info("Has logged out with message: %r", message)
 
     def temp_login(self, user: str, password: str) -> Any:
@@ -1358,6 +1633,42 @@ class Client:
         )
         return list(Comment.from_data(part, user, client=self) for part in data)
 
+    def iter_comments(
+        self,
+        user: AbstractUser,
+        type: str = "profile",
+        pages: Optional[Iterable[int]] = None,
+        strategy: Union[int, str, CommentStrategy] = 0,
+        *,
+        prefetch: int = 2,
+    ) -> AsyncIterator[Comment]:
+        """Retrieve comments of a user, yielding them page by page.
+
+        Parameters
+        ----------
+        user: :class:`.AbstractUser`
+            User to retrieve comments of.
+        type: :class:`str`
+            Type of comments to look for.
+            Either ``profile`` or ``level``.
+        pages: Optional[Iterable[:class:`int`]]
+            Pages to look at. By default, pages are iterated over until an empty one.
+        strategy: Union[:class:`int`, :class:`str`, :class:`.CommentStrategy`]
+            Strategy to use. ``recent`` or ``most_liked``.
+        prefetch: :class:`int`
+            Maximum amount of pages fetched concurrently.
+
+        Returns
+        -------
+        AsyncIterator[:class:`.Comment`]
+            Retrieved comments.
+        """
+
+        async def fetch_page(page: int) -> List[Comment]:
+            return await self.retrieve_page_comments(user, type, page, strategy)
+
+        return utils.paginate(fetch_page, pages, prefetch=prefetch)
+
     async def report_level(self, level: Level) -> None:
         """|coro|
 
@@ -1730,6 +2041,36 @@ class Client:
 
         return list(Message.from_data(part, self.get_parse_dict(), client=self) for part in data)
 
+    @check_logged
+    def iter_messages(
+        self,
+        sent_or_inbox: str = "inbox",
+        pages: Optional[Iterable[int]] = None,
+        *,
+        prefetch: int = 2,
+    ) -> AsyncIterator[Message]:
+        """Retrieve messages, yielding them page by page.
+
+        Parameters
+        ----------
+        sent_or_inbox: :class:`str`
+            Type of messages to retrieve. Either `'sent'` or `'inbox'`.
+            Defaults to the latter.
+
+        pages: Optional[Iterable[:class:`int`]]
+            Pages to look at. By default, pages are iterated over until an empty one.
+
+        prefetch: :class:`int`
+            Maximum amount of pages fetched concurrently.
+
+        Returns
+        -------
+        AsyncIterator[:class:`.Message`]
+            Messages found.
+        """
+        fetch_page = functools.partial(self.get_page_messages, sent_or_inbox)
+        return utils.paginate(fetch_page, pages, prefetch=prefetch)
+
     @check_logged
     async def get_page_friend_requests(
         self,
@@ -1804,6 +2145,36 @@ class Client:
             FriendRequest.from_data(part, self.get_parse_dict(), client=self) for part in data
         )
 
+    @check_logged
+    def iter_friend_requests(
+        self,
+        sent_or_inbox: str = "inbox",
+        pages: Optional[Iterable[int]] = None,
+        *,
+        prefetch: int = 2,
+    ) -> AsyncIterator[FriendRequest]:
+        """Retrieve friend requests, yielding them page by page.
+
+        Parameters
+        ----------
+        sent_or_inbox: :class:`str`
+            Type of friend requests to retrieve. Either `'sent'` or `'inbox'`.
+            Defaults to the latter.
+
+        pages: Optional[Iterable[:class:`int`]]
+            Pages to look at. By default, pages are iterated over until an empty one.
+
+        prefetch: :class:`int`
+            Maximum amount of pages fetched concurrently.
+
+        Returns
+        -------
+        AsyncIterator[:class:`.FriendRequest`]
+            Friend requests found.
+        """
+        fetch_page = functools.partial(self.get_page_friend_requests, sent_or_inbox)
+        return utils.paginate(fetch_page, pages, prefetch=prefetch)
+
     @check_logged
     def get_parse_dict(self) -> ExtDict:
         return ExtDict({k: getattr(self, k) for k in ("name", "id", "account_id")})
@@ -2198,6 +2569,68 @@ class Client:
 
         return utils.unique(construct_levels(lvdata, cdata, sdata, client=self))
 
+    def iter_levels(
+        self,
+        query: Union[str, int] = "",
+        filters: Optional[Filters] = None,
+        user: Optional[Union[int, AbstractUser]] = None,
+        gauntlet: Optional[Union[int, Gauntlet]] = None,
+        pages: Optional[Iterable[int]] = None,
+        *,
+        prefetch: int = 2,
+    ) -> AsyncIterator[Level]:
+        """Search levels, yielding them page by page.
+
+        Unlike :meth:`.Client.search_levels`, only ``prefetch`` pages are requested
+        at once, and levels of each page are yielded as soon as it is parsed.
+
+        Example:
+
+        .. code-block:: python3
+
+            async for level in client.iter_levels("VorteX", filters=gd.Filters(...)):
+                print(level.name)
+
+        Parameters
+        ----------
+        query: Union[:class:`str`,:class:`int`]
+            A query to search with.
+
+        filters: :class:`.Filters`
+            Filters to apply, as an object.
+
+        user: Union[:class:`int`, :class:`.AbstractUser`]
+            A user to search levels by. (if :class:`.Filters` has parameter ``strategy``
+            equal to :class:`.SearchStrategy` ``BY_USER``. Can be omitted, then
+            logged in client is required.)
+
+        gauntlet: Union[:class:`int`, :class:`.Gauntlet`]
+            A gauntlet to get levels in. Gauntlets have only one page.
+
+        pages: Optional[Iterable[:class:`int`]]
+            Pages to look at. By default, pages are iterated over until an empty one.
+
+        prefetch: :class:`int`
+            Maximum amount of pages fetched concurrently.
+
+        Returns
+        -------
+        AsyncIterator[:class:`.Level`]
+            Levels found.
+        """
+        if gauntlet is not None:
+            pages = (0,)
+
+        # servers respond with -1 when there are no more levels
+        exclude = excluding(NothingFound, MissingAccess)
+
+        async def fetch_page(page: int) -> List[Level]:
+            return await self.search_levels_on_page(
+                page, query, filters, user, gauntlet, exclude=exclude
+            )
+
+        return utils.paginate(fetch_page, pages, prefetch=prefetch)
+
     async def on_new_daily(self, level: Level) -> Any:
         """|coro|
 
@@ -441,8 +441,8 @@ class Level(AbstractEntity):
     def has_ldm(self) -> bool:
         return bool(self.options.get("low_detail_mode"))
 
-    def open_editor(self) -> Editor:
-        return Editor.launch(self, "data")
+    def open_editor(self, lazy: bool = False) -> Editor:
+        return Editor.launch(self, "data", lazy=lazy)
 
     async def report(self) -> None:
         """|coro|
@@ -429,10 +429,15 @@ def create_app(**kwargs) -> web.Application:
     app.client = kwargs.get("client", CLIENT)
     app.tokens: List[TokenInfo] = []
     app.add_routes(routes)
+    app.on_cleanup.append(close_client)
 
     return app
 
 
+async def close_client(app: web.Application) -> None:
+    await app.client.http.close()
+
+
 def run(app: web.Application, **kwargs) -> None:
     web.run_app(app, **kwargs)
 
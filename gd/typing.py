@@ -11,6 +11,7 @@ from typing import (
     Dict,
     List,
     Set,
+    FrozenSet,
     IO,
     Generator,
     Awaitable,
@@ -42,6 +43,7 @@ __all__ = (
     "Comment",
     "FriendRequest",
     "Guidelines",
+    "HTTPClient",
     "IconSet",
     "Level",
     "Gauntlet",
@@ -53,8 +55,14 @@ __all__ = (
     "Filters",
     "Parameters",
     "Parser",
+    "RetryPolicy",
+    "FakeDatabase",
+    "FakeServer",
     "Loop",
     "Editor",
+    "ColumnarEditor",
+    "Selection",
+    "ColumnarSelection",
     "HSV",
     "LevelCollection",
     "Struct",
@@ -76,6 +84,7 @@ __all__ = (
     "Dict",
     "List",
     "Set",
+    "FrozenSet",
     "IO",
     "Generator",
     "Awaitable",
@@ -110,6 +119,7 @@ Comment = ref("gd.comment.Comment")
 FriendRequest = ref("gd.friend_request.FriendRequest")
 Guidelines = ref("gd.api.guidelines.Guidelines")
 HTMLElement = ref("lxml.html.HtmlElement")
+HTTPClient = ref("gd.utils.http_request.HTTPClient")
 XMLElement = ref("xml.etree.ElementTree.Element")
 IconSet = ref("gd.iconset.IconSet")
 Level = ref("gd.level.Level")
@@ -122,8 +132,14 @@ User = ref("gd.user.User")
 Filters = ref("gd.utils.filters.Filters")
 Parameters = ref("gd.utils.params.Parameters")
 Parser = ref("gd.utils.parser.Parser")
+RetryPolicy = ref("gd.utils.retry.RetryPolicy")
+FakeDatabase = ref("gd.utils.fake_server.FakeDatabase")
+FakeServer = ref("gd.utils.fake_server.FakeServer")
 Loop = ref("gd.utils.tasks.Loop")
 Editor = ref("gd.api.editor.Editor")
+ColumnarEditor = ref("gd.api.columnar.ColumnarEditor")
+Selection = ref("gd.api.selection.Selection")
+ColumnarSelection = ref("gd.api.selection.ColumnarSelection")
 HSV = ref("gd.api.hsv.HSV")
 LevelCollection = ref("gd.api.save.LevelCollection")
 Struct = ref("gd.api.struct.Struct")
@@ -1,11 +1,15 @@
+from collections import deque
 import asyncio
 import functools
+import itertools
 
 import inspect
 
 from gd.logging import get_logger
 from gd.typing import (
     Any,
+    AsyncIterable,
+    AsyncIterator,
     Awaitable,
     Callable,
     Coroutine,
@@ -26,6 +30,8 @@ __all__ = (
     "cancel_all_tasks",
     "shutdown_loop",
     "maybe_coroutine",
+    "paginate",
+    "map_bounded",
     "acquire_loop",
     "aiter",
     "anext",
@@ -265,6 +271,128 @@ async def maybe_coroutine(func: Callable, *args, **kwargs) -> Any:
         return value
 
 
+async def paginate(
+    fetch_page: Callable[[int], Awaitable[Sequence[Any]]],
+    pages: Optional[Iterable[int]] = None,
+    *,
+    prefetch: int = 2,
+) -> AsyncIterator[Any]:
+    """Iterate over items of pages returned by ``fetch_page``, page by page.
+
+    Up to ``prefetch`` pages are requested ahead of the one being iterated over,
+    and iteration stops at the first empty page, cancelling pages requested after it.
+
+    Example:
+
+    .. code-block:: python3
+
+        async for level in gd.utils.paginate(client.search_levels_on_page, prefetch=4):
+            print(level.name)
+
+    Parameters
+    ----------
+    fetch_page: Callable[[:class:`int`], Awaitable[Sequence[`Any`]]]
+        Function that fetches a page by its number.
+    pages: Optional[Iterable[:class:`int`]]
+        Pages to iterate over. If ``None``, iterates over ``0, 1, 2, ...`` until an empty page.
+    prefetch: :class:`int`
+        Maximum amount of pages fetched concurrently.
+    """
+    if prefetch < 1:
+        raise ValueError("Amount of pages to prefetch must be at least 1.")
+
+    pages = itertools.count() if pages is None else iter(pages)
+    pending = deque()
+
+    def schedule() -> None:
+        page = next(pages, None)
+
+        if page is not None:
+            pending.append(asyncio.ensure_future(fetch_page(page)))
+
+    try:
+        for _ in range(prefetch):
+            schedule()
+
+        while pending:
+            items = await pending.popleft()
+
+            if not items:
+                break
+
+            schedule()
+
+            for item in items:
+                yield item
+
+    finally:
+        for task in pending:
+            if task.done() and not task.cancelled():
+                task.exception()  # page is not needed anymore, silence its error
+
+            task.cancel()
+
+
+async def map_bounded(
+    func: Callable[[Any], Awaitable[Any]],
+    iterable: Union[AsyncIterable[Any], Iterable[Any]],
+    concurrency: int = 8,
+) -> AsyncIterator[Any]:
+    """Apply ``func`` to items of ``iterable``, yielding results as they complete.
+
+    At most ``concurrency`` calls are running at once, and items are only taken
+    from ``iterable`` (which can be asynchronous) when there is room for them.
+    Results are yielded in order of completion, not in order of items.
+
+    Example:
+
+    .. code-block:: python3
+
+        async for level in gd.utils.map_bounded(client.get_level, level_ids, 4):
+            print(level.name)
+
+    Parameters
+    ----------
+    func: Callable[[`Any`], Awaitable[`Any`]]
+        Function to apply.
+    iterable: Union[AsyncIterable[`Any`], Iterable[`Any`]]
+        Items to apply ``func`` to.
+    concurrency: :class:`int`
+        Maximum amount of calls running at once.
+    """
+    if concurrency < 1:
+        raise ValueError("Concurrency must be at least 1.")
+
+    is_async = hasattr(iterable, "__aiter__")
+    iterator = iterable.__aiter__() if is_async else iter(iterable)
+    exhausted = False
+    pending = set()
+
+    try:
+        while True:
+            while not exhausted and len(pending) < concurrency:
+                try:
+                    item = await iterator.__anext__() if is_async else next(iterator)
+
+                except (StopIteration, StopAsyncIteration):
+                    exhausted = True
+
+                else:
+                    pending.add(asyncio.ensure_future(func(item)))
+
+            if not pending:
+                break
+
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            for task in done:
+                yield task.result()
+
+    finally:
+        for task in pending:
+            task.cancel()
+
+
 def acquire_loop(running: bool = False) -> asyncio.AbstractEventLoop:
     """Gracefully acquire a loop.
 
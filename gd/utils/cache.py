@@ -0,0 +1,461 @@
+from collections import OrderedDict
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+
+from gd.typing import Any, Dict, Iterable, Optional, Tuple, Union
+from gd.utils.routes import Route
+from gd.utils.text_tools import make_repr
+
+__all__ = (
+    "CacheBackend",
+    "MemoryCacheBackend",
+    "SQLiteCacheBackend",
+    "ResponseCache",
+    "DEFAULT_TTLS",
+    "INVALIDATES",
+    "UNCACHEABLE",
+    "make_request_key",
+)
+
+Number = Union[float, int]
+
+# amount of seconds responses of idempotent routes are cached for
+DEFAULT_TTLS: Dict[str, Number] = {
+    Route.LEVEL_SEARCH: 60,
+    Route.DOWNLOAD_LEVEL: 60,
+    Route.GET_USER_INFO: 60,
+    Route.USER_SEARCH: 60,
+    Route.GET_USER_TOP: 300,
+    Route.GET_LEVEL_SCORES: 60,
+    Route.GET_GAUNTLETS: 3600,
+    Route.GET_MAP_PACKS: 3600,
+    Route.GET_SONG_INFO: 600,
+    Route.GET_COMMENTS: 30,
+    Route.GET_ACC_COMMENTS: 30,
+    Route.GET_COMMENT_HISTORY: 30,
+}
+
+_LEVELS = (Route.LEVEL_SEARCH, Route.DOWNLOAD_LEVEL)
+_USERS = (Route.GET_USER_INFO, Route.USER_SEARCH, Route.GET_USER_TOP)
+_COMMENTS = (Route.GET_COMMENTS, Route.GET_ACC_COMMENTS, Route.GET_COMMENT_HISTORY)
+
+# write route -> read routes which responses become stale after it
+INVALIDATES: Dict[str, Tuple[str, ...]] = {
+    Route.UPLOAD_LEVEL: _LEVELS,
+    Route.DELETE_LEVEL: _LEVELS,
+    Route.UPDATE_LEVEL_DESC: _LEVELS,
+    Route.RATE_LEVEL_STARS: _LEVELS,
+    Route.RATE_LEVEL_DEMON: _LEVELS,
+    Route.SUGGEST_LEVEL_STARS: _LEVELS,
+    Route.LIKE_ITEM: _LEVELS + _COMMENTS,
+    Route.UPLOAD_COMMENT: _COMMENTS,
+    Route.UPLOAD_ACC_COMMENT: _COMMENTS,
+    Route.DELETE_LEVEL_COMMENT: _COMMENTS,
+    Route.DELETE_ACC_COMMENT: _COMMENTS,
+    Route.UPDATE_USER_SCORE: _USERS + (Route.GET_LEVEL_SCORES,),
+    Route.UPDATE_ACC_SETTINGS: _USERS,
+}
+
+# route -> parameter -> values, requests with which are never cached, since their responses
+# change over time; e.g. IDs of daily and weekly levels resolve to different levels
+UNCACHEABLE: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    Route.DOWNLOAD_LEVEL: {"levelID": ("-1", "-2")},
+}
+
+
+def make_request_key(
+    method: str, url: Any, data: Optional[Dict[str, Any]], params: Optional[Dict[str, Any]]
+) -> str:
+    """Make a key that identifies a request, regardless of the order of its parameters."""
+    parts = [str(method).upper(), str(url)]
+
+    for mapping in (data, params):
+        if mapping:
+            parts.append("&".join(f"{key}={value}" for key, value in sorted(mapping.items())))
+        else:
+            parts.append("")
+
+    return hashlib.sha1("\n".join(parts).encode(errors="replace")).hexdigest()
+
+
+class CacheBackend:
+    """Base class for storages of :class:`.ResponseCache`.
+
+    Backends map keys to response bodies, each entry being tagged with
+    the route it belongs to and the time it expires at.
+
+    Backends that block, like ones doing disk I/O, should set ``blocking`` to ``True``,
+    so that :class:`.ResponseCache` calls them in an executor, off the event loop.
+    """
+
+    blocking = False
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get value under ``key``, or ``None`` if it is missing or expired."""
+        raise NotImplementedError
+
+    def set(self, key: str, route: str, value: bytes, ttl: Number) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+        raise NotImplementedError
+
+    def invalidate(self, route: str) -> None:
+        """Remove all entries that belong to ``route``."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    @property
+    def size(self) -> int:
+        """:class:`int`: Total size of stored values, in bytes."""
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-memory LRU storage, bounded both by amount of entries and by their total size.
+
+    Parameters
+    ----------
+    max_entries: :class:`int`
+        Maximum amount of entries to store.
+    max_bytes: :class:`int`
+        Maximum total size of values, in bytes.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[str, bytes, float]]" = OrderedDict()
+        self._routes: Dict[str, set] = {}
+        self._size = 0
+
+    def __repr__(self) -> str:
+        info = {"entries": len(self), "size": self.size}
+        return make_repr(self, info)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            route, value, expires = self._entries[key]
+        except KeyError:
+            return None
+
+        if expires <= time.time():
+            self._remove(key)
+            return None
+
+        self._entries.move_to_end(key)
+
+        return value
+
+    def set(self, key: str, route: str, value: bytes, ttl: Number) -> None:
+        if len(value) > self.max_bytes:
+            return
+
+        self._remove(key)
+
+        self._entries[key] = (route, value, time.time() + ttl)
+        self._routes.setdefault(route, set()).add(key)
+        self._size += len(value)
+
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            self._remove(next(iter(self._entries)))  # least recently used
+
+    def invalidate(self, route: str) -> None:
+        for key in tuple(self._routes.get(route, ())):
+            self._remove(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._routes.clear()
+        self._size = 0
+
+    def _remove(self, key: str) -> None:
+        try:
+            route, value, expires = self._entries.pop(key)
+        except KeyError:
+            return
+
+        self._size -= len(value)
+
+        keys = self._routes.get(route)
+
+        if keys is not None:
+            keys.discard(key)
+
+            if not keys:
+                del self._routes[route]
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """On-disk storage in an SQLite database, which can be shared by several processes.
+
+    Database calls block, for up to 30 seconds if the database is locked by another process,
+    so :class:`.ResponseCache` runs them in an executor when requests are sent.
+
+    Parameters
+    ----------
+    path: :class:`str`
+        Path to the database file. ``":memory:"`` can be used for a private database.
+    max_entries: :class:`int`
+        Maximum amount of entries to store.
+    max_bytes: :class:`int`
+        Maximum total size of values, in bytes.
+    """
+
+    blocking = True
+
+    def __init__(
+        self,
+        path: str = "gd_cache.db",
+        max_entries: int = 65536,
+        max_bytes: int = 512 * 1024 * 1024,
+    ) -> None:
+        self.path = str(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+
+        with self._lock, self._connection as connection:
+            if self.path != ":memory:":
+                connection.execute("PRAGMA journal_mode=WAL")
+
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, route TEXT NOT NULL, value BLOB NOT NULL, "
+                "size INTEGER NOT NULL, expires REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS responses_route ON responses (route)")
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+            )
+
+    def __repr__(self) -> str:
+        info = {"path": repr(self.path), "entries": len(self), "size": self.size}
+        return make_repr(self, info)
+
+    def __len__(self) -> int:
+        return self._fetch_one("SELECT COUNT(*) FROM responses")
+
+    @property
+    def size(self) -> int:
+        return self._fetch_one("SELECT COALESCE(SUM(size), 0) FROM responses")
+
+    def get(self, key: str) -> Optional[bytes]:
+        now = time.time()
+
+        with self._lock, self._connection as connection:
+            row = connection.execute(
+                "SELECT value, expires FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            value, expires = row
+
+            if expires <= now:
+                connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+
+            connection.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+
+        return bytes(value)
+
+    def set(self, key: str, route: str, value: bytes, ttl: Number) -> None:
+        if len(value) > self.max_bytes:
+            return
+
+        now = time.time()
+
+        with self._lock, self._connection as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, route, sqlite3.Binary(value), len(value), now + ttl, now),
+            )
+            connection.execute("DELETE FROM responses WHERE expires <= ?", (now,))
+
+            count, size = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+
+            if count <= self.max_entries and size <= self.max_bytes:
+                return
+
+            # evict least recently used entries until we fit
+            for old_key, old_size in connection.execute(
+                "SELECT key, size FROM responses ORDER BY accessed"
+            ).fetchall():
+                if count <= self.max_entries and size <= self.max_bytes:
+                    break
+
+                connection.execute("DELETE FROM responses WHERE key = ?", (old_key,))
+                count -= 1
+                size -= old_size
+
+    def invalidate(self, route: str) -> None:
+        with self._lock, self._connection as connection:
+            connection.execute("DELETE FROM responses WHERE route = ?", (route,))
+
+    def clear(self) -> None:
+        with self._lock, self._connection as connection:
+            connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _fetch_one(self, query: str) -> Any:
+        with self._lock:
+            return self._connection.execute(query).fetchone()[0]
+
+
+class ResponseCache:
+    """Cache of responses to idempotent requests, used by :class:`.HTTPClient`.
+
+    Only routes that have a TTL are cached; requests to other routes bypass the cache.
+    Requests to write routes (e.g. comments, likes and uploads) invalidate
+    responses of routes listed for them in ``invalidates``.
+
+    Example:
+
+    .. code-block:: python3
+
+        cache = gd.ResponseCache(gd.SQLiteCacheBackend("cache.db"))
+        client = gd.Client(cache=cache)
+
+    Parameters
+    ----------
+    backend: Optional[:class:`.CacheBackend`]
+        Storage to use. :class:`.MemoryCacheBackend` is used by default.
+    ttls: Optional[Dict[:class:`str`, Union[:class:`float`, :class:`int`]]]
+        Mapping of route to amount of seconds its responses are cached for.
+        Defaults to ``DEFAULT_TTLS``.
+    invalidates: Optional[Dict[:class:`str`, Iterable[:class:`str`]]]
+        Mapping of write route to routes which responses become stale after it.
+        Defaults to ``INVALIDATES``.
+
+    Attributes
+    ----------
+    hits: :class:`int`
+        Amount of requests that were served from the cache.
+    misses: :class:`int`
+        Amount of cacheable requests that were not found in the cache.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttls: Optional[Dict[str, Number]] = None,
+        invalidates: Optional[Dict[str, Iterable[str]]] = None,
+    ) -> None:
+        self.backend = MemoryCacheBackend() if backend is None else backend
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.invalidates = dict(INVALIDATES if invalidates is None else invalidates)
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        info = {"backend": repr(self.backend), "hits": self.hits, "misses": self.misses}
+        return make_repr(self, info)
+
+    def set_ttl(self, route: str, ttl: Optional[Number]) -> None:
+        """Set amount of seconds responses of ``route`` are cached for.
+        ``None`` or ``0`` disables caching of the route.
+        """
+        if ttl:
+            self.ttls[route] = ttl
+        else:
+            self.ttls.pop(route, None)
+            self.backend.invalidate(route)
+
+    def is_cacheable(self, route: str, data: Optional[Dict[str, Any]] = None) -> bool:
+        """Check whether responses of ``route`` to requests with ``data`` can be cached."""
+        if route not in self.ttls:
+            return False
+
+        if data:
+            for parameter, values in UNCACHEABLE.get(route, {}).items():
+                if str(data.get(parameter)) in values:
+                    return False
+
+        return True
+
+    def get(self, route: str, key: str) -> Optional[bytes]:
+        return self._count(self.backend.get(key))
+
+    async def get_async(self, route: str, key: str) -> Optional[bytes]:
+        """|coro|
+
+        Same as :meth:`.ResponseCache.get`, but blocking backends are called in an executor.
+        """
+        return self._count(await self._run(self.backend.get, key))
+
+    def set(self, route: str, key: str, value: bytes) -> None:
+        ttl = self.ttls.get(route)
+
+        if ttl:
+            self.backend.set(key, route, value, ttl)
+
+    async def set_async(self, route: str, key: str, value: bytes) -> None:
+        """|coro|
+
+        Same as :meth:`.ResponseCache.set`, but blocking backends are called in an executor.
+        """
+        ttl = self.ttls.get(route)
+
+        if ttl:
+            await self._run(self.backend.set, key, route, value, ttl)
+
+    def invalidate(self, route: str) -> None:
+        """Drop responses made stale by a request to ``route``."""
+        for stale in self.invalidates.get(route, ()):
+            self.backend.invalidate(stale)
+
+    async def invalidate_async(self, route: str) -> None:
+        """|coro|
+
+        Same as :meth:`.ResponseCache.invalidate`, but blocking backends are called
+        in an executor.
+        """
+        for stale in self.invalidates.get(route, ()):
+            await self._run(self.backend.invalidate, stale)
+
+    def _count(self, value: Optional[bytes]) -> Optional[bytes]:
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return value
+
+    async def _run(self, function: Any, *args) -> Any:
+        if not self.backend.blocking:
+            return function(*args)
+
+        return await asyncio.get_running_loop().run_in_executor(None, function, *args)
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Dict[:class:`str`, :class:`int`]: Counters of the cache."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self.backend),
+            "bytes": self.backend.size,
+        }
@@ -0,0 +1,311 @@
+from http.cookies import SimpleCookie
+from pathlib import Path
+import asyncio
+import struct
+import threading
+import time
+
+from attr import attrib, dataclass
+
+from gd.errors import HTTPError
+from gd.logging import get_logger
+from gd.typing import IO, Any, Dict, HTTPClient, Iterable, List, Optional, Tuple, Union
+from gd.utils.cache import make_request_key
+from gd.utils.text_tools import make_repr
+
+__all__ = (
+    "Cassette",
+    "CassetteRecord",
+    "Transport",
+    "RecordTransport",
+    "ReplayTransport",
+    "DEFAULT_IGNORED",
+)
+
+log = get_logger(__name__)
+
+MAGIC = b"GDCASSETTE1\n"
+# route length, key length, cookies length, content length, elapsed seconds
+HEADER = struct.Struct("<HHIId")
+
+# parameters that change between otherwise identical requests
+DEFAULT_IGNORED = ("udid", "uuid", "rs", "chk", "seed", "seed2")
+
+
+@dataclass
+class CassetteRecord:
+    route: str = attrib()
+    key: str = attrib()
+    content: bytes = attrib()
+    cookies: str = attrib(default="")
+    elapsed: float = attrib(default=0.0)
+
+    def __repr__(self) -> str:
+        info = {"route": self.route, "size": len(self.content), "elapsed": self.elapsed}
+        return make_repr(self, info)
+
+    def to_bytes(self) -> bytes:
+        route, key, cookies = self.route.encode(), self.key.encode(), self.cookies.encode()
+
+        header = HEADER.pack(len(route), len(key), len(cookies), len(self.content), self.elapsed)
+
+        return b"".join((header, route, key, cookies, self.content))
+
+    def get_cookies(self) -> SimpleCookie:
+        return SimpleCookie(self.cookies)
+
+
+class Cassette:
+    """Append-only file of recorded responses, used by :class:`.RecordTransport`
+    and :class:`.ReplayTransport`.
+
+    The file starts with a magic line, followed by records, each being a fixed-size header
+    (lengths of fields and time the request took) and the fields themselves.
+    A record cut off by a crash while being written is ignored on load.
+
+    Parameters
+    ----------
+    path: Union[:class:`str`, :class:`pathlib.Path`]
+        Path to the cassette file. It is created when the first record is appended.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self.records: Dict[str, List[CassetteRecord]] = {}
+        self._file: Optional[IO[bytes]] = None
+        self._lock = threading.Lock()
+
+        if self.path.exists():
+            self.load()
+
+    def __repr__(self) -> str:
+        info = {"path": repr(str(self.path)), "records": len(self)}
+        return make_repr(self, info)
+
+    def __len__(self) -> int:
+        return sum(map(len, self.records.values()))
+
+    def __iter__(self) -> Iterable[CassetteRecord]:
+        for records in self.records.values():
+            yield from records
+
+    def load(self) -> None:
+        """Read all records from the file."""
+        data = self.path.read_bytes()
+
+        if not data:
+            return
+
+        if not data.startswith(MAGIC):
+            raise ValueError(f"{str(self.path)!r} is not a cassette.")
+
+        offset, size = len(MAGIC), len(data)
+        self.records.clear()
+
+        while offset + HEADER.size <= size:
+            route_size, key_size, cookies_size, content_size, elapsed = HEADER.unpack_from(
+                data, offset
+            )
+            offset += HEADER.size
+
+            end = offset + route_size + key_size + cookies_size + content_size
+
+            if end > size:
+                break
+
+            route = data[offset : offset + route_size].decode()
+            offset += route_size
+
+            key = data[offset : offset + key_size].decode()
+            offset += key_size
+
+            cookies = data[offset : offset + cookies_size].decode()
+            offset += cookies_size
+
+            self.add(CassetteRecord(route, key, data[offset:end], cookies, elapsed))
+            offset = end
+
+        if offset != size:
+            log.warning(f"Ignoring incomplete record at the end of {str(self.path)!r}.")
+
+    def add(self, record: CassetteRecord) -> None:
+        self.records.setdefault(record.key, []).append(record)
+
+    def append(self, record: CassetteRecord) -> None:
+        """Add ``record`` and write it to the end of the file."""
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.path.open("ab")
+
+                if not self._file.tell():
+                    self._file.write(MAGIC)
+
+            self._file.write(record.to_bytes())
+            self._file.flush()
+
+            self.add(record)
+
+    def find(self, key: str) -> List[CassetteRecord]:
+        """Find all records of requests with ``key``, in order they were recorded."""
+        return self.records.get(key, [])
+
+    def close(self) -> None:
+        """Close the file, if it was opened for appending."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class Transport:
+    """Base class for transports, which can replace sending requests by :class:`.HTTPClient`.
+
+    Parameters
+    ----------
+    cassette: :class:`.Cassette`
+        Cassette to use.
+    ignored: Iterable[:class:`str`]
+        Names of request parameters that are not part of the canonical payload.
+    """
+
+    def __init__(self, cassette: Cassette, ignored: Iterable[str] = DEFAULT_IGNORED) -> None:
+        self.cassette = cassette
+        self.ignored = frozenset(ignored)
+
+    def __repr__(self) -> str:
+        info = {"cassette": self.cassette}
+        return make_repr(self, info)
+
+    def make_key(
+        self,
+        method: str,
+        route: Optional[str],
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+    ) -> str:
+        # base url is not a part of the key, so recordings can be replayed anywhere
+        return make_request_key(method, route, self.strip(data), self.strip(params))
+
+    def strip(self, payload: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        if not payload:
+            return payload
+
+        return {key: value for key, value in payload.items() if key not in self.ignored}
+
+    async def send(
+        self,
+        http: HTTPClient,
+        method: str,
+        url: Any,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        route: Optional[str] = None,
+    ) -> Tuple[bytes, Any]:
+        raise NotImplementedError
+
+
+class RecordTransport(Transport):
+    """Transport that sends requests through the network, appending responses to the cassette.
+
+    Example:
+
+    .. code-block:: python3
+
+        cassette = gd.Cassette("traffic.gdc")
+        client = gd.Client(transport=gd.RecordTransport(cassette))
+    """
+
+    async def send(
+        self,
+        http: HTTPClient,
+        method: str,
+        url: Any,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        route: Optional[str] = None,
+    ) -> Tuple[bytes, Any]:
+        start = time.perf_counter()
+
+        content, cookies = await http.send_request(method, url, data, params, headers, route)
+
+        elapsed = time.perf_counter() - start
+
+        cookie_string = "; ".join(f"{name}={morsel.value}" for name, morsel in cookies.items())
+
+        record = CassetteRecord(
+            route=str(route),
+            key=self.make_key(method, route, data, params),
+            content=content,
+            cookies=cookie_string,
+            elapsed=elapsed,
+        )
+        self.cassette.append(record)
+
+        return content, cookies
+
+
+class ReplayTransport(Transport):
+    """Transport that serves responses from the cassette, without any network access.
+
+    If the same request was recorded several times, recordings are served in order,
+    and the last one is repeated after that.
+
+    Parameters
+    ----------
+    cassette: :class:`.Cassette`
+        Cassette to serve responses from.
+    ignored: Iterable[:class:`str`]
+        Names of request parameters that are not part of the canonical payload.
+    simulate_timing: :class:`bool`
+        Whether to wait as long as recorded requests took before responding.
+    speed: Union[:class:`float`, :class:`int`]
+        How many times faster than recorded the timing is simulated.
+
+    Raises
+    ------
+    :exc:`.HTTPError`
+        When sending a request that was not recorded. Origin is :exc:`LookupError`.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        ignored: Iterable[str] = DEFAULT_IGNORED,
+        *,
+        simulate_timing: bool = False,
+        speed: Union[float, int] = 1,
+    ) -> None:
+        super().__init__(cassette, ignored)
+
+        self.simulate_timing = simulate_timing
+        self.speed = speed
+        self.positions: Dict[str, int] = {}
+
+    async def send(
+        self,
+        http: HTTPClient,
+        method: str,
+        url: Any,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        route: Optional[str] = None,
+    ) -> Tuple[bytes, Any]:
+        key = self.make_key(method, route, data, params)
+        records = self.cassette.find(key)
+
+        if not records:
+            raise HTTPError(LookupError(f"Request to {route!r} was not recorded."))
+
+        position = self.positions.get(key, 0)
+        self.positions[key] = position + 1
+
+        record = records[min(position, len(records) - 1)]
+
+        if self.simulate_timing:
+            await asyncio.sleep(record.elapsed / self.speed)
+
+        return record.content, record.get_cookies()
@@ -1,25 +1,53 @@
 from base64 import urlsafe_b64decode, urlsafe_b64encode
-import gzip
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import hashlib
 import random
 import string
+import struct
 import zlib
 
 # absolute import because we are deep
 from gd.logging import get_logger
-from gd.typing import List, Union
+from gd.typing import IO, Any, Iterable, Iterator, List, Optional, Sequence, Union
 
-from gd.utils.crypto.xor_cipher import XORCipher as XOR
+from gd.utils.crypto.xor_cipher import XORCipher as XOR, get_xor_table, xor_bytes
+from gd.utils.text_tools import make_repr
 
 log = get_logger(__name__)
 
 Z_GZIP_HEADER = 0x10
 Z_AUTO_HEADER = 0x20
 
-try:
-    from Crypto.Cipher import AES
-except ImportError:
-    log.warning("Failed to import pycryptodome module. MacOS save coding will not be supported.")
+CHUNK_SIZE = 1 << 20  # size of blocks that saves are streamed in
+BLOCK_SIZE = 1 << 17  # size of blocks that are deflated in parallel
+WINDOW_SIZE = 1 << 15
+SHA1_HEX_SIZE = 40
+AES_BLOCK_SIZE = 16
+SAVE_KEY = 11
+
+GZIP_MAGIC = b"\x1f\x8b"
+# magic, deflate method, no flags, no modification time, no extra flags, unix
+GZIP_HEADER = GZIP_MAGIC + b"\x08\x00\x00\x00\x00\x00\x00\x03"
+ZLIB_DEFLATED = 8
+FORMAT_HEADER_SIZE = 2
+FORMAT_WBITS = {
+    "gzip": zlib.MAX_WBITS | Z_GZIP_HEADER,
+    "zlib": zlib.MAX_WBITS,
+    "deflate": -zlib.MAX_WBITS,
+}
+
+inflated_formats: Counter = Counter()  # format -> amount of streams decompressed
+# both URL-safe and standard characters, since urlsafe_b64decode() accepts either
+BASE64_ALPHABET = (string.ascii_letters + string.digits + "-_+/").encode()
+
+
+class _MacCipherDescriptor:
+    """Descriptor of :attr:`Coder.cipher`, creating the cipher on first access."""
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        return get_mac_cipher()
 
 
 class Coder:
@@ -49,14 +77,12 @@ class Coder:
         b"\x68\x35\x40\x3b\x74\x2e\x35\x77\x33\x34\x45\x32\x52\x79\x40\x7b"
     )
 
-    try:
-        cipher = AES.new(mac_key, AES.MODE_ECB)
-    except NameError:  # AES not imported
-        pass
+    # AES cipher for macOS saves, pycryptodome is imported when it is first accessed
+    cipher = _MacCipherDescriptor()
 
     @staticmethod
-    def byte_xor(stream: bytes, key: int) -> str:
-        return bytes(byte ^ key for byte in stream).decode(errors="ignore")
+    def byte_xor(stream: Union[bytes, memoryview], key: int) -> str:
+        return xor_bytes(stream, key).decode(errors="ignore")
 
     @classmethod
     def decode_save(cls, save: Union[bytes, str], needs_xor: bool = True) -> str:
@@ -78,35 +104,129 @@ class Coder:
 
     @classmethod
     def decode_mac_save(cls, save: Union[bytes, str], *args, **kwargs) -> str:
-        if isinstance(save, str):
-            save = save.encode()
+        return b"".join(cls.decode_mac_save_stream(save)).decode(errors="ignore")
+
+    @classmethod
+    def encode_mac_save(cls, save: Union[bytes, str], *args, **kwargs) -> bytes:
+        return b"".join(cls.encode_mac_save_stream(save))
+
+    @classmethod
+    def decode_mac_save_stream(
+        cls,
+        source: Union[bytes, str, memoryview, IO[bytes]],
+        *args,
+        chunk_size: int = CHUNK_SIZE,
+        **kwargs,
+    ) -> Iterator[bytes]:
+        """Decrypt a macOS save in blocks of ``chunk_size``, yielding decrypted chunks.
+
+        Same as :meth:`Coder.decode_save_stream`, but for saves encrypted with AES,
+        as they are on macOS. Requires ``pycryptodome``.
+
+        Parameters
+        ----------
+        source: Union[:class:`bytes`, :class:`str`, :class:`memoryview`, IO[:class:`bytes`]]
+            Save to decrypt, or a binary file to read it from.
+
+        chunk_size: :class:`int`
+            Amount of bytes to process at once.
+
+        Returns
+        -------
+        Iterator[:class:`bytes`]
+            Iterator over decrypted chunks.
+        """
+        cipher = get_mac_cipher()
+        remain = b""
+        last = b""  # held back, since padding is only known to be there in the last block
+
+        for chunk in iter_chunks(source, chunk_size):
+            chunk = remain + bytes(chunk)
+
+            cut = len(chunk) - len(chunk) % AES_BLOCK_SIZE
+            remain = chunk[cut:]
+
+            if not cut:
+                continue
+
+            data = cipher.decrypt(chunk[:cut])
 
-        data = cls.cipher.decrypt(save)
+            if last:
+                yield last
 
-        last = data[-1]
-        if last < 16:
-            data = data[:-last]
+            data, last = data[:-AES_BLOCK_SIZE], data[-AES_BLOCK_SIZE:]
 
-        return data.decode(errors="ignore")
+            if data:
+                yield data
+
+        if remain:
+            raise ValueError(f"Save size should be a multiple of {AES_BLOCK_SIZE}.")
+
+        if last:
+            padding = last[-1]
+
+            if padding < AES_BLOCK_SIZE:
+                last = last[:-padding]
+
+            yield last
 
     @classmethod
-    def encode_mac_save(cls, save: Union[bytes, str], *args, **kwargs) -> bytes:
-        if isinstance(save, str):
-            save = save.encode()
+    def encode_mac_save_stream(
+        cls,
+        save: Union[bytes, str, memoryview],
+        *args,
+        chunk_size: int = CHUNK_SIZE,
+        **kwargs,
+    ) -> Iterator[bytes]:
+        """Encrypt a macOS save in blocks of ``chunk_size``, yielding encrypted chunks.
+
+        Joined together, chunks are the same as :meth:`Coder.encode_mac_save` result.
+        Requires ``pycryptodome``.
+
+        Parameters
+        ----------
+        save: Union[:class:`bytes`, :class:`str`, :class:`memoryview`]
+            Save to encrypt.
+
+        chunk_size: :class:`int`
+            Amount of bytes to process at once.
+
+        Returns
+        -------
+        Iterator[:class:`bytes`]
+            Iterator over encrypted chunks.
+        """
+        cipher = get_mac_cipher()
+        remain = b""
+
+        for chunk in iter_chunks(save, chunk_size):
+            chunk = remain + bytes(chunk)
+
+            cut = len(chunk) - len(chunk) % AES_BLOCK_SIZE
+            remain = chunk[cut:]
+
+            if cut:
+                yield cipher.encrypt(chunk[:cut])
 
-        remain = len(save) % 16
         if remain:
-            to_add = 16 - remain
-            save += bytes([to_add] * to_add)
+            padding = AES_BLOCK_SIZE - len(remain)
 
-        return cls.cipher.encrypt(save)
+            yield cipher.encrypt(remain + bytes([padding] * padding))
 
     @classmethod
-    def encode_save(cls, save: Union[bytes, str], needs_xor: bool = True) -> str:
+    def encode_save(
+        cls,
+        save: Union[bytes, str],
+        needs_xor: bool = True,
+        *,
+        level: int = zlib.Z_DEFAULT_COMPRESSION,
+        strategy: int = zlib.Z_DEFAULT_STRATEGY,
+        workers: int = 1,
+    ) -> str:
         if isinstance(save, str):
             save = save.encode()
 
-        final = urlsafe_b64encode(deflate(save))
+        final = urlsafe_b64encode(deflate(save, level, strategy, workers=workers))
 
         if needs_xor:
             final = cls.byte_xor(final, 11)
@@ -115,6 +235,151 @@ class Coder:
 
         return final
 
+    @classmethod
+    def decode_save_stream(
+        cls,
+        source: Union[bytes, str, memoryview, IO[bytes]],
+        needs_xor: bool = True,
+        chunk_size: int = CHUNK_SIZE,
+        strict: bool = False,
+    ) -> Iterator[bytes]:
+        """Decode a save in blocks of ``chunk_size``, yielding decompressed chunks.
+
+        Unlike :meth:`Coder.decode_save`, the whole save is never copied:
+        every block is XOR-ed, base64-decoded and decompressed separately,
+        so memory used apart from the result does not depend on the size of the save.
+
+        Parameters
+        ----------
+        source: Union[:class:`bytes`, :class:`str`, :class:`memoryview`, IO[:class:`bytes`]]
+            Save to decode, or a binary file to read it from.
+
+        needs_xor: :class:`bool`
+            Whether the save is XOR-ed, as local saves are.
+
+        chunk_size: :class:`int`
+            Amount of bytes to process at once.
+
+        strict: :class:`bool`
+            Whether to raise :exc:`RuntimeError` if the save is incomplete,
+            instead of yielding only what can be decompressed, like :func:`inflate`.
+
+        Returns
+        -------
+        Iterator[:class:`bytes`]
+            Iterator over decompressed chunks.
+        """
+        # skip characters that are not base64, like the decoder does; with XOR, in the same pass
+        table = get_xor_table(SAVE_KEY) if needs_xor else None
+        skip = bytes(byte for byte in range(256) if byte not in BASE64_ALPHABET)
+
+        if needs_xor:
+            skip = skip.translate(table)
+
+        decompressor = None
+        header = b""  # start of data that is not enough to detect its format yet
+        remain = b""
+
+        def decompress(data: bytes) -> Iterator[bytes]:
+            nonlocal decompressor, header
+
+            pending = True
+
+            while data or pending:
+                if decompressor is None or decompressor.eof:
+                    if header is None:  # trailing data after the end of the stream
+                        return
+
+                    data = header + data
+
+                    if len(data) < FORMAT_HEADER_SIZE:
+                        header = data
+                        return
+
+                    # concatenated gzip members are decompressed, and any other trailing data
+                    # is ignored, like inflate() does
+                    if decompressor is not None and not data.startswith(GZIP_MAGIC):
+                        header = None
+                        return
+
+                    header = b""
+                    decompressor = create_decompressor(data)
+
+                # limit output, since highly compressed data can expand a lot
+                chunk = decompressor.decompress(data, chunk_size)
+
+                if chunk:
+                    yield chunk
+
+                # if output was limited, there might be more of it even if input was consumed
+                pending = len(chunk) == chunk_size
+
+                if decompressor.eof:
+                    data = decompressor.unused_data
+                else:
+                    data = decompressor.unconsumed_tail
+
+        for chunk in iter_chunks(source, chunk_size):
+            chunk = remain + bytes(chunk).translate(table, skip)
+
+            cut = len(chunk) - len(chunk) % 4
+            remain = chunk[cut:]
+
+            yield from decompress(urlsafe_b64decode(chunk[:cut]))
+
+        if remain:
+            remain += b"=" * (4 - len(remain))
+
+            yield from decompress(urlsafe_b64decode(remain))
+
+        if decompressor is None or not decompressor.eof:
+            if strict:
+                raise RuntimeError("Failed to decompress data: save is incomplete.")
+
+            if decompressor is not None:
+                chunk = decompressor.flush()
+
+                if chunk:
+                    yield chunk
+
+    @classmethod
+    def encode_save_stream(
+        cls,
+        save: Union[bytes, str, memoryview],
+        needs_xor: bool = True,
+        chunk_size: int = CHUNK_SIZE,
+        *,
+        level: int = zlib.Z_DEFAULT_COMPRESSION,
+        strategy: int = zlib.Z_DEFAULT_STRATEGY,
+        workers: int = 1,
+    ) -> Iterator[bytes]:
+        """Encode a save in blocks of ``chunk_size``, yielding encoded chunks.
+
+        Joined together, chunks are the same as :meth:`Coder.encode_save` result, encoded.
+        See :func:`.deflate` for ``level``, ``strategy`` and ``workers``.
+
+        Parameters
+        ----------
+        save: Union[:class:`bytes`, :class:`str`, :class:`memoryview`]
+            Save to encode.
+
+        needs_xor: :class:`bool`
+            Whether to XOR the save, as local saves are.
+
+        chunk_size: :class:`int`
+            Amount of bytes to process at once.
+
+        Returns
+        -------
+        Iterator[:class:`bytes`]
+            Iterator over encoded chunks.
+        """
+        table = get_xor_table(SAVE_KEY) if needs_xor else None
+
+        compressed = iter_deflate(iter_chunks(save, chunk_size), level, strategy, workers)
+
+        return iter_base64(compressed, table)
+
     @classmethod
     def do_base64(
         cls, data: str, encode: bool = True, errors: str = "strict", safe: bool = True
@@ -216,7 +481,7 @@ class Coder:
             return XOR.cipher(key=cls.keys[type], string=cipher_stream.decode(errors="ignore"))
 
     @classmethod
-    def gen_chk(cls, type: str, values: List[Union[int, str]]) -> str:
+    def gen_chk(cls, type: str, values: Sequence[Union[int, str]]) -> str:
         """Generates a "chk" value, used in different requests to GD servers.
 
         The method is: combine_values -> add salt -> sha1 hash
@@ -228,7 +493,7 @@ class Coder:
             String representation of type, e.g. ``'comment'``.
             Used to define salt and XOR key.
 
-        values: List[Union[:class:`int`, :class:`str`]]
+        values: Sequence[Union[:class:`int`, :class:`str`]]
             List of values to generate a chk with.
 
         Returns
@@ -236,20 +501,32 @@ class Coder:
         :class:`str`
             Generated ``'chk'``, represented as string.
         """
-        salt = cls.salts.get(type, "")  # get salt
+        return get_chk_generator(type).generate(values)
+
+    @classmethod
+    def gen_chks(cls, type: str, values: Iterable[Sequence[Union[int, str]]]) -> List[str]:
+        """Generates many "chk" values of one type at once.
+
+        Same as calling :meth:`Coder.gen_chk` for every item of ``values``,
+        but salt and XOR key are only prepared once.
 
-        values.append(salt)
+        Parameters
+        ----------
+        type: :class:`str`
+            String representation of type, e.g. ``'like_rate'``.
+            Used to define salt and XOR key.
 
-        string = "".join(map(str, values))
+        values: Iterable[Sequence[Union[:class:`int`, :class:`str`]]]
+            Values of every chk to generate.
 
-        # sha1 hash
-        hashed = hashlib.sha1(string.encode()).hexdigest()
-        # XOR
-        xored = XOR.cipher(key=cls.keys[type], string=hashed)
-        # Base64
-        final = cls.do_base64(xored, encode=True)
+        Returns
+        -------
+        List[:class:`str`]
+            Generated ``'chk'`` values, in order of ``values``.
+        """
+        generate = get_chk_generator(type).generate
 
-        return final
+        return [generate(item) for item in values]
 
     @classmethod
     def unzip(cls, string: Union[bytes, str]) -> Union[bytes, str]:
@@ -280,23 +557,70 @@ class Coder:
         return final
 
     @classmethod
-    def zip(cls, string: Union[bytes, str], append_semicolon: bool = True) -> str:
+    def zip(
+        cls,
+        string: Union[bytes, str],
+        append_semicolon: bool = True,
+        *,
+        level: int = zlib.Z_DEFAULT_COMPRESSION,
+        strategy: int = zlib.Z_DEFAULT_STRATEGY,
+        workers: int = 1,
+    ) -> str:
+        """Compresses a level string.
+
+        Parameters
+        ----------
+        string: Union[:class:`bytes`, :class:`str`]
+            Level data to zip.
+
+        append_semicolon: :class:`bool`
+            Whether to add ``;`` at the end of the data, if it is missing.
+
+        level: :class:`int`
+            Compression level, from ``0`` to ``9``.
+
+        strategy: :class:`int`
+            Compression strategy, e.g. :data:`zlib.Z_FILTERED`.
+
+        workers: :class:`int`
+            Amount of threads to compress with. See :func:`.deflate`.
+
+        Returns
+        -------
+        :class:`str`
+            Zipped level data, encoded in Base64.
+        """
         if isinstance(string, bytes):
             string = string.decode(errors="ignore")
 
         if append_semicolon and not string.endswith(";"):
             string += ";"
 
-        return cls.encode_save(string, needs_xor=False)
+        return cls.encode_save(
+            string, needs_xor=False, level=level, strategy=strategy, workers=workers
+        )
 
     @classmethod
-    def gen_level_upload_seed(cls, data_string: str, chars_required: int = 50) -> str:
-        if len(data_string) < chars_required:
-            return data_string
+    def gen_level_upload_seed(
+        cls, data_string: Union[bytes, memoryview, str], chars_required: int = 50
+    ) -> str:
+        if isinstance(data_string, str):
+            if len(data_string) < chars_required:
+                return data_string
+
+            space = len(data_string) // chars_required
+
+            # strided slice only copies characters it takes, stop early to take just enough
+            return data_string[: space * chars_required : space]
 
-        space = len(data_string) // chars_required
+        view = memoryview(data_string)
 
-        return data_string[::space][:chars_required]
+        if len(view) < chars_required:
+            return view.tobytes().decode()
+
+        space = len(view) // chars_required
+
+        return view[: space * chars_required : space].tobytes().decode()
 
     @classmethod
     def gen_level_lb_seed(
@@ -310,27 +634,258 @@ class Coder:
         )
 
 
-def deflate(data: bytes) -> bytes:
-    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | Z_GZIP_HEADER)
-    data = compressor.compress(data) + compressor.flush()
+@lru_cache(maxsize=None)
+def get_mac_cipher() -> Any:
+    """Create AES cipher used for macOS saves, importing ``pycryptodome`` on the first call."""
+    try:
+        from Crypto.Cipher import AES
+
+    except ImportError as error:
+        raise ImportError(
+            "Failed to import pycryptodome module. MacOS save coding is not supported."
+        ) from error
 
-    return data
+    return AES.new(Coder.mac_key, AES.MODE_ECB)
 
 
-def inflate(data: bytes) -> bytes:
-    try:
-        return gzip.decompress(data)
-    except (gzip.BadGzipFile, zlib.error):
-        pass
+class ChkGenerator:
+    """Generator of "chk" values of one type, with salt and XOR key prepared in advance.
+
+    Parameters
+    ----------
+    key: :class:`str`
+        XOR key, e.g. ``'58281'``.
+
+    salt: :class:`str`
+        Salt to append to values.
+    """
+
+    def __init__(self, key: str, salt: str = "") -> None:
+        self.key = key
+        self.salt = salt
+
+        # sha1 hex digest is always 40 characters long, so XOR it with the key as integers
+        key_stream = (key.encode() * (SHA1_HEX_SIZE // len(key) + 1))[:SHA1_HEX_SIZE]
+        self._key_number = int.from_bytes(key_stream, "big")
+
+    def __repr__(self) -> str:
+        info = {"key": repr(self.key), "salt": repr(self.salt)}
+        return make_repr(self, info)
+
+    def generate(self, values: Sequence[Union[int, str]]) -> str:
+        string = "".join(map(str, values)) + self.salt
+
+        digest = hashlib.sha1(string.encode()).hexdigest().encode()
+
+        xored = int.from_bytes(digest, "big") ^ self._key_number
+
+        return urlsafe_b64encode(xored.to_bytes(SHA1_HEX_SIZE, "big")).decode()
+
+
+@lru_cache(maxsize=None)
+def get_chk_generator(type: str) -> ChkGenerator:
+    return ChkGenerator(Coder.keys[type], Coder.salts.get(type, ""))
+
+
+def deflate(
+    data: Union[bytes, memoryview],
+    level: int = zlib.Z_DEFAULT_COMPRESSION,
+    strategy: int = zlib.Z_DEFAULT_STRATEGY,
+    *,
+    workers: int = 1,
+    block_size: int = BLOCK_SIZE,
+) -> bytes:
+    """Compress ``data`` into a gzip stream.
+
+    With more than one worker, ``data`` is split into blocks of ``block_size``,
+    which are compressed independently in a thread pool (zlib releases the GIL),
+    each primed with the end of the previous block, and joined into one gzip stream.
+    Output is then slightly larger and differs from single-threaded one,
+    but is decompressed by anything that decompresses gzip, including the game.
+
+    Parameters
+    ----------
+    data: Union[:class:`bytes`, :class:`memoryview`]
+        Data to compress.
+
+    level: :class:`int`
+        Compression level, from ``0`` (no compression) to ``9`` (best compression).
+
+    strategy: :class:`int`
+        Compression strategy, e.g. :data:`zlib.Z_FILTERED` or :data:`zlib.Z_RLE`.
+
+    workers: :class:`int`
+        Amount of threads to compress with.
+
+    block_size: :class:`int`
+        Size of blocks that are compressed in parallel.
+
+    Returns
+    -------
+    :class:`bytes`
+        Compressed data.
+    """
+    return b"".join(iter_deflate(iter_chunks(data, block_size), level, strategy, workers))
+
+
+def iter_deflate(
+    blocks: Iterable[Union[bytes, memoryview]],
+    level: int = zlib.Z_DEFAULT_COMPRESSION,
+    strategy: int = zlib.Z_DEFAULT_STRATEGY,
+    workers: int = 1,
+) -> Iterator[bytes]:
+    if workers <= 1:
+        compressor = zlib.compressobj(
+            level, zlib.DEFLATED, zlib.MAX_WBITS | Z_GZIP_HEADER, zlib.DEF_MEM_LEVEL, strategy
+        )
+
+        for block in blocks:
+            data = compressor.compress(block)
+
+            if data:
+                yield data
+
+        yield compressor.flush()
+
+        return
+
+    yield GZIP_HEADER
+
+    checksum = size = 0
+    previous = b""
+    futures: deque = deque()
+
+    with ThreadPoolExecutor(workers) as executor:
+        for block in blocks:
+            checksum = zlib.crc32(block, checksum)
+            size += len(block)
+
+            futures.append(
+                executor.submit(deflate_block, block, previous[-WINDOW_SIZE:], level, strategy)
+            )
+            previous = block
+
+            # keep memory bounded, but every worker busy
+            while len(futures) > workers * 2:
+                yield futures.popleft().result()
+
+        while futures:
+            yield futures.popleft().result()
+
+    yield deflate_block(b"", b"", level, strategy, final=True)
+    yield struct.pack("<II", checksum, size & 0xFFFFFFFF)
+
+
+def iter_base64(blocks: Iterable[bytes], table: Optional[bytes] = None) -> Iterator[bytes]:
+    """Encode ``blocks`` in URL-safe base64, translating results with ``table``, if given.
+
+    Joined together, results are the same as encoding joined ``blocks`` at once.
+    """
+    remain = b""
+
+    for block in blocks:
+        data = remain + block
+
+        cut = len(data) - len(data) % 3  # 3 bytes are encoded into 4 characters
+        remain = data[cut:]
+
+        if cut:
+            yield urlsafe_b64encode(data[:cut]).translate(table)
+
+    if remain:
+        yield urlsafe_b64encode(remain).translate(table)
+
+
+def deflate_block(
+    block: Union[bytes, memoryview],
+    dictionary: Union[bytes, memoryview],
+    level: int,
+    strategy: int,
+    final: bool = False,
+) -> bytes:
+    args = (level, zlib.DEFLATED, -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL, strategy)
+
+    if dictionary:
+        # priming with the previous block lets the compressor refer back to it
+        compressor = zlib.compressobj(*args, zdict=bytes(dictionary))
+    else:
+        compressor = zlib.compressobj(*args)
+
+    # sync flush ends the block on a byte boundary, so blocks can be concatenated
+    mode = zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+
+    return compressor.compress(block) + compressor.flush(mode)
+
+
+def detect_format(data: bytes) -> str:
+    """Detect compression format of ``data`` from its first bytes.
+
+    Returns one of ``'gzip'``, ``'zlib'`` and ``'deflate'`` (raw deflate stream).
+    """
+    if data.startswith(GZIP_MAGIC):
+        return "gzip"
+
+    if len(data) >= FORMAT_HEADER_SIZE:
+        method, flags = data[0], data[1]
+
+        # compression method is deflate, window is valid and header checksum matches
+        if method & 0x0F == ZLIB_DEFLATED and method >> 4 <= 7 and (method << 8 | flags) % 31 == 0:
+            return "zlib"
+
+    return "deflate"
+
+
+def create_decompressor(data: bytes) -> "zlib._Decompress":
+    format = detect_format(data)
+    inflated_formats[format] += 1
+
+    return zlib.decompressobj(wbits=FORMAT_WBITS[format])
+
+
+def inflate(data: bytes, strict: bool = False) -> bytes:
+    """Decompress ``data``, detecting whether it is gzip, zlib or raw deflate from its header.
+
+    Concatenated gzip members are all decompressed, any other trailing data is ignored.
+    If ``data`` is incomplete, what can be decompressed is returned,
+    unless ``strict`` is true, in which case :exc:`RuntimeError` is raised.
+    """
+    parts = []
+
+    while True:
+        decompressor = create_decompressor(data)
 
-    # fallback and do some other attempts
-    for wbits in (zlib.MAX_WBITS | Z_AUTO_HEADER, zlib.MAX_WBITS | Z_GZIP_HEADER, zlib.MAX_WBITS):
         try:
-            decompressor = zlib.decompressobj(wbits=wbits)
-            data = decompressor.decompress(data) + decompressor.flush()
-            return data
+            parts.append(decompressor.decompress(data))
+        except zlib.error as error:
+            raise RuntimeError("Failed to decompress data.") from error
+
+        if not decompressor.eof:
+            if strict:
+                raise RuntimeError("Failed to decompress data: it is incomplete.")
+
+            parts.append(decompressor.flush())
+
+            return b"".join(parts)
+
+        data = decompressor.unused_data
+
+        if not data.startswith(GZIP_MAGIC):
+            return b"".join(parts)
+
+
+def iter_chunks(
+    source: Union[bytes, str, memoryview, IO[bytes]], chunk_size: int = CHUNK_SIZE
+) -> Iterator[Union[bytes, memoryview]]:
+    if hasattr(source, "read"):
+        for chunk in iter(lambda: source.read(chunk_size), b""):
+            yield chunk
+
+    elif isinstance(source, str):
+        for index in range(0, len(source), chunk_size):
+            yield source[index : index + chunk_size].encode()
 
-        except zlib.error:
-            pass
+    else:
+        view = memoryview(source)
 
-    raise RuntimeError("Failed to decompress data.")
+        for index in range(0, len(view), chunk_size):
+            yield view[index : index + chunk_size]
@@ -1,7 +1,12 @@
+from functools import lru_cache
 from itertools import cycle
 
 from gd.typing import Union
 
+__all__ = ("XORCipher", "xor_bytes", "key_to_string")
+
+Buffer = Union[bytes, bytearray, memoryview]
+
 
 class XORCipher:
     @staticmethod
@@ -29,11 +34,77 @@ class XORCipher:
         :class:`str`
             A string after XOR operation.
         """
-        return ("").join(chr(ord(x) ^ ord(y)) for x, y in zip(string, cycle(key_to_string(key))))
+        key = key_to_string(key)
+
+        try:
+            # every character fits into one byte, so we can XOR bytes instead
+            return xor_bytes(string.encode("latin-1"), key.encode("latin-1")).decode("latin-1")
+
+        except UnicodeEncodeError:
+            return ("").join(chr(ord(x) ^ ord(y)) for x, y in zip(string, cycle(key)))
 
     @staticmethod
-    def cipher_bytes(key: Union[bytes, int, str], stream: bytes) -> str:
-        return ("").join(chr(x ^ ord(y)) for x, y in zip(stream, cycle(key_to_string(key))))
+    def cipher_bytes(key: Union[bytes, int, str], stream: Buffer) -> str:
+        key = key_to_string(key)
+
+        try:
+            return xor_bytes(stream, key.encode("latin-1")).decode("latin-1")
+
+        except UnicodeEncodeError:
+            return ("").join(chr(x ^ ord(y)) for x, y in zip(bytes(stream), cycle(key)))
+
+
+def xor_bytes(data: Buffer, key: Union[Buffer, int]) -> bytes:
+    """XOR ``data`` with repeating ``key``.
+
+    Single-byte keys (including :class:`int` ones) are applied with :meth:`bytes.translate`,
+    longer keys by XOR-ing ``data`` and the repeated key as two big integers.
+    Both run in C, without iterating over ``data`` in Python.
+
+    Parameters
+    ----------
+    data: Union[:class:`bytes`, :class:`bytearray`, :class:`memoryview`]
+        Data to apply XOR on.
+
+    key: Union[:class:`bytes`, :class:`bytearray`, :class:`memoryview`, :class:`int`]
+        Key to XOR with. :class:`int` is treated as a single byte.
+
+    Returns
+    -------
+    :class:`bytes`
+        Data after XOR operation.
+    """
+    if isinstance(key, int):
+        return bytes(data).translate(get_xor_table(key))
+
+    key = bytes(key)
+    key_length = len(key)
+
+    if not key_length:
+        raise ValueError("Key can not be empty.")
+
+    if key_length == 1:
+        return bytes(data).translate(get_xor_table(key[0]))
+
+    length = len(data)
+
+    if not length:
+        return b""
+
+    repeated, remain = divmod(length, key_length)
+    stream = key * repeated + key[:remain]
+
+    result = int.from_bytes(data, "little") ^ int.from_bytes(stream, "little")
+
+    return result.to_bytes(length, "little")
+
+
+@lru_cache(maxsize=None)
+def get_xor_table(key: int) -> bytes:
+    if not 0 <= key < 256:
+        raise ValueError(f"Expected key to be a byte, got {key}.")
+
+    return bytes(byte ^ key for byte in range(256))
 
 
 def key_to_string(key: Union[bytes, int, str]) -> str:
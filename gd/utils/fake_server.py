@@ -0,0 +1,693 @@
+"""Local stand-in for Geometry Dash servers, for testing and benchmarking without network.
+
+.. code-block:: python3
+
+    async with FakeServer(latency=0.05, error_rate=0.01) as server:
+        client = gd.Client()
+        client.http.change_url(server.url)
+
+        level = await client.get_level(1)
+"""
+
+from collections import Counter
+import asyncio
+import random
+
+from aiohttp import web
+from yarl import URL
+
+from gd.typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FakeDatabase,
+    FakeServer,
+    List,
+    Optional,
+    Union,
+)
+from gd.utils.crypto.coders import Coder
+from gd.utils.routes import Route
+from gd.utils.text_tools import make_repr
+
+__all__ = ("FakeDatabase", "FakeServer", "make_level_data")
+
+Handler = Callable[[Dict[str, str]], Awaitable[Union[int, str]]]
+
+PAGE_SIZE = 10
+
+LEVEL_HEADER = (
+    "kS38,1_40_2_125_3_255_11_255_12_255_13_255_4_-1_6_1000_7_1_15_1_18_0_8_1|,"
+    "kA13,0,kA15,0,kA16,0,kA14,,kA6,0,kA7,0,kA17,0,kA18,0,kS39,0,kA2,0,kA3,0,"
+    "kA8,0,kA4,0,kA9,0,kA10,0,kA11,0"
+)
+
+
+def make_level_data(object_count: int) -> str:
+    """Create compressed data of a level with ``object_count`` blocks in a row."""
+    objects = (f"1,1,2,{x * 30 + 15},3,15" for x in range(object_count))
+    return Coder.zip(";".join((LEVEL_HEADER, *objects)))
+
+
+def join_fields(fields: Dict[Any, Any], delim: str = ":") -> str:
+    return delim.join(f"{key}{delim}{value}" for key, value in fields.items())
+
+
+def page_info(total: int, page: int, size: int = PAGE_SIZE) -> str:
+    return f"{total}:{page * size}:{size}"
+
+
+class FakeDatabase:
+    """Canned data served by :class:`.FakeServer`.
+
+    All entities are plain :class:`dict` objects, keyed by IDs, and can be added or changed freely.
+    """
+
+    def __init__(self) -> None:
+        self.users: Dict[int, Dict[str, Any]] = {}  # account_id -> user
+        self.levels: Dict[int, Dict[str, Any]] = {}  # level_id -> level
+        self.songs: Dict[int, Dict[str, Any]] = {}  # song_id -> song
+        self.comments: Dict[int, List[Dict[str, Any]]] = {}  # level_id -> comments
+        self.profile_comments: Dict[int, List[Dict[str, Any]]] = {}  # account_id -> comments
+        self.messages: Dict[int, List[Dict[str, Any]]] = {}  # account_id -> messages
+        self.daily = self.weekly = None
+
+    def __repr__(self) -> str:
+        info = {"users": len(self.users), "levels": len(self.levels)}
+        return make_repr(self, info)
+
+    @classmethod
+    def generate(
+        cls,
+        users: int = 10,
+        levels: int = 100,
+        comments: int = 25,
+        messages: int = 15,
+        seed: Optional[int] = 0,
+    ) -> FakeDatabase:
+        """Generate a database filled with deterministic (for the same ``seed``) data.
+
+        Account IDs start from ``71``, player IDs from ``16``, level IDs from ``1``.
+        """
+        rng = random.Random(seed)
+        database = cls()
+
+        for n in range(users):
+            database.add_user(
+                account_id=71 + n,
+                player_id=16 + n,
+                name=f"User{n}",
+                stars=rng.randrange(10000),
+                demons=rng.randrange(100),
+                diamonds=rng.randrange(10000),
+                creator_points=rng.randrange(10),
+            )
+
+        song_ids = []
+        for n in range(10):
+            song_id = 1000 + n
+            song_ids.append(song_id)
+            database.songs[song_id] = dict(
+                id=song_id, name=f"Song{n}", author=f"Artist{n}", author_id=n, size=2.5 + n
+            )
+
+        accounts = list(database.users)
+
+        for level_id in range(1, levels + 1):
+            account_id = rng.choice(accounts)
+            database.add_level(
+                level_id=level_id,
+                name=f"Level{level_id}",
+                creator=database.users[account_id]["player_id"],
+                song_id=rng.choice(song_ids),
+                stars=rng.choice((0, 0, 2, 5, 10)),
+                downloads=rng.randrange(100000),
+                likes=rng.randrange(10000),
+                object_count=rng.randrange(1, 50),
+            )
+
+            for n in range(rng.randrange(comments + 1)):
+                author = database.users[rng.choice(accounts)]
+                database.comments.setdefault(level_id, []).append(
+                    dict(
+                        id=level_id * 1000 + n,
+                        body=f"Comment #{n}",
+                        author=author["account_id"],
+                        likes=rng.randrange(100),
+                        percent=rng.randrange(101),
+                    )
+                )
+
+        for account_id in accounts:
+            for n in range(rng.randrange(comments + 1)):
+                database.profile_comments.setdefault(account_id, []).append(
+                    dict(id=account_id * 1000 + n, body=f"Post #{n}", likes=rng.randrange(100))
+                )
+
+            for n in range(rng.randrange(messages + 1)):
+                sender = database.users[rng.choice(accounts)]
+                database.messages.setdefault(account_id, []).append(
+                    dict(
+                        id=account_id * 1000 + n,
+                        sender=sender["account_id"],
+                        subject=f"Subject #{n}",
+                        body=f"Body of message #{n}.",
+                    )
+                )
+
+        if database.levels:
+            database.daily, database.weekly = 1, len(database.levels)
+
+        return database
+
+    def add_user(self, account_id: int, player_id: int, name: str, **stats) -> Dict[str, Any]:
+        user = dict(account_id=account_id, player_id=player_id, name=name)
+        user.update(stats)
+
+        self.users[account_id] = user
+        return user
+
+    def add_level(
+        self,
+        level_id: int,
+        name: str,
+        creator: int,
+        object_count: int = 10,
+        **info,
+    ) -> Dict[str, Any]:
+        level = dict(
+            id=level_id,
+            name=name,
+            creator=creator,
+            description=f"Description of {name}.",
+            data=make_level_data(object_count),
+            object_count=object_count,
+        )
+        level.update(info)
+
+        self.levels[level_id] = level
+        return level
+
+    def get_user_by_player_id(self, player_id: int) -> Optional[Dict[str, Any]]:
+        for user in self.users.values():
+            if user["player_id"] == player_id:
+                return user
+
+    def find_user(self, query: str) -> Optional[Dict[str, Any]]:
+        if query.isdigit():
+            return self.get_user_by_player_id(int(query))
+
+        query = query.lower()
+
+        for user in self.users.values():
+            if user["name"].lower() == query:
+                return user
+
+
+class FakeServer:
+    """Local aiohttp server that imitates main routes of Geometry Dash servers.
+
+    Supported routes are: level searching and downloading, timely levels,
+    user info and searching, level, profile and history comments, messages and logging in.
+    Other routes respond with ``-1``.
+
+    Parameters
+    ----------
+    database: Optional[:class:`.FakeDatabase`]
+        Data to serve. If not given, :meth:`.FakeDatabase.generate` is used.
+    latency: Union[:class:`float`, :class:`int`]
+        Seconds to wait before responding.
+    jitter: Union[:class:`float`, :class:`int`]
+        Maximum random amount of seconds added to ``latency``.
+    error_rate: :class:`float`
+        Probability of responding with ``error_status``.
+    error_status: :class:`int`
+        HTTP status of injected errors.
+    code_rate: :class:`float`
+        Probability of responding with ``-1`` error code, like overloaded servers do.
+    seed: Optional[:class:`int`]
+        Seed of random generator used for injection.
+    host: :class:`str`
+        Host to listen on.
+    port: :class:`int`
+        Port to listen on. ``0`` picks a free one.
+    """
+
+    def __init__(
+        self,
+        database: Optional[FakeDatabase] = None,
+        *,
+        latency: Union[float, int] = 0,
+        jitter: Union[float, int] = 0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        code_rate: float = 0.0,
+        seed: Optional[int] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        if database is None:
+            database = FakeDatabase.generate()
+
+        self.database = database
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.code_rate = code_rate
+        self.random = random.Random(seed)
+        self.host = host
+        self.port = port
+        self.requests: Counter = Counter()  # route -> amount of requests
+        self.runner: Optional[web.AppRunner] = None
+
+        self.handlers: Dict[str, Handler] = {
+            Route.LEVEL_SEARCH: self.search_levels,
+            Route.DOWNLOAD_LEVEL: self.download_level,
+            Route.GET_TIMELY: self.get_timely,
+            Route.GET_USER_INFO: self.get_user_info,
+            Route.USER_SEARCH: self.search_users,
+            Route.GET_COMMENTS: self.get_comments,
+            Route.GET_COMMENT_HISTORY: self.get_comment_history,
+            Route.GET_ACC_COMMENTS: self.get_profile_comments,
+            Route.GET_PRIVATE_MESSAGES: self.get_messages,
+            Route.READ_PRIVATE_MESSAGE: self.read_message,
+            Route.LOGIN: self.login,
+        }
+
+    def __repr__(self) -> str:
+        info = {"url": repr(self.url), "latency": self.latency, "error_rate": self.error_rate}
+        return make_repr(self, info)
+
+    async def __aenter__(self) -> FakeServer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    @property
+    def url(self) -> URL:
+        """:class:`yarl.URL`: Base URL to pass to :meth:`.HTTPClient.change_url`."""
+        return URL.build(scheme="http", host=self.host, port=self.port, path="/database/")
+
+    def create_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_route("*", "/database/{path:.+}", self.handle)
+        return app
+
+    async def start(self) -> URL:
+        """|coro|
+
+        Start the server, returning its :attr:`.FakeServer.url`.
+        """
+        self.runner = web.AppRunner(self.create_app(), access_log=None)
+        await self.runner.setup()
+
+        site = web.TCPSite(self.runner, self.host, self.port)
+        await site.start()
+
+        self.host, self.port = self.runner.addresses[0][:2]
+
+        return self.url
+
+    async def close(self) -> None:
+        """|coro|
+
+        Stop the server.
+        """
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
+
+    async def handle(self, request: web.Request) -> web.Response:
+        route = request.match_info["path"]
+
+        if route.endswith(".php"):
+            route = route[: -len(".php")]
+
+        self.requests[route] += 1
+
+        delay = self.latency
+
+        if self.jitter:
+            delay += self.random.uniform(0, self.jitter)
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if self.error_rate and self.random.random() < self.error_rate:
+            return web.Response(status=self.error_status)
+
+        if self.code_rate and self.random.random() < self.code_rate:
+            return web.Response(text="-1")
+
+        payload = dict(request.query)
+        payload.update(await request.post())
+
+        handler = self.handlers.get(route)
+
+        if handler is None:
+            return web.Response(text="-1")
+
+        return web.Response(text=str(await handler(payload)))
+
+    def level_to_string(self, level: Dict[str, Any], full: bool = False) -> str:
+        fields = {
+            1: level["id"],
+            2: level["name"],
+            3: Coder.do_base64(level["description"]),
+            5: level.get("version", 1),
+            6: level["creator"],
+            8: 10,
+            9: level.get("difficulty", 0),
+            10: level.get("downloads", 0),
+            12: level.get("track", 0),
+            13: 21,
+            14: level.get("likes", 0),
+            17: "",
+            43: 3,
+            25: "",
+            18: level.get("stars", 0),
+            19: level.get("featured", 0),
+            42: level.get("epic", 0),
+            45: level["object_count"],
+            15: level.get("length", 0),
+            30: 0,
+            31: 0,
+            37: 0,
+            38: 0,
+            39: 0,
+            46: 1,
+            47: 2,
+            35: level.get("song_id", 0),
+        }
+
+        if full:
+            fields.update({4: level["data"], 27: 0, 28: "1 year", 29: "1 month"})
+
+        return join_fields(fields)
+
+    def song_to_string(self, song: Dict[str, Any]) -> str:
+        fields = {
+            1: song["id"],
+            2: song["name"],
+            3: song["author_id"],
+            4: song["author"],
+            5: song["size"],
+            6: "",
+            10: f"https://audio.ngfiles.com/{song['id']}.mp3",
+            7: "",
+            8: 1,
+        }
+        return join_fields(fields, "~|~")
+
+    def user_to_search_string(self, user: Dict[str, Any]) -> str:
+        fields = {
+            1: user["name"],
+            2: user["player_id"],
+            13: user.get("coins", 0),
+            17: user.get("user_coins", 0),
+            6: "",
+            9: 1,
+            10: 0,
+            11: 3,
+            14: 0,
+            15: 0,
+            16: user["account_id"],
+            3: user.get("stars", 0),
+            8: user.get("creator_points", 0),
+            4: user.get("demons", 0),
+        }
+        return join_fields(fields)
+
+    def user_to_comment_string(self, user: Dict[str, Any]) -> str:
+        fields = {1: user["name"], 9: 1, 10: 0, 11: 3, 14: 0, 15: 0, 16: user["account_id"]}
+        return join_fields(fields, "~")
+
+    def paginate(
+        self, items: List[Any], payload: Dict[str, str], size: int = PAGE_SIZE
+    ) -> List[Any]:
+        page = int(payload.get("page", 0))
+        return items[page * size : (page + 1) * size]
+
+    async def search_levels(self, payload: Dict[str, str]) -> Union[int, str]:
+        levels = self.database.levels
+        query = payload.get("str", "")
+        strategy = int(payload.get("type", 0))
+
+        if strategy == 10:  # many levels by IDs
+            found = [levels[int(n)] for n in query.split(",") if n.isdigit() and int(n) in levels]
+
+        elif strategy == 5:  # levels by user
+            found = [level for level in levels.values() if str(level["creator"]) == query]
+
+        elif query.isdigit():
+            found = [levels[int(query)]] if int(query) in levels else []
+
+        else:
+            query = query.lower()
+            found = [level for level in levels.values() if query in level["name"].lower()]
+
+            if strategy == 1:
+                found.sort(key=lambda level: level.get("downloads", 0), reverse=True)
+            elif strategy == 2:
+                found.sort(key=lambda level: level.get("likes", 0), reverse=True)
+            else:
+                found.reverse()
+
+        page = self.paginate(found, payload)
+
+        if not page:
+            return -1
+
+        creators, songs = {}, {}
+
+        for level in page:
+            user = self.database.get_user_by_player_id(level["creator"])
+
+            if user is not None:
+                creators[user["player_id"]] = (
+                    f"{user['player_id']}:{user['name']}:{user['account_id']}"
+                )
+
+            song = self.database.songs.get(level.get("song_id"))
+
+            if song is not None:
+                songs[song["id"]] = self.song_to_string(song)
+
+        return "#".join(
+            (
+                "|".join(self.level_to_string(level) for level in page),
+                "|".join(creators.values()),
+                "~:~".join(songs.values()),
+                page_info(len(found), int(payload.get("page", 0))),
+                "fakehash",
+            )
+        )
+
+    async def download_level(self, payload: Dict[str, str]) -> Union[int, str]:
+        level_id = int(payload.get("levelID", 0))
+
+        if level_id == -1:
+            level_id = self.database.daily
+        elif level_id == -2:
+            level_id = self.database.weekly
+
+        level = self.database.levels.get(level_id)
+
+        if level is None:
+            return -1
+
+        return "#".join((self.level_to_string(level, full=True), "fakehash", "fakehash"))
+
+    async def get_timely(self, payload: Dict[str, str]) -> Union[int, str]:
+        weekly = payload.get("weekly", "0") == "1"
+        level_id = self.database.weekly if weekly else self.database.daily
+
+        if level_id is None:
+            return -1
+
+        return f"{level_id + 100000 * weekly}|3600"
+
+    async def get_user_info(self, payload: Dict[str, str]) -> Union[int, str]:
+        user = self.database.users.get(int(payload.get("targetAccountID", 0)))
+
+        if user is None:
+            return -1
+
+        fields = {
+            1: user["name"],
+            2: user["player_id"],
+            13: user.get("coins", 0),
+            17: user.get("user_coins", 0),
+            10: 0,
+            11: 3,
+            3: user.get("stars", 0),
+            46: user.get("diamonds", 0),
+            4: user.get("demons", 0),
+            8: user.get("creator_points", 0),
+            18: 0,
+            19: 0,
+            50: 0,
+            20: "",
+            21: 1,
+            22: 1,
+            23: 1,
+            24: 1,
+            25: 1,
+            26: 1,
+            28: 0,
+            43: 1,
+            47: 1,
+            30: 0,
+            16: user["account_id"],
+            31: 0,
+            44: "",
+            45: "",
+            29: 1,
+            49: 0,
+        }
+        return join_fields(fields)
+
+    async def search_users(self, payload: Dict[str, str]) -> Union[int, str]:
+        user = self.database.find_user(payload.get("str", ""))
+
+        if user is None:
+            return -1
+
+        return self.user_to_search_string(user) + "#" + page_info(1, 0)
+
+    def comments_to_string(
+        self, comments: List[Dict[str, Any]], payload: Dict[str, str], size: int = PAGE_SIZE
+    ) -> Union[int, str]:
+        page = self.paginate(comments, payload, size)
+
+        if not page:
+            return -2
+
+        parts = []
+
+        for comment in page:
+            user = self.database.users[comment["author"]]
+            fields = {
+                1: comment.get("level_id", 0),
+                2: Coder.do_base64(comment["body"]),
+                3: user["player_id"],
+                4: comment.get("likes", 0),
+                7: 0,
+                10: comment.get("percent", 0),
+                9: "1 day",
+                6: comment["id"],
+            }
+            parts.append(join_fields(fields, "~") + ":" + self.user_to_comment_string(user))
+
+        return "|".join(parts) + "#" + page_info(len(comments), int(payload.get("page", 0)), size)
+
+    async def get_comments(self, payload: Dict[str, str]) -> Union[int, str]:
+        level_id = int(payload.get("levelID", 0))
+
+        if level_id not in self.database.levels:
+            return -1
+
+        comments = [
+            dict(comment, level_id=level_id) for comment in self.database.comments.get(level_id, [])
+        ]
+
+        if payload.get("mode") == "1":
+            comments.sort(key=lambda comment: comment.get("likes", 0), reverse=True)
+
+        return self.comments_to_string(comments, payload, int(payload.get("count", PAGE_SIZE)))
+
+    async def get_comment_history(self, payload: Dict[str, str]) -> Union[int, str]:
+        user = self.database.get_user_by_player_id(int(payload.get("userID", 0)))
+
+        if user is None:
+            return -1
+
+        comments = [
+            dict(comment, level_id=level_id)
+            for level_id, level_comments in self.database.comments.items()
+            for comment in level_comments
+            if comment["author"] == user["account_id"]
+        ]
+
+        return self.comments_to_string(comments, payload)
+
+    async def get_profile_comments(self, payload: Dict[str, str]) -> Union[int, str]:
+        comments = self.database.profile_comments.get(int(payload.get("accountID", 0)), [])
+        page = self.paginate(comments, payload)
+
+        if not page:
+            return "#" + page_info(len(comments), int(payload.get("page", 0)))
+
+        parts = (
+            join_fields(
+                {
+                    2: Coder.do_base64(comment["body"]),
+                    4: comment.get("likes", 0),
+                    9: "1 week",
+                    6: comment["id"],
+                },
+                "~",
+            )
+            for comment in page
+        )
+
+        return "|".join(parts) + "#" + page_info(len(comments), int(payload.get("page", 0)))
+
+    def message_to_string(self, message: Dict[str, Any], full: bool = False) -> str:
+        sender = self.database.users[message["sender"]]
+        fields = {
+            6: sender["name"],
+            3: sender["player_id"],
+            2: sender["account_id"],
+            1: message["id"],
+            4: Coder.do_base64(message["subject"]),
+            8: int(message.get("read", False)),
+            9: 0,
+            7: "1 hour",
+        }
+
+        if full:
+            fields[5] = Coder.encode(type="message", string=message["body"])
+
+        return join_fields(fields)
+
+    async def get_messages(self, payload: Dict[str, str]) -> Union[int, str]:
+        account_id = int(payload.get("accountID", 0))
+
+        if account_id not in self.database.users:
+            return -1
+
+        messages = self.database.messages.get(account_id, [])
+        page = self.paginate(messages, payload)
+
+        if not page:
+            return -2
+
+        return (
+            "|".join(self.message_to_string(message) for message in page)
+            + "#"
+            + page_info(len(messages), int(payload.get("page", 0)))
+        )
+
+    async def read_message(self, payload: Dict[str, str]) -> Union[int, str]:
+        messages = self.database.messages.get(int(payload.get("accountID", 0)), [])
+        message_id = int(payload.get("messageID", 0))
+
+        for message in messages:
+            if message["id"] == message_id:
+                message["read"] = True
+                return self.message_to_string(message, full=True)
+
+        return -1
+
+    async def login(self, payload: Dict[str, str]) -> Union[int, str]:
+        user = self.database.find_user(payload.get("userName", ""))
+
+        if user is None:
+            return -1
+
+        return f"{user['account_id']},{user['player_id']}"
@@ -1,24 +1,73 @@
 import asyncio
 import platform
+import time
 
 from yarl import URL
 import aiohttp
 
 import gd
 
-from gd.typing import Any, Dict, List, Optional, Tuple, Type, Union
+from gd.typing import Any, Dict, HTTPClient, Iterable, List, Optional, Tuple, Type, Union
 from gd.logging import get_logger
 from gd.errors import HTTPError
+from gd.utils.async_utils import acquire_loop
+from gd.utils.cache import DEFAULT_TTLS, ResponseCache, make_request_key
+from gd.utils.cassette import Transport
+from gd.utils.metrics import HTTPMetrics
+from gd.utils.rate_limiter import RateLimiter
+from gd.utils.retry import RetryPolicy
+from gd.utils.routes import Route
 from gd.utils.text_tools import make_repr
 
 log = get_logger(__name__)
 
 BASE = "http://www.boomlings.com/database/"
 VALID_ERRORS = (OSError, aiohttp.ClientError)
+# routes which concurrent identical requests can share one response
+SINGLE_FLIGHT_ROUTES = frozenset((*DEFAULT_TTLS, Route.GET_TIMELY))
 
 
 class HTTPClient:
-    """Class that handles the main part of the entire gd.py - sending HTTP requests."""
+    """Class that handles the main part of the entire gd.py - sending HTTP requests.
+
+    All requests are sent through one long-lived :class:`aiohttp.ClientSession`,
+    which is created lazily on the first request and keeps a pool of connections
+    alive between requests. The session is released with :meth:`HTTPClient.close`,
+    or automatically when the client is used as an async context manager:
+
+    .. code-block:: python3
+
+        async with gd.HTTPClient() as http:
+            await http.request(gd.Route.GET_GAUNTLETS, gd.Params().create_new().finish())
+
+    Parameters
+    ----------
+    limit: :class:`int`
+        Total amount of simultaneous connections in the pool. ``0`` means no limit.
+    limit_per_host: :class:`int`
+        Amount of simultaneous connections to one host. ``0`` means no limit.
+    keepalive_timeout: Union[:class:`float`, :class:`int`]
+        Amount of seconds idle connections are kept alive for.
+    ttl_dns_cache: Optional[:class:`int`]
+        Amount of seconds DNS lookups are cached for. ``None`` caches them forever.
+    retry_policy: Optional[:class:`.RetryPolicy`]
+        Default policy to retry failed requests with. By default, requests are not retried.
+        Policies for specific routes can be set with :meth:`HTTPClient.set_retry_policy`.
+    cache: Optional[:class:`.ResponseCache`]
+        Cache to serve responses of idempotent requests from. Disabled by default.
+    single_flight: :class:`bool`
+        Whether concurrent identical requests to read-only routes should share
+        one request to the server, instead of sending one each. Enabled by default.
+    rate_limiter: Optional[:class:`.RateLimiter`]
+        Limiter that requests wait on before being sent. Disabled by default.
+    metrics: Optional[:class:`.HTTPMetrics`]
+        Collector of request metrics. Disabled by default.
+    trace_configs: Iterable[:class:`aiohttp.TraceConfig`]
+        Additional trace configs to install into sessions, to hook into requests.
+    transport: Optional[:class:`.Transport`]
+        Transport to pass requests to instead of sending them, for instance
+        :class:`.RecordTransport` or :class:`.ReplayTransport`. Disabled by default.
+    """
 
     def __init__(
         self,
@@ -30,6 +79,17 @@ class HTTPClient:
         proxy_auth: Optional[aiohttp.BasicAuth] = None,
         timeout: Union[float, int] = 150,
         max_requests: int = 250,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: Union[float, int] = 15,
+        ttl_dns_cache: Optional[int] = 10,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        single_flight: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        metrics: Optional[HTTPMetrics] = None,
+        trace_configs: Iterable[aiohttp.TraceConfig] = (),
+        transport: Optional[Transport] = None,
         debug: bool = False,
         **kwargs,
     ) -> None:
@@ -40,8 +100,32 @@ class HTTPClient:
         self.proxy = proxy
         self.proxy_auth = proxy_auth
         self.timeout = timeout
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.retry_policy = RetryPolicy.never() if retry_policy is None else retry_policy
+        self.route_retry_policies: Dict[str, RetryPolicy] = {}
+        self.cache = cache
+        self.single_flight = single_flight
+        self.single_flight_routes = set(SINGLE_FLIGHT_ROUTES)
+        self.coalesced = 0  # amount of requests that shared a response of another one
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics
+        self.trace_configs = list(trace_configs)
+        self.transport = transport
         self.debug = debug
         self.last_result = None  # for testing
+        self.session = None
+        self._session_loop = None
+        self._retired_sessions: List[Tuple[aiohttp.ClientSession, asyncio.AbstractEventLoop]] = []
+
+    async def __aenter__(self) -> HTTPClient:
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
 
     def __repr__(self) -> str:
         info = {
@@ -74,6 +158,80 @@ class HTTPClient:
     def make_timeout(self) -> aiohttp.ClientTimeout:
         return aiohttp.ClientTimeout(total=self.timeout)
 
+    def make_connector(self) -> aiohttp.TCPConnector:
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+        )
+
+    def make_trace_configs(self) -> List[aiohttp.TraceConfig]:
+        trace_configs = list(self.trace_configs)
+
+        if self.metrics is not None:
+            trace_configs.append(self.metrics.trace_config)
+
+        return trace_configs
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """Get the :class:`aiohttp.ClientSession` requests are sent with.
+
+        A new session is created if there is none, if it was closed,
+        or if it is bound to an event loop other than the running one.
+        In the latter case, the old session is closed along with the client.
+
+        .. note::
+
+            This function should be called from within a running event loop.
+        """
+        loop = acquire_loop(running=True)
+
+        if self.session is None or self.session.closed or self._session_loop is not loop:
+            if self.session is not None and not self.session.closed:
+                self._retired_sessions.append((self.session, self._session_loop))
+
+            self.session = aiohttp.ClientSession(
+                connector=self.make_connector(),
+                cookie_jar=aiohttp.DummyCookieJar(),  # keep requests independent, like before
+                trace_configs=self.make_trace_configs(),
+            )
+            self._session_loop = loop
+
+        return self.session
+
+    async def close(self) -> None:
+        """|coro|
+
+        Close the underlying session, releasing all pooled connections.
+        Sessions left from other event loops are closed in their own loops,
+        so their connectors are released as well.
+        Subsequent requests will open a new session.
+        """
+        sessions = [(self.session, self._session_loop), *self._retired_sessions]
+
+        self.session = self._session_loop = None
+        self._retired_sessions.clear()
+
+        running_loop = asyncio.get_running_loop()
+
+        for session, loop in sessions:
+            if session is None or session.closed:
+                continue
+
+            if loop is None or loop is running_loop:
+                await session.close()
+
+            elif loop.is_closed():
+                # connections died along with their loop, nothing to release.
+                continue
+
+            elif loop.is_running():  # running in another thread
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(session.close(), loop))
+
+            else:  # only one loop can run in a thread, so run the other one in an executor
+                await running_loop.run_in_executor(None, loop.run_until_complete, session.close())
+
     def change_url(self, url: Union[str, URL]) -> None:
         """Change base for requests.
         Default base is ``http://www.boomlings.com/database/``,
@@ -101,6 +259,79 @@ class HTTPClient:
         """
         self.semaphore = asyncio.Semaphore(value, loop=loop)
 
+    def set_retry_policy(self, policy: Optional[RetryPolicy], *routes: str) -> None:
+        r"""Set policy to retry failed requests with.
+
+        Parameters
+        ----------
+        policy: Optional[:class:`.RetryPolicy`]
+            Policy to set. If ``None``, requests are not retried, or, if ``routes``
+            are given, their policies are reset to the default one.
+        \*routes: :class:`str`
+            Routes to set the policy for, e.g. ``gd.Route.LEVEL_SEARCH``.
+            If omitted, the default policy is set.
+        """
+        if not routes:
+            self.retry_policy = RetryPolicy.never() if policy is None else policy
+
+        for route in routes:
+            if policy is None:
+                self.route_retry_policies.pop(route, None)
+            else:
+                self.route_retry_policies[route] = policy
+
+    def get_retry_policy(self, route: str) -> RetryPolicy:
+        """Get policy that requests to ``route`` are retried with."""
+        return self.route_retry_policies.get(route, self.retry_policy)
+
+    def set_cache(self, cache: Optional[ResponseCache]) -> None:
+        """Set cache to serve responses from. ``None`` disables caching.
+
+        Parameters
+        ----------
+        cache: Optional[:class:`.ResponseCache`]
+            Cache to set.
+        """
+        self.cache = cache
+
+    def set_rate_limiter(self, rate_limiter: Optional[RateLimiter]) -> None:
+        """Set limiter to wait on before sending requests. ``None`` disables limiting.
+
+        Parameters
+        ----------
+        rate_limiter: Optional[:class:`.RateLimiter`]
+            Limiter to set.
+        """
+        self.rate_limiter = rate_limiter
+
+    def set_metrics(self, metrics: Optional[HTTPMetrics]) -> None:
+        """Set collector of request metrics. ``None`` disables collecting.
+
+        Since trace configs can not be changed in an existing session,
+        following requests are sent through a new one; the current session
+        is closed along with the client.
+
+        Parameters
+        ----------
+        metrics: Optional[:class:`.HTTPMetrics`]
+            Metrics collector to set.
+        """
+        self.metrics = metrics
+
+        if self.session is not None:
+            self._retired_sessions.append((self.session, self._session_loop))
+            self.session = self._session_loop = None
+
+    def set_transport(self, transport: Optional[Transport]) -> None:
+        """Set transport to pass requests to. ``None`` sends requests through the network.
+
+        Parameters
+        ----------
+        transport: Optional[:class:`.Transport`]
+            Transport to set.
+        """
+        self.transport = transport
+
     def set_debug(self, debug: bool = False) -> None:
         """Set http client debugging.
 
@@ -172,63 +403,215 @@ class HTTPClient:
 
         method = str(method).upper()
 
-        headers = None
+        headers = self.make_headers()
 
         if cookie is not None:
-            headers = {"Cookie": cookie}
+            headers["Cookie"] = cookie
 
         if self.debug:
             for name, value in {"URL": url, "Data": data, "Params": params}.items():
                 log.debug(f"{name}: {value}")
 
-        async with self.semaphore, aiohttp.ClientSession(
-            headers=self.make_headers(),
-            skip_auto_headers=self.make_skip_headers(),
-            timeout=self.make_timeout(),
-            raise_for_status=True,
-        ) as client:
+        cache, key, content = self.cache, None, None
+        shareable = cookie is None and not get_cookies
+
+        cacheable = shareable and cache is not None and cache.is_cacheable(php, data)
+
+        if cacheable:
+            key = make_request_key(method, url, data, params)
+            content = await cache.get_async(php, key)
+
+        if content is None:
+            if shareable and self.single_flight and php in self.single_flight_routes:
+                if key is None:
+                    key = make_request_key(method, url, data, params)
+
+                content, cookies = await self.send_single_flight(
+                    key, method, url, data, params, headers, route=php
+                )
+
+            else:
+                content, cookies = await self.send(method, url, data, params, headers, route=php)
+
+            if cacheable and not is_error_code(content):
+                await cache.set_async(php, key, content)
+
+        if cache is not None:
+            await cache.invalidate_async(php)
+
+        if self.debug:
+            self.last_result = content.decode(errors="replace")
+
+            result = self.last_result
+            if len(result) > 1000:
+                result = result[:1000] + "..."
+
+            log.debug(f"Response: {result}")
+
+        try:
+            res = content.decode()
+
             try:
-                resp = await client.request(
+                return int(res)
+
+            except ValueError:
+                pass
+
+        except UnicodeDecodeError:
+            res = content
+
+        if get_cookies:
+            c = str(cookies).split(" ").pop(1)
+            return res, c
+
+        return res
+
+    async def send(
+        self,
+        method: str,
+        url: URL,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        route: Optional[str] = None,
+    ) -> Tuple[bytes, Any]:
+        """|coro|
+
+        Send a request, bypassing any processing done by :meth:`HTTPClient.fetch`.
+        If :attr:`HTTPClient.transport` is set, the request is passed to it,
+        otherwise it is sent to a server with :meth:`HTTPClient.send_request`.
+
+        Returns
+        -------
+        Tuple[:class:`bytes`, :class:`http.cookies.SimpleCookie`]
+            Body of the response and cookies that were set by the server.
+
+        Raises
+        ------
+        :exc:`.HTTPError`
+            An exception occured during handling request/response.
+        """
+        if self.transport is not None:
+            return await self.transport.send(self, method, url, data, params, headers, route)
+
+        return await self.send_request(method, url, data, params, headers, route)
+
+    async def send_request(
+        self,
+        method: str,
+        url: URL,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        route: Optional[str] = None,
+    ) -> Tuple[bytes, Any]:
+        """|coro|
+
+        Send a request to a server through the network.
+        If :attr:`HTTPClient.rate_limiter` is set, waits for it first, using ``route``.
+
+        Returns
+        -------
+        Tuple[:class:`bytes`, :class:`http.cookies.SimpleCookie`]
+            Body of the response and cookies that were set by the server.
+
+        Raises
+        ------
+        :exc:`.HTTPError`
+            An exception occured during handling request/response.
+        """
+        rate_limiter, metrics = self.rate_limiter, self.metrics
+
+        if metrics is not None:
+            start = time.perf_counter()
+
+        if rate_limiter is not None:
+            await rate_limiter.acquire(route)
+
+            if metrics is not None:
+                now = time.perf_counter()
+                metrics.observe_rate_limit_wait(now - start)
+                start = now
+
+        async with self.semaphore:
+            if metrics is not None:
+                metrics.observe_semaphore_wait(time.perf_counter() - start)
+
+            try:
+                async with self.get_session().request(
                     method=method,
                     url=url,
                     data=data,
                     params=params,
                     headers=headers,
+                    skip_auto_headers=self.make_skip_headers(),
+                    timeout=self.make_timeout(),
+                    raise_for_status=True,
                     proxy=self.proxy,
                     proxy_auth=self.proxy_auth,
-                )
+                    trace_request_ctx=route,
+                ) as resp:
+                    content = await resp.read()
+
+                    if self.debug:
+                        log.debug(f"Headers: {dict(resp.request_info.headers)!r}")
+
+                    cookies = resp.cookies
+
             except VALID_ERRORS as exc:
+                if rate_limiter is not None:
+                    rate_limiter.report(route, False)
+
                 raise HTTPError(exc) from None
 
-            data = await resp.content.read()
+        if rate_limiter is not None or metrics is not None:
+            code = get_error_code(content)
 
-            if self.debug:
-                log.debug(f"Headers: {dict(resp.request_info.headers)!r}")
-                self.last_result = data.decode(errors="replace")
+            if rate_limiter is not None:
+                rate_limiter.report_code(route, code)
 
-                result = self.last_result
-                if len(result) > 1000:
-                    result = result[:1000] + "..."
+            if metrics is not None and code is not None:
+                metrics.observe_code(route, code)
 
-                log.debug(f"Response: {result}")
+        return content, cookies
 
-            try:
-                res = data.decode()
+    async def send_single_flight(
+        self,
+        key: str,
+        method: str,
+        url: URL,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        route: Optional[str] = None,
+    ) -> Tuple[bytes, Any]:
+        """|coro|
+
+        Same as :meth:`HTTPClient.send`, except that concurrent calls with the same ``key``
+        share one request: the first call sends it and others wait for its response.
+        """
+        future = self._in_flight.get(key)
+
+        if future is None:
+            future = asyncio.ensure_future(
+                self.send(method, url, data, params, headers, route=route)
+            )
+            future.add_done_callback(lambda done: self._forget_in_flight(key, done))
 
-                try:
-                    return int(res)
+            self._in_flight[key] = future
 
-                except ValueError:
-                    pass
+        else:
+            self.coalesced += 1
 
-            except UnicodeDecodeError:
-                res = data
+        # shield the request, so it is not cancelled along with one of the waiters
+        return await asyncio.shield(future)
 
-            if get_cookies:
-                c = str(resp.cookies).split(" ").pop(1)
-                return res, c
+    def _forget_in_flight(self, key: str, future: asyncio.Future) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
 
-            return res
+        if not future.cancelled():
+            future.exception()  # mark as retrieved, waiters have already got it
 
     async def request(
         self,
@@ -243,6 +626,7 @@ class HTTPClient:
         should_map: bool = False,
         get_cookies: bool = False,
         cookie: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
     ) -> Optional[Union[bytes, str, int]]:
         """|coro|
         A handy shortcut for fetching response from a server and formatting it.
@@ -254,6 +638,8 @@ class HTTPClient:
             A dictionary that response is checked against. ``Exception`` can be any Exception.
         exclude: Tuple[Type[:exc:`BaseException`]]
             Types of errors to ignore.
+        retry_policy: Optional[:class:`.RetryPolicy`]
+            Policy to retry the request with. If not given, the policy of ``route`` is used.
 
         Raises
         ------
@@ -275,9 +661,17 @@ class HTTPClient:
             data = {}
         if error_codes is None:
             error_codes = {}
+        if retry_policy is None:
+            retry_policy = self.get_retry_policy(route)
 
         try:
-            resp = await self.fetch(
+            fetch = self.fetch
+
+            if self.metrics is not None:
+                fetch = self.metrics.count_attempts(route, fetch)
+
+            resp = await retry_policy.call(
+                fetch,
                 php=route,
                 data=data,
                 params=params,
@@ -314,28 +708,47 @@ class HTTPClient:
         if params is None:
             params = {}
 
-        async with aiohttp.ClientSession(timeout=self.make_timeout()) as client:
-            try:
-                resp = await client.request(
-                    method=method, url=url, data=data, params=params, **kwargs
-                )
-                data = await resp.content.read()
+        kwargs.setdefault("timeout", self.make_timeout())
 
-            except VALID_ERRORS as exc:
-                raise HTTPError(exc) from None
+        try:
+            async with self.get_session().request(
+                method=method, url=url, data=data, params=params, **kwargs
+            ) as resp:
+                data = await resp.read()
+                request_headers = resp.request_info.headers
+
+        except VALID_ERRORS as exc:
+            raise HTTPError(exc) from None
 
-            if self.debug:
-                for name, value in {
-                    "URL": url,
-                    "Data": data,
-                    "Params": params,
-                    "Headers": dict(resp.request_info.headers),
-                }.items():
-                    log.debug(f"{name}: {value}")
+        if self.debug:
+            for name, value in {
+                "URL": url,
+                "Data": data,
+                "Params": params,
+                "Headers": dict(request_headers),
+            }.items():
+                log.debug(f"{name}: {value}")
 
         return data
 
 
+def is_error_code(content: bytes) -> bool:
+    return get_error_code(content) is not None
+
+
+def get_error_code(content: bytes) -> Optional[int]:
+    try:
+        code = int(content)
+    except ValueError:
+        return None
+
+    # positive integers are successful replies, like 1 or IDs of uploaded levels or comments
+    if code < 0:
+        return code
+
+    return None
+
+
 def call_if_possible(some: Any) -> Any:
     if callable(some):
         return some()
@@ -0,0 +1,292 @@
+from bisect import bisect_left
+from collections import Counter
+import time
+
+import aiohttp
+
+from gd.typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Union
+from gd.utils.text_tools import make_repr
+
+__all__ = ("Histogram", "RouteMetrics", "HTTPMetrics", "DEFAULT_BUCKETS")
+
+Number = Union[float, int]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+OTHER = "other"  # label of requests that are not sent to any route, e.g. to Newgrounds
+
+
+class Histogram:
+    """Histogram of observed values, with fixed upper bounds of buckets.
+
+    Parameters
+    ----------
+    buckets: Sequence[Union[:class:`float`, :class:`int`]]
+        Upper bounds of buckets, in ascending order.
+    """
+
+    def __init__(self, buckets: Sequence[Number] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last one is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def __repr__(self) -> str:
+        info = {"count": self.count, "sum": self.sum}
+        return make_repr(self, info)
+
+    def observe(self, value: Number) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> List[int]:
+        """Cumulative counts of buckets, as in Prometheus (``le`` semantics)."""
+        result, total = [], 0
+
+        for count in self.counts:
+            total += count
+            result.append(total)
+
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        bounds = [*map(str, self.buckets), "+Inf"]
+
+        return {
+            "buckets": dict(zip(bounds, self.cumulative())),
+            "count": self.count,
+            "sum": self.sum,
+        }
+
+
+class RouteMetrics:
+    """Metrics of requests to one route."""
+
+    def __init__(self, buckets: Sequence[Number] = DEFAULT_BUCKETS) -> None:
+        self.latency = Histogram(buckets)
+        self.requests = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.retries = 0
+        self.statuses: Counter = Counter()  # HTTP status -> amount
+        self.codes: Counter = Counter()  # GD error code -> amount
+        self.errors: Counter = Counter()  # exception name -> amount
+
+    def __repr__(self) -> str:
+        info = {"requests": self.requests, "retries": self.retries}
+        return make_repr(self, info)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "latency": self.latency.snapshot(),
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "retries": self.retries,
+            "statuses": dict(self.statuses),
+            "codes": dict(self.codes),
+            "errors": dict(self.errors),
+        }
+
+
+class HTTPMetrics:
+    """Collector of :class:`.HTTPClient` metrics.
+
+    Latency, statuses, bytes and transport errors are collected with
+    :class:`aiohttp.TraceConfig` hooks; latency is measured from the start of a request
+    until its response headers are received. Time spent waiting for the rate limiter
+    and for the request semaphore, retries and error codes returned by servers
+    are reported by the client itself.
+
+    When the client has no metrics, none of the hooks are installed.
+
+    Example:
+
+    .. code-block:: python3
+
+        metrics = gd.HTTPMetrics()
+        client = gd.Client(metrics=metrics)
+
+        ...
+
+        print(metrics.snapshot())
+        print(metrics.to_prometheus())
+
+    Parameters
+    ----------
+    buckets: Sequence[Union[:class:`float`, :class:`int`]]
+        Upper bounds of latency histogram buckets, in seconds.
+    """
+
+    def __init__(self, buckets: Sequence[Number] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.routes: Dict[str, RouteMetrics] = {}
+        self.semaphore_wait = Histogram(buckets)
+        self.rate_limit_wait = Histogram(buckets)
+        self.trace_config = self.create_trace_config()
+
+    def __repr__(self) -> str:
+        info = {"routes": len(self.routes)}
+        return make_repr(self, info)
+
+    def get_route(self, route: Optional[str]) -> RouteMetrics:
+        if route is None:
+            route = OTHER
+
+        metrics = self.routes.get(route)
+
+        if metrics is None:
+            metrics = self.routes[route] = RouteMetrics(self.buckets)
+
+        return metrics
+
+    def reset(self) -> None:
+        """Forget everything collected so far."""
+        self.routes.clear()
+        self.semaphore_wait = Histogram(self.buckets)
+        self.rate_limit_wait = Histogram(self.buckets)
+
+    def observe_semaphore_wait(self, seconds: Number) -> None:
+        self.semaphore_wait.observe(seconds)
+
+    def observe_rate_limit_wait(self, seconds: Number) -> None:
+        self.rate_limit_wait.observe(seconds)
+
+    def observe_code(self, route: Optional[str], code: int) -> None:
+        if code < 0:  # other integers are successful replies, not errors
+            self.get_route(route).codes[code] += 1
+
+    def count_attempts(
+        self, route: Optional[str], func: Callable[..., Awaitable[Any]]
+    ) -> Callable[..., Awaitable[Any]]:
+        """Wrap ``func`` so that every call after the first one is counted as a retry."""
+        metrics = self.get_route(route)
+        attempted = False
+
+        async def attempt(*args, **kwargs) -> Any:
+            nonlocal attempted
+
+            if attempted:
+                metrics.retries += 1
+
+            attempted = True
+
+            return await func(*args, **kwargs)
+
+        return attempt
+
+    def create_trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+
+        trace_config.on_request_start.append(self.on_request_start)
+        trace_config.on_request_end.append(self.on_request_end)
+        trace_config.on_request_exception.append(self.on_request_exception)
+        trace_config.on_request_chunk_sent.append(self.on_request_chunk_sent)
+        trace_config.on_response_chunk_received.append(self.on_response_chunk_received)
+
+        return trace_config
+
+    async def on_request_start(self, session: Any, context: Any, params: Any) -> None:
+        context.start = time.perf_counter()
+        self.get_route(context.trace_request_ctx).requests += 1
+
+    async def on_request_end(self, session: Any, context: Any, params: Any) -> None:
+        metrics = self.get_route(context.trace_request_ctx)
+        metrics.latency.observe(time.perf_counter() - context.start)
+        metrics.statuses[params.response.status] += 1
+
+    async def on_request_exception(self, session: Any, context: Any, params: Any) -> None:
+        metrics = self.get_route(context.trace_request_ctx)
+        metrics.latency.observe(time.perf_counter() - context.start)
+
+        error = params.exception
+
+        if isinstance(error, aiohttp.ClientResponseError):
+            metrics.statuses[error.status] += 1
+        else:
+            metrics.errors[type(error).__name__] += 1
+
+    async def on_request_chunk_sent(self, session: Any, context: Any, params: Any) -> None:
+        self.get_route(context.trace_request_ctx).bytes_sent += len(params.chunk)
+
+    async def on_response_chunk_received(self, session: Any, context: Any, params: Any) -> None:
+        self.get_route(context.trace_request_ctx).bytes_received += len(params.chunk)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get all metrics collected so far, as a JSON-serializable :class:`dict`."""
+        return {
+            "routes": {route: metrics.snapshot() for route, metrics in self.routes.items()},
+            "semaphore_wait": self.semaphore_wait.snapshot(),
+            "rate_limit_wait": self.rate_limit_wait.snapshot(),
+        }
+
+    def to_prometheus(self, prefix: str = "gd_http") -> str:
+        """Format all metrics collected so far in Prometheus text exposition format."""
+        lines = []
+
+        def header(name: str, kind: str, description: str) -> None:
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+        def sample(name: str, value: Number, **labels: Any) -> None:
+            if labels:
+                formatted = ",".join(
+                    f'{key}="{escape_label(value)}"' for key, value in labels.items()
+                )
+                lines.append(f"{prefix}_{name}{{{formatted}}} {value}")
+            else:
+                lines.append(f"{prefix}_{name} {value}")
+
+        def histogram(name: str, histogram: Histogram, **labels: Any) -> None:
+            bounds = [*map(str, histogram.buckets), "+Inf"]
+
+            for bound, count in zip(bounds, histogram.cumulative()):
+                sample(f"{name}_bucket", count, **labels, le=bound)
+
+            sample(f"{name}_sum", histogram.sum, **labels)
+            sample(f"{name}_count", histogram.count, **labels)
+
+        routes = sorted(self.routes.items())
+
+        header("request_duration_seconds", "histogram", "Time until response headers.")
+        for route, metrics in routes:
+            histogram("request_duration_seconds", metrics.latency, route=route)
+
+        counters = (
+            ("requests_total", "requests", "Requests sent."),
+            ("sent_bytes_total", "bytes_sent", "Bytes of request bodies sent."),
+            ("received_bytes_total", "bytes_received", "Bytes of response bodies received."),
+            ("retries_total", "retries", "Requests retried."),
+        )
+
+        for name, attribute, description in counters:
+            header(name, "counter", description)
+            for route, metrics in routes:
+                sample(name, getattr(metrics, attribute), route=route)
+
+        header("responses_total", "counter", "Responses received, by HTTP status.")
+        for route, metrics in routes:
+            for status, amount in sorted(metrics.statuses.items()):
+                sample("responses_total", amount, route=route, status=status)
+
+        header("error_codes_total", "counter", "Error codes returned by servers.")
+        for route, metrics in routes:
+            for code, amount in sorted(metrics.codes.items()):
+                sample("error_codes_total", amount, route=route, code=code)
+
+        header("errors_total", "counter", "Requests failed without response.")
+        for route, metrics in routes:
+            for error, amount in sorted(metrics.errors.items()):
+                sample("errors_total", amount, route=route, error=error)
+
+        header("semaphore_wait_seconds", "histogram", "Time spent waiting for the semaphore.")
+        histogram("semaphore_wait_seconds", self.semaphore_wait)
+
+        header("rate_limit_wait_seconds", "histogram", "Time spent waiting for rate limiter.")
+        histogram("rate_limit_wait_seconds", self.rate_limit_wait)
+
+        return "\n".join(lines) + "\n"
+
+
+def escape_label(value: Any) -> str:
+    return str(value).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
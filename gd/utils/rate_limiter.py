@@ -0,0 +1,302 @@
+from collections import deque
+import asyncio
+import time
+
+from gd.typing import Awaitable, Callable, Dict, FrozenSet, Iterable, Optional, Tuple, Union
+from gd.utils.text_tools import make_repr
+
+__all__ = ("TokenBucket", "RateLimiter", "VirtualClock")
+
+Number = Union[float, int]
+Clock = Callable[[], float]
+Sleep = Callable[[float], Awaitable[None]]
+
+
+class VirtualClock:
+    """Clock that only moves when something sleeps on it.
+
+    Can be passed to :class:`.RateLimiter` to test limiting without actually waiting:
+
+    .. code-block:: python3
+
+        clock = gd.VirtualClock()
+        limiter = gd.RateLimiter(rate=10, clock=clock, sleep=clock.sleep)
+    """
+
+    def __init__(self, start: float = 0.0) -> None:
+        self.time = start
+
+    def __repr__(self) -> str:
+        info = {"time": self.time}
+        return make_repr(self, info)
+
+    def __call__(self) -> float:
+        return self.time
+
+    def advance(self, seconds: Number) -> None:
+        self.time += seconds
+
+    async def sleep(self, seconds: Number) -> None:
+        self.advance(max(seconds, 0))
+        await asyncio.sleep(0)  # let others run, like real sleep would
+
+
+class TokenBucket:
+    """Token bucket that allows ``rate`` acquisitions per second, with bursts of up to ``burst``.
+
+    Callers are served in the order they called :meth:`TokenBucket.acquire`.
+
+    Parameters
+    ----------
+    rate: Union[:class:`float`, :class:`int`]
+        Amount of tokens added per second.
+    burst: Optional[:class:`int`]
+        Capacity of the bucket. Defaults to ``max(1, rate)``.
+    clock: Callable[[], :class:`float`]
+        Function returning current time in seconds. :func:`time.monotonic` by default.
+    sleep: Callable[[:class:`float`], Awaitable[``None``]]
+        Function to sleep with. :func:`asyncio.sleep` by default.
+    """
+
+    def __init__(
+        self,
+        rate: Number,
+        burst: Optional[int] = None,
+        *,
+        clock: Clock = time.monotonic,
+        sleep: Sleep = asyncio.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("Rate must be positive.")
+
+        if burst is None:
+            burst = max(1, int(rate))
+
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.sleep = sleep
+        self.tokens = float(burst)
+        self.waiting = 0
+        self._last = clock()
+        self._lock = asyncio.Lock()
+
+    def __repr__(self) -> str:
+        info = {"rate": self.rate, "burst": self.burst, "waiting": self.waiting}
+        return make_repr(self, info)
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def set_rate(self, rate: Number) -> None:
+        self._refill()  # account tokens gained with the old rate
+        self.rate = rate
+
+    async def acquire(self) -> None:
+        """|coro|
+
+        Wait until a token is available, and take it.
+        """
+        self.waiting += 1
+
+        try:
+            async with self._lock:  # asyncio.Lock wakes waiters in FIFO order
+                self._refill()
+
+                if self.tokens < 1:
+                    await self.sleep((1 - self.tokens) / self.rate)
+                    self._refill()
+
+                self.tokens -= 1
+
+        finally:
+            self.waiting -= 1
+
+
+class RateLimiter:
+    """Client-side rate limiter, used by :class:`.HTTPClient`.
+
+    Every request waits for a token from the bucket of its route (if any),
+    and then from the global bucket (if any).
+
+    When ``adaptive`` is true, rates are halved whenever more than ``threshold``
+    of the last ``window`` responses of a route were failures, and slowly
+    recover back to configured values while responses succeed.
+    Failures are transport errors and HTTP error statuses (like 429 or 503),
+    as well as GD error codes in ``error_codes``. No codes are counted by default,
+    since ``-1`` is also an ordinary reply, e.g. when a search finds nothing.
+
+    Example:
+
+    .. code-block:: python3
+
+        limiter = gd.RateLimiter(rate=20, burst=40, routes={gd.Route.LEVEL_SEARCH: (5, 10)})
+        client = gd.Client(rate_limiter=limiter)
+
+    Parameters
+    ----------
+    rate: Optional[Union[:class:`float`, :class:`int`]]
+        Global amount of requests per second. ``None`` means no global limit.
+    burst: Optional[:class:`int`]
+        Global burst size.
+    routes: Optional[Dict[:class:`str`, Tuple[Union[:class:`float`, :class:`int`], Optional[:class:`int`]]]]
+        Mapping of route to its ``(rate, burst)`` pair.
+    adaptive: :class:`bool`
+        Whether to slow down when failures spike.
+    error_codes: Iterable[:class:`int`]
+        GD server error codes that count as failures.
+    route_error_codes: Optional[Dict[:class:`str`, Iterable[:class:`int`]]]
+        Mapping of route to error codes that count as failures for it,
+        used instead of ``error_codes``.
+    window: :class:`int`
+        Amount of last responses to watch for failures.
+    threshold: :class:`float`
+        Fraction of failed responses in the window that triggers slowing down.
+    min_factor: :class:`float`
+        Lowest fraction of the configured rate that limiter can slow down to.
+    clock: Callable[[], :class:`float`]
+        Function returning current time in seconds. :func:`time.monotonic` by default.
+    sleep: Callable[[:class:`float`], Awaitable[``None``]]
+        Function to sleep with. :func:`asyncio.sleep` by default.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[Number] = None,
+        burst: Optional[int] = None,
+        *,
+        routes: Optional[Dict[str, Tuple[Number, Optional[int]]]] = None,
+        adaptive: bool = True,
+        error_codes: Iterable[int] = (),
+        route_error_codes: Optional[Dict[str, Iterable[int]]] = None,
+        window: int = 20,
+        threshold: float = 0.5,
+        min_factor: float = 0.1,
+        clock: Clock = time.monotonic,
+        sleep: Sleep = asyncio.sleep,
+    ) -> None:
+        self.clock = clock
+        self.sleep = sleep
+        self.adaptive = adaptive
+        self.error_codes = frozenset(error_codes)
+        self.route_error_codes: Dict[str, FrozenSet[int]] = {
+            route: frozenset(codes) for route, codes in (route_error_codes or {}).items()
+        }
+        self.window = window
+        self.threshold = threshold
+        self.min_factor = min_factor
+
+        self.global_bucket = None if rate is None else self.create_bucket(rate, burst)
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.rates: Dict[Optional[str], Number] = {None: rate}
+        self.factors: Dict[Optional[str], float] = {}
+        self.outcomes: Dict[Optional[str], deque] = {}
+
+        if routes is not None:
+            for route, (route_rate, route_burst) in routes.items():
+                self.set_route_limit(route, route_rate, route_burst)
+
+    def __repr__(self) -> str:
+        info = {"rate": self.rates[None], "routes": len(self.buckets), "waiting": self.waiting}
+        return make_repr(self, info)
+
+    def create_bucket(self, rate: Number, burst: Optional[int] = None) -> TokenBucket:
+        return TokenBucket(rate, burst, clock=self.clock, sleep=self.sleep)
+
+    def set_route_limit(
+        self, route: str, rate: Optional[Number], burst: Optional[int] = None
+    ) -> None:
+        """Set ``rate`` and ``burst`` of ``route``. If ``rate`` is ``None``, the limit is removed."""
+        if rate is None:
+            self.buckets.pop(route, None)
+            self.rates.pop(route, None)
+
+        else:
+            self.buckets[route] = self.create_bucket(rate, burst)
+            self.rates[route] = rate
+
+        self.factors.pop(route, None)
+        self.outcomes.pop(route, None)
+
+    @property
+    def waiting(self) -> int:
+        """:class:`int`: Total amount of requests waiting for tokens."""
+        total = sum(bucket.waiting for bucket in self.buckets.values())
+
+        if self.global_bucket is not None:
+            total += self.global_bucket.waiting
+
+        return total
+
+    def queue_depth(self, route: Optional[str] = None) -> int:
+        """Amount of requests waiting for tokens of ``route``,
+        or of the global bucket if ``route`` is ``None``.
+        """
+        bucket = self.global_bucket if route is None else self.buckets.get(route)
+
+        if bucket is None:
+            return 0
+
+        return bucket.waiting
+
+    def get_factor(self, route: Optional[str] = None) -> float:
+        """Fraction of the configured rate ``route`` is currently limited to."""
+        return self.factors.get(route, 1.0)
+
+    async def acquire(self, route: str) -> None:
+        """|coro|
+
+        Wait until a request to ``route`` can be sent.
+        """
+        bucket = self.buckets.get(route)
+
+        if bucket is not None:
+            await bucket.acquire()
+
+        if self.global_bucket is not None:
+            await self.global_bucket.acquire()
+
+    def report(self, route: str, success: bool) -> None:
+        """Report whether a request to ``route`` succeeded, adapting rates if needed."""
+        if not self.adaptive:
+            return
+
+        if route in self.buckets:
+            self._report(route, success)
+
+        if self.global_bucket is not None:
+            self._report(None, success)
+
+    def report_code(self, route: str, code: Optional[int]) -> None:
+        """Report response of a request to ``route``; ``code`` is an error code or ``None``."""
+        self.report(route, code not in self.route_error_codes.get(route, self.error_codes))
+
+    def _report(self, key: Optional[str], success: bool) -> None:
+        outcomes = self.outcomes.get(key)
+
+        if outcomes is None:
+            outcomes = self.outcomes[key] = deque(maxlen=self.window)
+
+        outcomes.append(success)
+
+        if len(outcomes) < self.window:
+            return
+
+        failures = outcomes.count(False) / len(outcomes)
+        factor = self.get_factor(key)
+
+        if failures > self.threshold:
+            self._set_factor(key, max(self.min_factor, factor / 2))
+            outcomes.clear()  # give the new rate a fresh window
+
+        elif not failures and factor < 1:
+            self._set_factor(key, min(1.0, factor + 0.1))
+            outcomes.clear()
+
+    def _set_factor(self, key: Optional[str], factor: float) -> None:
+        self.factors[key] = factor
+
+        bucket = self.global_bucket if key is None else self.buckets[key]
+        bucket.set_rate(self.rates[key] * factor)
@@ -0,0 +1,172 @@
+import asyncio
+import time
+
+import aiohttp
+
+from gd.errors import HTTPError
+from gd.logging import get_logger
+from gd.typing import Any, Callable, Iterable, Optional, RetryPolicy, Tuple, Type, Union
+from gd.utils.tasks import ExponentialBackoff
+from gd.utils.text_tools import make_repr
+
+__all__ = ("RetryPolicy", "DEFAULT_RETRY_EXCEPTIONS", "DEFAULT_RETRY_STATUSES")
+
+log = get_logger(__name__)
+
+DEFAULT_RETRY_EXCEPTIONS = (OSError, aiohttp.ClientError, asyncio.TimeoutError)
+DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class RetryPolicy:
+    """Policy that defines how failed requests are retried.
+
+    Delays between attempts are computed by :class:`.tasks.ExponentialBackoff`,
+    meaning each delay is a random value (jitter) between ``0`` and ``base * 2^n``.
+
+    Example:
+
+    .. code-block:: python3
+
+        policy = gd.RetryPolicy(attempts=5, base=0.5, deadline=30)
+
+        client = gd.Client(retry_policy=policy)  # for every route
+        client.http.set_retry_policy(policy, gd.Route.LEVEL_SEARCH)  # or for some routes only
+
+    Parameters
+    ----------
+    attempts: :class:`int`
+        Maximum amount of attempts, including the first one. ``1`` disables retrying.
+    base: Union[:class:`float`, :class:`int`]
+        Base delay of the exponential backoff, in seconds.
+    max_delay: Optional[Union[:class:`float`, :class:`int`]]
+        Upper bound for a single delay, in seconds.
+    deadline: Optional[Union[:class:`float`, :class:`int`]]
+        Total amount of seconds all attempts can take. No retry is done
+        if its delay would exceed the deadline.
+    exceptions: Iterable[Type[:exc:`BaseException`]]
+        Types of errors that should be retried.
+        These are checked against :attr:`.HTTPError.origin` as well.
+    statuses: Iterable[:class:`int`]
+        HTTP status codes that should be retried.
+    codes: Iterable[:class:`int`]
+        Error codes returned by GD servers (e.g. ``-1``) that should be retried.
+        Empty by default, since ``-1`` often means *nothing was found*.
+    """
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        *,
+        base: Union[float, int] = 1,
+        max_delay: Optional[Union[float, int]] = None,
+        deadline: Optional[Union[float, int]] = None,
+        exceptions: Iterable[Type[BaseException]] = DEFAULT_RETRY_EXCEPTIONS,
+        statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        codes: Iterable[int] = (),
+    ) -> None:
+        if attempts < 1:
+            raise ValueError("Amount of attempts must be at least 1.")
+
+        self.attempts = attempts
+        self.base = base
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.exceptions: Tuple[Type[BaseException]] = tuple(exceptions)
+        self.statuses = frozenset(statuses)
+        self.codes = frozenset(codes)
+
+    def __repr__(self) -> str:
+        info = {
+            "attempts": self.attempts,
+            "base": self.base,
+            "max_delay": self.max_delay,
+            "deadline": self.deadline,
+        }
+        return make_repr(self, info)
+
+    @classmethod
+    def never(cls) -> RetryPolicy:
+        """Create a policy that never retries."""
+        return cls(attempts=1)
+
+    def create_backoff(self) -> ExponentialBackoff:
+        return ExponentialBackoff(self.base)
+
+    def should_retry_error(self, error: BaseException) -> bool:
+        """Check whether ``error`` should be retried."""
+        if isinstance(error, HTTPError):
+            error = error.origin
+
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status in self.statuses
+
+        return isinstance(error, self.exceptions)
+
+    def should_retry_result(self, result: Any) -> bool:
+        """Check whether ``result`` is an error code that should be retried."""
+        return isinstance(result, int) and result in self.codes
+
+    async def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """|coro|
+
+        Await ``func(*args, **kwargs)``, retrying it according to the policy.
+
+        Raises
+        ------
+        :exc:`Exception`
+            Last error raised by ``func``, if no more attempts could be made.
+
+        Returns
+        -------
+        `Any`
+            Result of the last attempt.
+        """
+        backoff = self.create_backoff()
+        start = time.monotonic()
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            try:
+                result = await func(*args, **kwargs)
+
+            except Exception as error:
+                if not self.should_retry_error(error):
+                    raise
+
+                delay = self._next_delay(backoff, attempt, start)
+
+                if delay is None:
+                    raise
+
+                log.debug(f"Attempt #{attempt} failed with {error!r}, retrying in {delay:.2f}s.")
+
+            else:
+                if not self.should_retry_result(result):
+                    return result
+
+                delay = self._next_delay(backoff, attempt, start)
+
+                if delay is None:
+                    return result
+
+                log.debug(f"Attempt #{attempt} returned {result!r}, retrying in {delay:.2f}s.")
+
+            await asyncio.sleep(delay)
+
+    def _next_delay(
+        self, backoff: ExponentialBackoff, attempt: int, start: float
+    ) -> Optional[float]:
+        if attempt >= self.attempts:
+            return None
+
+        delay = backoff.delay()
+
+        if self.max_delay is not None:
+            delay = min(delay, self.max_delay)
+
+        if self.deadline is not None and time.monotonic() - start + delay > self.deadline:
+            return None
+
+        return delay
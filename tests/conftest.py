@@ -8,3 +8,7 @@ client = gd.Client()
 
 if name is not None and password is not None:
     client.run(client.login(name, password))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    client.close()  # release pooled connections of the shared client
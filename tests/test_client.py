@@ -43,6 +43,13 @@ async def test_many_levels():
     await client.get_many_levels(30029017, 44622744)
 
 
+async def test_iter_many_levels():
+    results = dict([pair async for pair in client.iter_many_levels([30029017, 30029017, 0])])
+
+    assert results[30029017].id == 30029017
+    assert results[0] is None
+
+
 async def test_get_timely():
     try:
         await client.get_daily()
@@ -69,6 +76,11 @@ async def test_search_levels():
     await client.search_levels(query="VorteX")
 
 
+async def test_iter_levels():
+    async for level in client.iter_levels(query="VorteX"):
+        assert isinstance(level, gd.Level)
+
+
 async def test_hash():
     print(client)
 
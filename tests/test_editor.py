@@ -17,3 +17,215 @@ def test_open_editor():
 def test_get_length():
     editor = make_editor()
     assert editor.get_length()
+
+
+def test_columnar_editor():
+    editor = make_editor()
+    editor.objects[0].groups = {1, 2}
+    editor.objects[1].data["155"] = "1"
+    editor.objects[2].rotation = 45.5
+
+    columnar = gd.api.ColumnarEditor.from_editor(editor)
+
+    assert columnar.dump() == editor.dump()
+    assert columnar.to_editor().dump() == editor.dump()
+    assert columnar.get_groups() == editor.get_groups()
+    assert columnar.get_x_length() == editor.get_x_length()
+
+    obj = columnar[0]
+    obj.add_groups(3)
+    obj.move(x=15)
+
+    assert columnar.get_groups() == {1, 2, 3}
+    assert gd.api.ColumnarEditor.from_string(columnar.dump())[0].x == 15
+
+
+def test_lazy_editor():
+    data = make_editor().dump()
+
+    editor = gd.api.Editor.from_string(data, lazy=True)
+
+    assert len(editor) == 100
+    assert editor.dump() == gd.api.Editor.from_string(data).dump()
+
+    obj = editor.objects[1]
+    obj.move(x=15)
+
+    assert obj.is_parsed()
+    assert not editor.objects[2].is_parsed()
+    assert gd.api.Editor.from_string(editor.dump()).objects[1].x == 45
+
+
+def test_stream_level():
+    editor = make_editor()
+
+    data = b"".join(gd.api.iter_zip_level(editor.objects, editor.header, chunk_size=256))
+
+    assert gd.Coder.unzip(data) == editor.dump()
+
+    objects = list(gd.api.iter_level(data, chunk_size=64))
+
+    assert [obj.data for obj in objects] == [obj.data for obj in editor.objects]
+    assert next(gd.api.iter_level(data, raw=True)) == (("1", "1"), ("2", "0"), ("3", "0"))
+
+
+def test_object_codec():
+    string = "1,901,2,15.5,3,30,57,1.2,11,1,30,14,31,aGVsbG8=,155,1"
+
+    obj = gd.api.Object.from_string(string)
+
+    assert obj.x == 15.5 and obj.y == 30 and obj.groups == {1, 2}
+    assert obj.touch_triggered is True and obj.easing is gd.api.Easing.SineIn
+    assert obj.text == "hello" and obj.data["155"] == "1"
+    assert obj.dump() == string
+
+
+def test_spatial_index():
+    editor = make_editor()  # objects at (30n, 30n)
+    index = editor.enable_spatial_index(cell_size=100)
+
+    assert len(editor.objects_in_rect(0, 0, 90, 90)) == 4
+    assert len(editor.objects_in_x_range(300, 600)) == 11
+    assert editor.get_nearest_object(601, 605).x == 600
+
+    obj = editor.objects[0]
+    obj.move(x=2000)
+
+    assert obj in editor.objects_in_x_range(2000, 2000)
+    assert obj not in editor.objects_in_rect(0, 0, 90, 90)
+
+    editor.remove_objects(obj)
+
+    assert obj not in index and not editor.objects_in_x_range(2000, 2000)
+
+
+def test_id_index():
+    editor = make_editor()
+    editor.objects[0].groups = {1, 2}
+    editor.objects[1].target_group = 3
+
+    index = editor.enable_id_index()
+
+    assert editor.get_groups() == {1, 2, 3}
+    assert editor.get_free_group() == 4
+
+    editor.objects[2].add_groups(4)
+    editor.objects[3].color_1 = 1
+
+    assert editor.get_free_group() == 5
+    assert editor.get_objects_with_group(4) == [editor.objects[2]]
+    assert editor.get_objects_with_color_id(1) == [editor.objects[3]]
+    assert editor.get_triggers_targeting(3) == [editor.objects[1]]
+
+    editor.remove_objects(editor.objects[0])
+
+    assert editor.get_free_group() == 1
+    assert len(index) == 99
+
+
+def test_selection():
+    editor = make_editor()  # objects at (30n, 30n)
+    editor.enable_spatial_index()
+
+    selection = editor.select_in_rect(0, 0, 90, 90)
+
+    assert len(selection) == 4 and selection.get_center() == (45, 45)
+
+    selection.translate(x=1000).rotate(90, pivot=(1000, 0)).regroup(add=[1])
+
+    assert sorted((obj.x, obj.y, obj.rotation) for obj in selection) == [
+        (1000, 0, 90),
+        (1030, -30, 90),
+        (1060, -60, 90),
+        (1090, -90, 90),
+    ]
+    assert len(editor.objects_in_rect(1000, -90, 1090, 0)) == 4
+    assert editor.get_groups() == {1}
+
+    selection.mirror("x").recolor(color_1=5).regroup({1: 2})
+
+    assert all(obj.h_flipped and obj.rotation == -90 for obj in selection)
+    assert editor.get_groups() == {2} and editor.get_color_ids() >= {5}
+
+    columnar = gd.api.ColumnarEditor.from_editor(editor)
+    columnar.select().scale(2, pivot=(0, 0))
+
+    assert columnar.get_object(0).x == 2180 and columnar.get_object(0).scale == 2
+    assert columnar.get_groups() == {2}
+
+
+def test_selection_keeps_missing():
+    editor = gd.api.Editor.from_string("kA4,0;1,1;1,1,2,30;")
+
+    editor.select().translate(x=15).rotate(0, pivot=(0, 0)).scale(1, pivot=(0, 0))
+
+    assert editor.dump().split(";")[1:3] == ["1,1,2,15", "1,1,2,45"]
+
+
+def test_speed_table():
+    editor = gd.api.Editor(
+        gd.api.Object(id=901, x=3000),
+        gd.api.Object(id=gd.api.PortalType.FastSpeed.value, x=1000, portal_checked=True),
+    )
+    table = editor.get_speed_table()
+
+    assert len(table) == 2
+    assert table.get_time(1000) == editor.get_length(1000)
+    assert editor.get_lengths([1000, 3000]) == [table.get_time(1000), editor.get_length()]
+    assert table.get_time(3000) > table.get_time(1000) * 2  # faster after the portal
+
+    times = table.get_times([0, 500, 1000, 2000])
+
+    assert [round(x, 6) for x in table.get_xs(times)] == [0, 500, 1000, 2000]
+
+    assert editor.get_speed_table() is table  # cached
+
+    portal = editor.objects[1]
+    portal.x = 2000
+
+    assert editor.get_speed_table() is not table
+    assert editor.get_speed_table().portal_xs == [2000]
+
+    editor.add_objects(
+        gd.api.Object(id=gd.api.PortalType.SlowSpeed.value, x=500, portal_checked=True)
+    )
+
+    assert len(editor.get_speed_table()) == 3
+
+
+def test_cached_dump():
+    editor = make_editor()
+    obj = editor.objects[0]
+
+    string = obj.dump(cached=True)
+
+    assert obj.dump(cached=True) is string  # cached
+
+    obj.move(x=15)
+    obj.add_groups(1)
+
+    assert obj.dump(cached=True) == "1,1,2,15,3,0,57,1"
+
+    obj.data["6"] = 90  # changed directly, so the cache is discarded by hand
+    obj.invalidate()
+
+    assert obj.dump(cached=True) == "1,1,2,15,3,0,57,1,6,90"
+    assert editor.dump(cached=True).split(";")[1] == obj.dump()
+
+    editor.select([obj]).translate(x=15)
+
+    assert editor.dump(cached=True).split(";")[1] == "1,1,2,30,3,0,57,1,6,90"
+
+
+def test_dump_in_place():
+    editor = make_editor()
+    obj = editor.objects[0]
+    obj.groups = {1}
+
+    obj.dump(cached=True)
+
+    obj.groups.add(5)
+    obj.data["6"] = 90
+
+    assert obj.dump() == "1,1,2,0,3,0,57,1.5,6,90"
+    assert editor.dump().split(";")[1] == obj.dump()
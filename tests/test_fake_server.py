@@ -0,0 +1,58 @@
+import pytest
+
+from conftest import gd
+
+from gd.utils.fake_server import FakeDatabase, FakeServer
+
+pytestmark = pytest.mark.asyncio
+
+database = FakeDatabase.generate(seed=0)
+
+
+async def test_levels():
+    async with FakeServer(database) as server:
+        client = gd.Client()
+        client.http.change_url(server.url)
+
+        level = await client.get_level(1)
+
+        assert level.name == "Level1"
+        assert level.creator.account_id in database.users
+        assert len(level.open_editor().get_objects()) == database.levels[1]["object_count"]
+
+        levels = [level async for level in client.iter_levels("Level")]
+
+        assert len(levels) == len(database.levels)
+
+        await client.get_daily()
+        await client.http.close()
+
+
+async def test_users_and_comments():
+    async with FakeServer(database) as server:
+        client = gd.Client()
+        client.http.change_url(server.url)
+
+        user = await client.get_user(71)
+
+        assert user.name == "User0"
+
+        comments = await client.get_level_comments(await client.get_level(1, get_data=False))
+
+        assert len(comments) == min(20, len(database.comments.get(1, [])))
+
+        await client.login("User1", "password")
+        messages = await client.get_messages()
+
+        assert len(messages) == len(database.messages.get(72, []))
+
+        await client.http.close()
+
+
+async def test_error_injection():
+    async with FakeServer(database, error_rate=1.0) as server:
+        async with gd.HTTPClient(url=server.url) as http:
+            with pytest.raises(gd.HTTPError):
+                await http.request(gd.Route.GET_TIMELY, {"weekly": "0"})
+
+        assert server.requests[gd.Route.GET_TIMELY] == 1
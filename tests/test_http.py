@@ -0,0 +1,384 @@
+import asyncio
+import threading
+import pytest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from conftest import gd
+
+pytestmark = pytest.mark.asyncio
+
+
+class Flaky:
+    def __init__(self, failures: int, result: int = 1) -> None:
+        self.failures = failures
+        self.result = result
+        self.calls = 0
+
+    async def __call__(self) -> int:
+        self.calls += 1
+
+        if self.calls <= self.failures:
+            raise gd.HTTPError(OSError("connection reset"))
+
+        return self.result
+
+
+async def test_retry_policy_retries_errors():
+    flaky = Flaky(failures=2)
+    policy = gd.RetryPolicy(attempts=3, base=0.001)
+
+    assert await policy.call(flaky) == 1
+    assert flaky.calls == 3
+
+
+async def test_retry_policy_gives_up():
+    flaky = Flaky(failures=5)
+    policy = gd.RetryPolicy(attempts=2, base=0.001)
+
+    with pytest.raises(gd.HTTPError):
+        await policy.call(flaky)
+
+    assert flaky.calls == 2
+
+
+async def test_retry_policy_codes():
+    flaky = Flaky(failures=0, result=-1)
+
+    assert await gd.RetryPolicy(attempts=3, base=0.001).call(flaky) == -1
+    assert flaky.calls == 1
+
+    assert await gd.RetryPolicy(attempts=3, base=0.001, codes=[-1]).call(flaky) == -1
+    assert flaky.calls == 4
+
+
+async def test_route_retry_policy():
+    http = gd.HTTPClient()
+    policy = gd.RetryPolicy(attempts=5)
+
+    http.set_retry_policy(policy, gd.Route.LEVEL_SEARCH)
+
+    assert http.get_retry_policy(gd.Route.LEVEL_SEARCH) is policy
+    assert http.get_retry_policy(gd.Route.GET_USER_INFO).attempts == 1
+
+
+def make_keys(amount: int):
+    return [
+        gd.utils.cache.make_request_key("POST", "url", {"page": n}, None) for n in range(amount)
+    ]
+
+
+@pytest.mark.parametrize(
+    "backend",
+    [
+        lambda: gd.MemoryCacheBackend(max_entries=3, max_bytes=100),
+        lambda: gd.SQLiteCacheBackend(":memory:", max_entries=3, max_bytes=100),
+    ],
+)
+async def test_response_cache(backend):
+    cache = gd.ResponseCache(backend())
+    keys = make_keys(5)
+
+    for key in keys[:4]:
+        cache.set(gd.Route.LEVEL_SEARCH, key, b"0" * 10)
+
+    assert cache.get(gd.Route.LEVEL_SEARCH, keys[0]) is None  # evicted
+    assert cache.get(gd.Route.LEVEL_SEARCH, keys[3]) == b"0" * 10
+
+    cache.set(gd.Route.GET_USER_INFO, keys[4], b"1" * 80)
+    assert cache.backend.size <= 100
+
+    cache.invalidate(gd.Route.UPDATE_USER_SCORE)
+    assert cache.get(gd.Route.GET_USER_INFO, keys[4]) is None
+
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+
+async def test_cache_in_executor():
+    http = gd.HTTPClient(cache=gd.ResponseCache(gd.SQLiteCacheBackend(":memory:")))
+    http.send = send = FakeSend()
+    thread = threading.get_ident()
+
+    backend_get = http.cache.backend.get
+    threads = []
+
+    def get(key):
+        threads.append(threading.get_ident())
+        return backend_get(key)
+
+    http.cache.backend.get = get
+
+    for _ in range(2):
+        await http.request(gd.Route.LEVEL_SEARCH, {"str": "VorteX"})
+
+    assert send.calls == 1
+    assert threads and thread not in threads
+
+    for level_id in (-1, -1, 1, 1):  # daily level changes over time, so it is never cached
+        await http.request(gd.Route.DOWNLOAD_LEVEL, {"levelID": level_id})
+
+    assert send.calls == 4
+
+
+async def test_request_key_is_canonical():
+    key = gd.utils.cache.make_request_key
+
+    assert key("post", "url", {"a": 1, "b": 2}, None) == key("POST", "url", {"b": 2, "a": 1}, {})
+    assert key("POST", "url", {"a": 1}, None) != key("POST", "url", {"a": 2}, None)
+
+
+class FakeSend:
+    def __init__(self, content: bytes = b"1:30029017:2:VorteX") -> None:
+        self.content = content
+        self.calls = 0
+
+    async def __call__(self, method, url, data, params, headers, route=None):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return self.content, None
+
+
+async def test_single_flight():
+    http = gd.HTTPClient()
+    http.send = send = FakeSend()
+
+    payload = {"str": "VorteX"}
+
+    results = await asyncio.gather(
+        *(http.request(gd.Route.LEVEL_SEARCH, dict(payload)) for _ in range(10))
+    )
+
+    assert send.calls == 1
+    assert http.coalesced == 9
+    assert all(result == "1:30029017:2:VorteX" for result in results)
+
+    await asyncio.gather(*(http.request(gd.Route.LIKE_ITEM, dict(payload)) for _ in range(3)))
+
+    assert send.calls == 4  # writes are never shared
+
+
+async def test_token_bucket():
+    clock = gd.VirtualClock()
+    bucket = gd.TokenBucket(rate=10, burst=5, clock=clock, sleep=clock.sleep)
+
+    for _ in range(5):  # burst is available right away
+        await bucket.acquire()
+
+    assert clock() == 0
+
+    await asyncio.gather(*(bucket.acquire() for _ in range(10)))
+
+    assert clock() == pytest.approx(1.0)
+    assert bucket.waiting == 0
+
+
+async def test_rate_limiter_is_fair():
+    clock = gd.VirtualClock()
+    limiter = gd.RateLimiter(rate=1, clock=clock, sleep=clock.sleep)
+    order = []
+
+    async def request(n: int) -> None:
+        await limiter.acquire(gd.Route.LEVEL_SEARCH)
+        order.append(n)
+
+    tasks = [asyncio.ensure_future(request(n)) for n in range(5)]
+    await asyncio.sleep(0)
+
+    assert limiter.queue_depth() == 4  # first one took the only token right away
+
+    await asyncio.gather(*tasks)
+
+    assert order == list(range(5))
+    assert limiter.queue_depth() == 0
+
+
+async def test_rate_limiter_adapts():
+    clock = gd.VirtualClock()
+    limiter = gd.RateLimiter(
+        routes={gd.Route.LEVEL_SEARCH: (10, 10)}, window=4, clock=clock, sleep=clock.sleep
+    )
+
+    for _ in range(4):
+        limiter.report_code(gd.Route.LEVEL_SEARCH, -1)  # nothing found, not a failure
+
+    assert limiter.get_factor(gd.Route.LEVEL_SEARCH) == 1.0
+
+    for _ in range(4):
+        limiter.report(gd.Route.LEVEL_SEARCH, False)
+
+    assert limiter.get_factor(gd.Route.LEVEL_SEARCH) == 0.5
+    assert limiter.buckets[gd.Route.LEVEL_SEARCH].rate == 5
+
+    for _ in range(4 * 5):
+        limiter.report_code(gd.Route.LEVEL_SEARCH, None)
+
+    assert limiter.get_factor(gd.Route.LEVEL_SEARCH) == pytest.approx(1.0)
+
+
+async def test_http_rate_limiter():
+    async def handler(request: web.Request) -> web.Response:
+        return web.Response(text="-1")
+
+    app = web.Application()
+    app.router.add_post("/{php}", handler)
+
+    clock = gd.VirtualClock()
+    limiter = gd.RateLimiter(
+        rate=5,
+        burst=1,
+        route_error_codes={gd.Route.LEVEL_SEARCH: [-1]},
+        window=4,
+        clock=clock,
+        sleep=clock.sleep,
+    )
+
+    async with TestServer(app) as server:
+        async with gd.HTTPClient(url=server.make_url("/"), rate_limiter=limiter) as http:
+            for n in range(6):
+                assert await http.request(gd.Route.LEVEL_SEARCH, {"page": n}) == -1
+
+    assert limiter.get_factor() == 0.5  # too many -1 responses, counted as errors here
+    assert clock() == pytest.approx(3 * 0.2 + 2 * 0.4)  # slowed down after 4 responses
+
+
+async def test_http_metrics():
+    attempts = 0
+
+    async def handler(request: web.Request) -> web.Response:
+        nonlocal attempts
+        attempts += 1
+
+        if attempts == 1:
+            return web.Response(status=503)
+
+        return web.Response(text="-1")
+
+    app = web.Application()
+    app.router.add_post("/{php}", handler)
+
+    metrics = gd.HTTPMetrics()
+    policy = gd.RetryPolicy(attempts=2, base=0.001)
+
+    async with TestServer(app) as server:
+        async with gd.HTTPClient(
+            url=server.make_url("/"), metrics=metrics, retry_policy=policy
+        ) as http:
+            assert await http.request(gd.Route.LEVEL_SEARCH, {"str": "VorteX"}) == -1
+
+    snapshot = metrics.snapshot()
+    route = snapshot["routes"][gd.Route.LEVEL_SEARCH]
+
+    assert route["requests"] == 2
+    assert route["retries"] == 1
+    assert route["statuses"] == {503: 1, 200: 1}
+    assert route["codes"] == {-1: 1}
+    assert route["latency"]["count"] == 2
+    assert route["bytes_sent"] > 0 and route["bytes_received"] == 2
+    assert snapshot["semaphore_wait"]["count"] == 2
+
+    text = metrics.to_prometheus()
+
+    assert f'gd_http_retries_total{{route="{gd.Route.LEVEL_SEARCH}"}} 1' in text
+    assert "# TYPE gd_http_request_duration_seconds histogram" in text
+
+
+async def test_http_metrics_success_codes():
+    async def handler(request: web.Request) -> web.Response:
+        return web.Response(text="12345")  # ID of an uploaded comment, for instance
+
+    app = web.Application()
+    app.router.add_post("/{php}", handler)
+
+    metrics = gd.HTTPMetrics()
+
+    async with TestServer(app) as server:
+        async with gd.HTTPClient(url=server.make_url("/"), metrics=metrics) as http:
+            assert await http.request(gd.Route.UPLOAD_COMMENT, {}) == 12345
+
+    route = metrics.snapshot()["routes"][gd.Route.UPLOAD_COMMENT]
+
+    assert route["requests"] == 1 and route["codes"] == {}
+    assert 'code="12345"' not in metrics.to_prometheus()
+
+
+async def test_session_per_loop():
+    http = gd.HTTPClient()
+    other_loop = asyncio.new_event_loop()
+
+    async def get_session():
+        return http.get_session()
+
+    try:
+        other = await asyncio.get_event_loop().run_in_executor(
+            None, other_loop.run_until_complete, get_session()
+        )
+        session = http.get_session()
+
+        assert session is not other and not other.closed
+
+        await http.close()
+
+        assert session.closed and other.closed
+
+    finally:
+        other_loop.close()
+
+
+async def test_client_close():
+    client = gd.Client()
+    session = client.http.get_session()
+
+    await client.aclose()
+
+    assert session.closed and client.http.session is None
+
+
+async def test_record_and_replay(tmp_path):
+    requests = 0
+
+    async def handler(request: web.Request) -> web.Response:
+        nonlocal requests
+        requests += 1
+
+        data = await request.post()
+
+        return web.Response(text=f"{data['str']}:{requests}")
+
+    app = web.Application()
+    app.router.add_post("/{php}", handler)
+
+    path = tmp_path / "requests.gdc"
+    cassette = gd.Cassette(path)
+
+    async with TestServer(app) as server:
+        async with gd.HTTPClient(
+            url=server.make_url("/"), transport=gd.RecordTransport(cassette)
+        ) as http:
+            assert await http.request(gd.Route.LEVEL_SEARCH, {"str": "a", "rs": "x"}) == "a:1"
+            assert await http.request(gd.Route.LEVEL_SEARCH, {"str": "a", "rs": "y"}) == "a:2"
+            assert await http.request(gd.Route.LEVEL_SEARCH, {"str": "b"}) == "b:3"
+
+    cassette.close()
+
+    with path.open("ab") as file:
+        file.write(b"\x01\x00")  # incomplete record, as if recording was interrupted
+
+    cassette = gd.Cassette(path)
+
+    assert len(cassette) == 3
+
+    transport = gd.ReplayTransport(cassette)
+
+    async with gd.HTTPClient(url="http://localhost:1/", transport=transport) as http:
+        assert await http.request(gd.Route.LEVEL_SEARCH, {"str": "b"}) == "b:3"
+        # volatile parameters are ignored, recordings are served in order
+        assert await http.request(gd.Route.LEVEL_SEARCH, {"str": "a", "rs": "z"}) == "a:1"
+        assert await http.request(gd.Route.LEVEL_SEARCH, {"str": "a"}) == "a:2"
+        assert await http.request(gd.Route.LEVEL_SEARCH, {"str": "a"}) == "a:2"
+
+        with pytest.raises(gd.HTTPError):
+            await http.request(gd.Route.LEVEL_SEARCH, {"str": "c"})
+
+    assert requests == 3
@@ -0,0 +1,195 @@
+from itertools import cycle
+import asyncio
+import base64
+import gzip
+import io
+import zlib
+
+import pytest
+
+from conftest import gd
+
+from gd.utils.crypto.coders import deflate, inflate, inflated_formats
+from gd.utils.crypto.xor_cipher import xor_bytes
+
+pytestmark = pytest.mark.asyncio
+
+
+class Pages:
+    def __init__(self, amount: int, size: int = 3) -> None:
+        self.amount = amount
+        self.size = size
+        self.requested = []
+
+    async def __call__(self, page: int):
+        self.requested.append(page)
+        await asyncio.sleep(0.001)
+
+        if page >= self.amount:
+            return []
+
+        return [page * self.size + n for n in range(self.size)]
+
+
+async def test_paginate_stops_at_empty_page():
+    pages = Pages(amount=4)
+
+    items = [item async for item in gd.utils.paginate(pages, prefetch=3)]
+
+    assert items == list(range(12))
+    assert max(pages.requested) <= 4 + 2  # never more than prefetch pages ahead
+
+
+async def test_paginate_given_pages():
+    pages = Pages(amount=10)
+
+    items = [item async for item in gd.utils.paginate(pages, [2, 5])]
+
+    assert items == [6, 7, 8, 15, 16, 17]
+    assert pages.requested == [2, 5]
+
+
+async def test_paginate_first_result():
+    pages = Pages(amount=100)
+    iterator = gd.utils.paginate(pages, prefetch=2)
+
+    assert await iterator.__anext__() == 0
+    assert len(pages.requested) <= 3
+
+    await iterator.aclose()
+
+
+async def test_map_bounded():
+    running = 0
+    most_running = 0
+
+    async def double(n: int) -> int:
+        nonlocal running, most_running
+
+        running += 1
+        most_running = max(most_running, running)
+
+        await asyncio.sleep(0.001 * (n % 3))
+
+        running -= 1
+        return n * 2
+
+    async def numbers():
+        for n in range(20):
+            yield n
+
+    results = [result async for result in gd.utils.map_bounded(double, numbers(), 4)]
+
+    assert sorted(results) == list(range(0, 40, 2))
+    assert most_running == 4
+
+
+async def test_xor():
+    data = bytes(range(256)) * 3
+
+    assert xor_bytes(data, 11) == bytes(byte ^ 11 for byte in data)
+    assert xor_bytes(memoryview(data), b"\x0b") == xor_bytes(data, 11)
+    assert xor_bytes(data, b"26364") == bytes(x ^ y for x, y in zip(data, cycle(b"26364")))
+
+    string = data.decode("latin-1") + "Ж"  # does not fit into one byte
+
+    for text in (string, string[:-1]):
+        expected = "".join(chr(ord(x) ^ ord(y)) for x, y in zip(text, cycle("59361")))
+        assert gd.xor.cipher(59361, text) == expected
+
+
+async def test_save_stream():
+    save = "<d><k>kCEK</k><i>4</i></d>" * 10000
+    encoded = gd.Coder.encode_save(save)
+
+    chunks = list(gd.Coder.encode_save_stream(save, chunk_size=1000))
+
+    assert len(chunks) > 1
+    assert b"".join(chunks) == encoded.encode()
+
+    for source in (encoded, io.BytesIO(encoded.encode())):
+        chunks = list(gd.Coder.decode_save_stream(source, chunk_size=1000))
+
+        assert max(map(len, chunks)) <= 1000
+        assert b"".join(chunks).decode() == save == gd.Coder.decode_save(encoded)
+
+    # standard base64 alphabet is accepted as well
+    standard = base64.b64encode(deflate(save.encode())).decode()
+
+    assert b"".join(gd.Coder.decode_save_stream(standard, needs_xor=False)).decode() == save
+
+    truncated = encoded[: len(encoded) // 2]
+
+    assert save.startswith(b"".join(gd.Coder.decode_save_stream(truncated)).decode())
+
+    with pytest.raises(RuntimeError):
+        list(gd.Coder.decode_save_stream(truncated, strict=True))
+
+
+async def test_inflate_detects_format():
+    data = b"1,1,2,15,3,15;" * 100
+
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    raw = compressor.compress(data) + compressor.flush()
+
+    for compressed, format in (
+        (gzip.compress(data), "gzip"),
+        (zlib.compress(data), "zlib"),
+        (raw, "deflate"),
+    ):
+        inflated_formats.clear()
+
+        assert inflate(compressed) == data
+        assert inflated_formats == {format: 1}
+
+    assert inflate(gzip.compress(data) * 2) == data * 2
+
+    truncated = gzip.compress(data)[:-10]
+
+    assert data.startswith(inflate(truncated))
+
+    with pytest.raises(RuntimeError):
+        inflate(truncated, strict=True)
+
+
+async def test_parallel_deflate():
+    data = b"".join(b"1,%d,2,%d,3,%d;" % (i % 1000, i * 30, i % 77) for i in range(50000))
+
+    single = deflate(data)
+    parallel = deflate(data, workers=4, block_size=1 << 16)
+
+    assert gzip.decompress(parallel) == gzip.decompress(single) == data
+    assert len(deflate(data, level=9)) <= len(deflate(data, level=1))
+
+    string = data.decode()
+
+    assert gd.Coder.unzip(gd.Coder.zip(string, level=9, workers=2)) == string
+
+
+async def test_gen_chks():
+    values = [[level_id, 5, "rs", 71, "udid", "uuid"] for level_id in range(100)]
+
+    assert gd.Coder.gen_chks("like_rate", values) == [
+        gd.Coder.gen_chk("like_rate", item) for item in values
+    ]
+    assert values[0] == [0, 5, "rs", 71, "udid", "uuid"]  # not mutated
+
+    data = "1,1,2,15,3,15;" * 1000
+
+    for seed_data in (data, data.encode(), memoryview(data.encode())):
+        assert gd.Coder.gen_level_upload_seed(seed_data) == data[:: len(data) // 50][:50]
+
+
+async def test_mac_save_stream():
+    pytest.importorskip("Crypto")
+
+    save = "<d><k>kCEK</k><i>4</i></d>" * 1000 + "end"
+    encrypted = gd.Coder.encode_mac_save(save)
+
+    assert b"".join(gd.Coder.encode_mac_save_stream(save, chunk_size=100)) == encrypted
+
+    chunks = gd.Coder.decode_mac_save_stream(io.BytesIO(encrypted), chunk_size=100)
+
+    assert b"".join(chunks).decode() == save == gd.Coder.decode_mac_save(encrypted)
+
+    assert gd.Coder.cipher.decrypt(gd.Coder.cipher.encrypt(b"\0" * 16)) == b"\0" * 16